@@ -0,0 +1,303 @@
+"""
+Benchmark suite of the anonymization module.
+
+Times and memory-profiles the clustering algorithms (MDAV and microaggregation), the anonymization schemes
+(k-anonymity, k-anonymity with t-closeness and differential privacy), the information loss metrics and the
+record linkage disclosure risk over a grid of number of records (n), k and attribute mixes.
+The data sets are synthetic and reproducible (given the seed), with generators for every attribute type.
+Each measure is written as a JSON line, so the results of different commits can be compared.
+
+Usage (from the root of the repository):
+    python benchmarks/benchmark_anonymization.py --n 500 2000 --k 3 10 --output results.jsonl
+    python benchmarks/benchmark_anonymization.py --benchmarks mdav k_anonymity --mixes numerical
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from privlib.anonymization.src.algorithms.anonymization_scheme import (
+    Anonymization_scheme,
+)
+from privlib.anonymization.src.algorithms.differential_privacy import (
+    Differential_privacy,
+)
+from privlib.anonymization.src.algorithms.k_anonymity import K_anonymity
+from privlib.anonymization.src.algorithms.mdav import Mdav
+from privlib.anonymization.src.algorithms.microaggregation import Microaggregation
+from privlib.anonymization.src.algorithms.t_closeness import T_closeness
+from privlib.anonymization.src.attribute_types.attribute_type import Attribute_type
+from privlib.anonymization.src.entities.dataset_DataFrame import Dataset_DataFrame
+
+WORDS = [
+    "teacher",
+    "doctor",
+    "nurse",
+    "engineer",
+    "lawyer",
+    "farmer",
+    "clerk",
+    "pilot",
+    "chef",
+    "artist",
+    "soldier",
+    "driver",
+]
+CATEGORIES = ["clerk", "executive", "tech", "sales", "service", "repair", "farming"]
+
+# [name, attribute type, min value, max value] of the quasi-identifiers of each attribute mix
+MIXES = {
+    "numerical": [
+        ["age", "numerical_continuous", 0, 100],
+        ["hours-per-week", "numerical_discrete", 1, 99],
+    ],
+    "categorical": [
+        ["age", "numerical_continuous", 0, 100],
+        ["occupation", "plain_categorical", None, None],
+    ],
+    "mixed": [
+        ["age", "numerical_continuous", 0, 100],
+        ["hours-per-week", "numerical_discrete", 1, 99],
+        ["occupation", "plain_categorical", None, None],
+        ["date", "date", None, None],
+        ["location", "coordinate", None, None],
+        ["datetime", "datetime", None, None],
+    ],
+    "semantic": [
+        ["age", "numerical_continuous", 0, 100],
+        ["job", "semantic_categorical_wordnet", None, None],
+    ],
+}
+# the confidential attribute, in all the mixes (needed by t-closeness)
+CONFIDENTIAL = ["income", "numerical_discrete", 0, 100000]
+
+GENERATORS = {
+    Attribute_type.NUMERICAL_CONTINUOUS.value[0]: lambda rng: round(
+        rng.uniform(17, 90), 1
+    ),
+    Attribute_type.NUMERICAL_DISCRETE.value[0]: lambda rng: rng.randint(1, 99),
+    Attribute_type.PLAIN_CATEGORICAL.value[0]: lambda rng: rng.choice(CATEGORIES),
+    Attribute_type.SEMANTIC_CATEGORICAL_WORDNET.value[0]: lambda rng: rng.choice(WORDS),
+    Attribute_type.DATE.value[0]: lambda rng: "%d/%d/%d"
+    % (rng.randint(1, 28), rng.randint(1, 12), rng.randint(2010, 2016)),
+    Attribute_type.COORDINATE.value[0]: lambda rng: "%.5f:%.5f"
+    % (rng.uniform(43, 44), rng.uniform(10, 11)),
+    Attribute_type.DATETIME.value[0]: lambda rng: "2011-%02d-%02d %02d:%02d:00"
+    % (rng.randint(1, 12), rng.randint(1, 28), rng.randint(0, 23), rng.randint(0, 59)),
+}
+
+
+def generate_dataframe(n, mix, seed):
+    """Generates a reproducible synthetic data frame with n records of the given attribute mix"""
+    rng = random.Random(seed)
+    attributes = MIXES[mix] + [CONFIDENTIAL]
+    data = {}
+    for name, attribute_type, min_value, max_value in attributes:
+        if name == CONFIDENTIAL[0]:
+            data[name] = [rng.randint(0, 100000) for _ in range(n)]
+        else:
+            generator = GENERATORS[attribute_type]
+            data[name] = [generator(rng) for _ in range(n)]
+    df = pd.DataFrame(data)
+    df.name = f"synthetic_{mix}_{n}"
+
+    return df
+
+
+def generate_settings(mix, path):
+    """Writes the xml describing the attributes of the given attribute mix"""
+    lines = ['<?xml version="1.0" encoding="utf-8"?>', "<schema>"]
+    for name, attribute_type, min_value, max_value in MIXES[mix] + [CONFIDENTIAL]:
+        sensitivity_type = (
+            "confidential" if name == CONFIDENTIAL[0] else "quasi_identifier"
+        )
+        line = (
+            f'    <attribute name="{name}" sensitivity_type="{sensitivity_type}" '
+            f'attribute_type="{attribute_type}"'
+        )
+        if min_value is not None:
+            line += f' min_value="{min_value}"'
+        if max_value is not None:
+            line += f' max_value="{max_value}"'
+        lines.append(line + "/>")
+    lines.append("</schema>")
+    with open(path, "w") as file:
+        file.write("\n".join(lines))
+
+
+def anonymize(scheme):
+    scheme.calculate_anonymization(Mdav())
+    return scheme.anonymized_dataset
+
+
+# Each benchmark is a pair of functions: setup(dataset, k) -> state (not measured), run(state) (measured)
+BENCHMARKS = {
+    "mdav": (
+        lambda dataset, k: (list(dataset.records), k),
+        lambda state: Mdav().create_clusters(*state),
+    ),
+    "mdav_vectorized": (
+        lambda dataset, k: (list(dataset.records), k),
+        lambda state: Mdav(vectorized=True).create_clusters(*state),
+    ),
+    "microaggregation": (
+        lambda dataset, k: (list(dataset.records), k),
+        lambda state: Microaggregation().create_clusters(*state),
+    ),
+    "k_anonymity": (
+        lambda dataset, k: K_anonymity(dataset, k),
+        anonymize,
+    ),
+    "k_t_closeness": (
+        lambda dataset, k: T_closeness(dataset, k, 0.25),
+        anonymize,
+    ),
+    "differential_privacy": (
+        lambda dataset, k: Differential_privacy(dataset, k, 1.0, seed=0),
+        anonymize,
+    ),
+    "information_loss": (
+        lambda dataset, k: (dataset, anonymize(K_anonymity(dataset, k))),
+        lambda state: Anonymization_scheme.calculate_information_loss(*state),
+    ),
+    "information_loss_vectorized": (
+        lambda dataset, k: (dataset, anonymize(K_anonymity(dataset, k))),
+        lambda state: Anonymization_scheme.calculate_information_loss(
+            *state, vectorized=True
+        ),
+    ),
+    "record_linkage": (
+        lambda dataset, k: (dataset, anonymize(K_anonymity(dataset, k))),
+        lambda state: Anonymization_scheme.calculate_record_linkage(*state),
+    ),
+    "fast_record_linkage": (
+        lambda dataset, k: (dataset, anonymize(K_anonymity(dataset, k))),
+        lambda state: Anonymization_scheme.calculate_fast_record_linkage(*state),
+    ),
+    "indexed_record_linkage": (
+        lambda dataset, k: (dataset, anonymize(K_anonymity(dataset, k))),
+        lambda state: Anonymization_scheme.calculate_indexed_record_linkage(*state),
+    ),
+}
+
+
+def measure(setup, run, dataset, k, repeat, memory):
+    """Runs the benchmark repeat times, returns the runtimes and the peak of memory allocated by run"""
+    times = []
+    for _ in range(repeat):
+        state = setup(dataset, k)
+        t_ini = time.perf_counter()
+        run(state)
+        times.append(time.perf_counter() - t_ini)
+    peak_memory = None
+    if memory:
+        # measured apart, tracing the allocations slows down the execution
+        state = setup(dataset, k)
+        tracemalloc.start()
+        run(state)
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return times, peak_memory
+
+
+def environment():
+    """Describes the environment where the benchmarks are run"""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except OSError:
+        commit = None
+
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "machine": platform.machine(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--n", type=int, nargs="+", default=[500, 2000])
+    parser.add_argument("--k", type=int, nargs="+", default=[3, 10])
+    parser.add_argument(
+        "--mixes",
+        nargs="+",
+        default=["numerical", "categorical", "mixed"],
+        choices=list(MIXES),
+    )
+    parser.add_argument(
+        "--benchmarks", nargs="+", default=list(BENCHMARKS), choices=list(BENCHMARKS)
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--no-memory", action="store_true", help="do not profile the memory"
+    )
+    parser.add_argument(
+        "--columnar", action="store_true", help="load the data sets as columnar"
+    )
+    parser.add_argument("--output", help="file to append the results (JSON lines)")
+    args = parser.parse_args()
+
+    info = environment()
+    output = open(args.output, "a") if args.output else sys.stdout
+    with tempfile.TemporaryDirectory() as tmp:
+        for mix in args.mixes:
+            settings_path = os.path.join(tmp, f"{mix}.xml")
+            generate_settings(mix, settings_path)
+            for n in args.n:
+                df = generate_dataframe(n, mix, args.seed)
+                for k in args.k:
+                    for name in args.benchmarks:
+                        setup, run = BENCHMARKS[name]
+                        # the library reports its progress, it is not part of the results
+                        with contextlib.redirect_stdout(io.StringIO()):
+                            dataset = Dataset_DataFrame(
+                                df, settings_path, columnar=args.columnar
+                            )
+                            times, peak_memory = measure(
+                                setup, run, dataset, k, args.repeat, not args.no_memory
+                            )
+                        result = {
+                            "benchmark": name,
+                            "mix": mix,
+                            "n": n,
+                            "k": k,
+                            "columnar": args.columnar,
+                            "repeat": args.repeat,
+                            "seed": args.seed,
+                            "min_seconds": min(times),
+                            "median_seconds": statistics.median(times),
+                            "peak_memory_bytes": peak_memory,
+                        }
+                        result.update(info)
+                        output.write(json.dumps(result) + "\n")
+                        output.flush()
+    if args.output:
+        output.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 from privlib.anonymization.src.entities.record import Record
 from abc import ABC, abstractmethod
+import numpy as np
 
 
 class Algorithm(ABC):
@@ -76,6 +77,86 @@ class Algorithm(ABC):
 
         return centroid
 
+    @staticmethod
+    def calculate_centroid_rows(column_store, rows, **kwargs):
+        """calculate_centroid_rows
+
+        Function that calculates the centroid of the records stored in the given rows of a columnar store.
+        It is the columnar counterpart of calculate_centroid, the centroid of each attribute is calculated
+        from its column (see calculate_column_centroid in :class:`Value`)
+
+        Parameters
+        ----------
+        column_store : :class:`Column_store`
+            the columnar store of the records.
+        rows : numpy.ndarray
+            the rows of the records to calculate the centroid.
+        **kwargs : optional
+            Additional arguments that the specific attribute type value may need to calculate the centroid
+
+        Returns
+        -------
+        :class:`Record`
+            A record that is the centroid of the records in rows
+
+        See Also
+        --------
+        :class:`Column_store`
+        """
+        centroid_values = []
+        for i, column in enumerate(column_store.columns):
+            # treat only quasi-identifiers
+            if Record.reference_record.values[i] is not None:
+                centroid = column.calculate_centroid(rows, **kwargs)
+                centroid_values.append(centroid)
+            else:
+                centroid_values.append("")
+        centroid = Record(0, centroid_values)
+
+        return centroid
+
+    @staticmethod
+    def calculate_centroids_rows(column_store, clusters, **kwargs):
+        """calculate_centroids_rows
+
+        Function that calculates the centroids of several clusters of records stored in a columnar store.
+        The centroids of all the clusters are calculated at once for each attribute, with grouped array
+        reductions (see calculate_column_centroids in :class:`Value`). They are the same as the ones calculated
+        by calculate_centroid_rows for each cluster
+
+        Parameters
+        ----------
+        column_store : :class:`Column_store`
+            the columnar store of the records.
+        clusters : list
+            the list of clusters, each cluster is given by the array of rows of its records.
+        **kwargs : optional
+            Additional arguments that the specific attribute type value may need to calculate the centroid
+
+        Returns
+        -------
+        list
+            For each attribute, the list with the centroid value of each cluster
+            (None for the attributes that are not treated)
+
+        See Also
+        --------
+        :class:`Column_store`
+        """
+        rows = np.concatenate(clusters)
+        labels = np.repeat(
+            np.arange(len(clusters)), [len(cluster) for cluster in clusters]
+        )
+        centroids = []
+        for i, column in enumerate(column_store.columns):
+            # treat only quasi-identifiers
+            if Record.reference_record.values[i] is not None:
+                centroids.append(column.calculate_centroids(rows, labels, **kwargs))
+            else:
+                centroids.append(None)
+
+        return centroids
+
     @abstractmethod
     def __str__(self):
         pass
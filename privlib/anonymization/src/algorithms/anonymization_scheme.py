@@ -9,12 +9,21 @@ import copy
 from privlib.anonymization.src.entities.disclosure_risk_result import (
     Disclosure_risk_result,
 )
+from privlib.anonymization.src.entities.column import Column
+from privlib.anonymization.src.entities.column_store import Column_store
 from privlib.anonymization.src.entities.dataset import Dataset
 from privlib.anonymization.src.entities.dataset_SPF import Dataset_SPF
 from privlib.anonymization.src.entities.record import Record
 from tqdm.auto import tqdm
 from privlib.anonymization.src.utils import utils
 from privlib.anonymization.src.utils import constants
+import numpy as np
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    # scipy is optional, it is only used by calculate_indexed_record_linkage
+    cKDTree = None
 
 
 class Anonymization_scheme(ABC):
@@ -49,6 +58,8 @@ class Anonymization_scheme(ABC):
         self.original_dataset = original_dataset
         self.anonymized_dataset = original_dataset
         self.runtime = 0
+        # additional arguments of the centroid calculations (see calculate_centroid in :class:`Value`)
+        self.centroid_kwargs = {}
 
     @abstractmethod
     def calculate_anonymization(self, algorithm):
@@ -72,18 +83,127 @@ class Anonymization_scheme(ABC):
         """suppress_identifiers
 
         Function that removes the identifiers attribute values from the data set.
+        The values are replaced, not modified, because they may be shared with the original data set
+        (see copy_on_write in :class:`Dataset`). If the anonymized data set is columnar, the columns of the
+        identifiers are replaced instead.
         """
         for i in range(self.anonymized_dataset.num_attr):
             name = self.anonymized_dataset.header[i]
             attribute = self.anonymized_dataset.attributes[name]
             sensitivity = attribute.sensitivity_type
-            if sensitivity == Sensitivity_type.IDENTIFIER.value:
+            if sensitivity != Sensitivity_type.IDENTIFIER.value:
+                continue
+            if self.anonymized_dataset.columnar:
+                columns = self.anonymized_dataset.columns
+                column = columns[i]
+                value = column.value(0)
+                value.value = column.value_class.reference_value.value
+                columns.columns[i] = Column.from_values(
+                    column.name, column.value_class, [value]
+                ).take(np.zeros(len(column), dtype=np.int64))
+            else:
                 type_value = type(self.anonymized_dataset.records[0].values[i])
                 for record in self.anonymized_dataset.records:
-                    record.values[i].value = type_value.reference_value.value
+                    value = copy.copy(record.values[i])
+                    value.value = type_value.reference_value.value
+                    record.values[i] = value
+
+    def create_clusters_rows(self, algorithm, k):
+        """create_clusters_rows
+
+        Function to perform the clustering of the records of the original data set from its columnar store,
+        without creating its list of records, so a columnar data set remains columnar.
+        If the clustering algorithm is vectorized (see create_clusters_rows in :class:`Mdav`), the clustering is
+        performed over the columns, otherwise over records created from the columnar store.
+
+        Parameters
+        ----------
+        algorithm : :class:`Algorithm`
+            the clustering algorithm used to group records during the anonymization.
+
+        k : int
+            The minimum number of records in each cluster
+
+        Returns
+        -------
+        list
+            The list of clusters, each cluster is given by the array of rows of its records.
+        """
+        columns = self.original_dataset.columns
+        if getattr(algorithm, "vectorized", False):
+            columns.calculate_standard_deviations()
+            return algorithm.create_clusters_rows(columns, k)
+        clusters = algorithm.create_clusters(columns.records(), k)
+
+        return [np.array([record.id for record in cluster]) for cluster in clusters]
+
+    def assign_centroids(self, clusters, algorithm):
+        """assign_centroids
+
+        Function that replaces the quasi-identifier attribute values of each record in the anonymized data set by
+        the ones of the centroid of its cluster. The centroids of all the clusters are calculated at once from
+        the columns of the original data set (see calculate_centroids_rows in :class:`Algorithm`).
+
+        Parameters
+        ----------
+        clusters : list
+            The list of clusters, each cluster is a list of records.
+
+        algorithm : :class:`Algorithm`
+            the clustering algorithm used to group records during the anonymization.
+        """
+        rows = [np.array([record.id for record in cluster]) for cluster in clusters]
+        self.assign_centroids_rows(rows, algorithm)
+
+    def assign_centroids_rows(self, clusters, algorithm):
+        """assign_centroids_rows
+
+        Function that replaces the quasi-identifier attribute values of each record in the anonymized data set by
+        the ones of the centroid of its cluster, being each cluster given by the rows of its records
+        (see assign_centroids). If the anonymized data set is columnar, its quasi-identifier columns are replaced
+        by columns of centroids, without creating its list of records.
+
+        Parameters
+        ----------
+        clusters : list
+            The list of clusters, each cluster is given by the array of rows of its records.
+
+        algorithm : :class:`Algorithm`
+            the clustering algorithm used to group records during the anonymization.
+        """
+        centroids = algorithm.calculate_centroids_rows(
+            self.original_dataset.columns, clusters, **self.centroid_kwargs
+        )
+        quasi_identifiers = []
+        for i in range(self.original_dataset.num_attr):
+            name = self.original_dataset.header[i]
+            attribute = self.original_dataset.attributes[name]
+            sensitivity = attribute.sensitivity_type
+            if sensitivity == Sensitivity_type.QUASI_IDENTIFIER.value:
+                quasi_identifiers.append(i)
+        if self.anonymized_dataset.columnar:
+            labels = np.empty(len(self.anonymized_dataset), dtype=np.int64)
+            for j, rows in enumerate(clusters):
+                labels[rows] = j
+            columns = self.anonymized_dataset.columns
+            for i in quasi_identifiers:
+                column = columns[i]
+                columns.columns[i] = Column.from_values(
+                    column.name, column.value_class, centroids[i]
+                ).take(labels)
+            return
+        records = self.anonymized_dataset.records
+        for j, rows in enumerate(clusters):
+            centroid = [(i, centroids[i][j]) for i in quasi_identifiers]
+            for row in rows:
+                values = records[row].values
+                for i, value in centroid:
+                    values[i] = value
 
     @staticmethod
-    def calculate_information_loss(original_dataset, anonymized_dataset):
+    def calculate_information_loss(
+        original_dataset, anonymized_dataset, vectorized=False, metrics=None
+    ):
         """calculate_information_loss
 
         Function to perform the clustering of the records given as parameter
@@ -96,6 +216,15 @@ class Anonymization_scheme(ABC):
 
         anonymized_dataset : :class:`Dataset`
             The anonymized version of the original dataset
+
+        vectorized : bool
+            Optional, if True the metrics are calculated with array operations over the columns of the data sets
+            (see calculate_columnar_information_loss). The results are the same.
+
+        metrics : list
+            Optional, the metrics to calculate (SSE, MEAN and/or VARIANCE in constants), by default all of them.
+            The metrics not calculated are None in the result.
+
         Returns
         -------
         :class:`Information_loss_result`
@@ -106,38 +235,130 @@ class Anonymization_scheme(ABC):
         :class:`Record`
         :class:`Information_loss_result`
         """
+        if metrics is None:
+            metrics = [constants.SSE, constants.MEAN, constants.VARIANCE]
+        if vectorized:
+            return Anonymization_scheme.calculate_columnar_information_loss(
+                original_dataset, anonymized_dataset, metrics
+            )
         print("Calculating information loss metrics")
         Dataset.calculate_standard_deviations(original_dataset.records)
-        SSE = 0
-        for i in range(len(original_dataset)):
-            dis = original_dataset.records[i].distance(anonymized_dataset.records[i])
-            SSE += dis
-        SSE /= len(original_dataset)
+        SSE = None
+        if constants.SSE in metrics:
+            SSE = 0
+            for i in range(len(original_dataset)):
+                dis = original_dataset.records[i].distance(
+                    anonymized_dataset.records[i]
+                )
+                SSE += dis
+            SSE /= len(original_dataset)
         num_attr = len(original_dataset.records[0].values)
         attribute_name = []
-        original_mean = []
-        original_variance = []
+        original_mean = [] if constants.MEAN in metrics else None
+        original_variance = [] if constants.VARIANCE in metrics else None
         for i in range(num_attr):
             attribute_name.append(original_dataset.header[i])
             values = []
             for j in range(len(original_dataset)):
                 values.append(original_dataset.records[j].values[i])
-            mean = original_dataset.records[0].values[i].calculate_mean(values)
-            original_mean.append(mean)
-            variance = original_dataset.records[0].values[i].calculate_variance(values)
-            original_variance.append(variance)
-        anonymized_mean = []
-        anonymized_variance = []
+            if original_mean is not None:
+                mean = original_dataset.records[0].values[i].calculate_mean(values)
+                original_mean.append(mean)
+            if original_variance is not None:
+                variance = (
+                    original_dataset.records[0].values[i].calculate_variance(values)
+                )
+                original_variance.append(variance)
+        anonymized_mean = [] if constants.MEAN in metrics else None
+        anonymized_variance = [] if constants.VARIANCE in metrics else None
         for i in range(num_attr):
             values = []
             for j in range(len(anonymized_dataset)):
                 values.append(anonymized_dataset.records[j].values[i])
-            mean = anonymized_dataset.records[0].values[i].calculate_mean(values)
-            anonymized_mean.append(mean)
-            variance = (
-                anonymized_dataset.records[0].values[i].calculate_variance(values)
-            )
-            anonymized_variance.append(variance)
+            if anonymized_mean is not None:
+                mean = anonymized_dataset.records[0].values[i].calculate_mean(values)
+                anonymized_mean.append(mean)
+            if anonymized_variance is not None:
+                variance = (
+                    anonymized_dataset.records[0].values[i].calculate_variance(values)
+                )
+                anonymized_variance.append(variance)
+
+        information_loss = Information_loss_result(
+            SSE,
+            attribute_name,
+            original_mean,
+            anonymized_mean,
+            original_variance,
+            anonymized_variance,
+        )
+
+        return information_loss
+
+    @staticmethod
+    def calculate_columnar_information_loss(
+        original_dataset, anonymized_dataset, metrics=None
+    ):
+        """calculate_columnar_information_loss
+
+        Function to calculate the information loss of the anonymized data set with array operations over
+        the columns of the data sets (see :class:`Column_store`), instead of record by record.
+        The SSE is calculated from the distances between the records in the same row of both columnar stores,
+        and the means and variances as reductions of each column (see calculate_column_mean and
+        calculate_column_variance in :class:`Value`). The results are the same as calculate_information_loss.
+
+        Parameters
+        ----------
+        original_dataset : :class:`Dataset`
+            The original data set.
+
+        anonymized_dataset : :class:`Dataset`
+            The anonymized version of the original dataset
+
+        metrics : list
+            Optional, the metrics to calculate (SSE, MEAN and/or VARIANCE in constants), by default all of them.
+            The metrics not calculated are None in the result.
+
+        Returns
+        -------
+        :class:`Information_loss_result`
+            Information loss statistics.
+
+        See Also
+        --------
+        :class:`Column_store`
+        :class:`Information_loss_result`
+        """
+        if metrics is None:
+            metrics = [constants.SSE, constants.MEAN, constants.VARIANCE]
+        print("Calculating information loss metrics")
+        columns_original = original_dataset.columns
+        columns_anonymized = anonymized_dataset.columns
+        columns_original.calculate_standard_deviations()
+        SSE = None
+        if constants.SSE in metrics:
+            distances = columns_original.paired_distances(columns_anonymized)
+            # cumulative sum, to add the distances in order
+            SSE = float(np.cumsum(distances)[-1] / len(columns_original))
+        attribute_name = list(original_dataset.header)
+        original_mean = None
+        anonymized_mean = None
+        if constants.MEAN in metrics:
+            original_mean = [
+                column.calculate_mean() for column in columns_original.columns
+            ]
+            anonymized_mean = [
+                column.calculate_mean() for column in columns_anonymized.columns
+            ]
+        original_variance = None
+        anonymized_variance = None
+        if constants.VARIANCE in metrics:
+            original_variance = [
+                column.calculate_variance() for column in columns_original.columns
+            ]
+            anonymized_variance = [
+                column.calculate_variance() for column in columns_anonymized.columns
+            ]
 
         information_loss = Information_loss_result(
             SSE,
@@ -377,6 +598,96 @@ class Anonymization_scheme(ABC):
 
         return Disclosure_risk_result(total_prob, len(anonymized_dataset))
 
+    @staticmethod
+    def calculate_indexed_record_linkage(
+        original_dataset, anonymized_dataset, batch_size=None
+    ):
+        """calculate_indexed_record_linkage
+
+        Function to Calculates the disclosure risk of the anonymized data set by comparing it with
+        the original one. It gives the same disclosure risk as calculate_record_linkage (including the
+        resolution of ties), but the nearest original records are searched in a spatial index (KD-tree) built over
+        the quasi-identifier attributes of the original data set, queried by batches of anonymized records.
+        The spatial index requires scipy and attribute types that can be embedded in an Euclidean space
+        (see embed_columns in :class:`Value`), otherwise the distances to all the original records are
+        calculated by columns.
+
+        Parameters
+        ----------
+        original_dataset : :class:`Dataset`
+            The original data set.
+
+        anonymized_dataset : :class:`Dataset`
+            The anonymized version of the original dataset
+
+        batch_size : int
+            optional, The number of anonymized records queried at once in the spatial index.
+            If it is omitted, it is taken constants.BATCH_SIZE
+        Returns
+        -------
+        :class:`Disclosure_risk_result`
+            The disclosure risk.
+
+        See Also
+        --------
+        :class:`Disclosure_risk_result`
+        """
+        if batch_size is None:
+            batch_size = constants.BATCH_SIZE
+        print("Calculating indexed record linkage (disclosure risk)")
+        # the identifiers are taken before the columnar stores, accessing the records discards them
+        ids_original = original_dataset.record_ids()
+        ids_anonymized = anonymized_dataset.record_ids()
+        columns_original = original_dataset.columns
+        columns_anonymized = anonymized_dataset.columns
+        columns_original.calculate_standard_deviations()
+        # the original records equal to each other form a group, the group of each identifier
+        groups, counts = columns_original.equal_records()
+        groups_by_id = np.empty(ids_original.max() + 1, dtype=np.int64)
+        groups_by_id[ids_original] = groups
+
+        points = None
+        if cKDTree is not None:
+            points = Column_store.embed_quasi_identifiers(
+                [columns_original, columns_anonymized]
+            )
+        if points is None:
+            print("Spatial index not available, calculating distances to all records")
+            tree = None
+        else:
+            tree = cKDTree(points[0])
+
+        total_prob = 0
+        for start in tqdm(range(0, len(anonymized_dataset), batch_size)):
+            rows_anom = range(start, min(start + batch_size, len(anonymized_dataset)))
+            if tree is None:
+                candidates = [None] * len(rows_anom)
+            else:
+                # The candidates are the records at the (approximate) distance of the nearest one,
+                # the exact distance is calculated to them to resolve ties as the sequential search
+                batch_points = points[1][start : start + batch_size]
+                distances, _ = tree.query(batch_points)
+                radius = (
+                    distances * (1 + constants.INDEX_TOLERANCE)
+                    + constants.INDEX_TOLERANCE
+                )
+                candidates = tree.query_ball_point(
+                    batch_points, radius, return_sorted=True
+                )
+            for row_anom, rows in zip(rows_anom, candidates):
+                if rows is not None:
+                    rows = np.array(rows, dtype=np.int64)
+                record_anom = columns_anonymized.record(row_anom)
+                distances = columns_original.distances(record_anom, rows)
+                # The first record at minimum distance
+                pos = np.argmin(distances)
+                row = pos if rows is None else rows[pos]
+                id_anom = ids_anonymized[row_anom]
+                if id_anom < len(groups_by_id) and groups_by_id[id_anom] == groups[row]:
+                    total_prob += 1 / counts[groups[row]]
+
+        return Disclosure_risk_result(total_prob, len(anonymized_dataset))
+
     @staticmethod
     def list_to_string(list_to, separator):
         s = ""
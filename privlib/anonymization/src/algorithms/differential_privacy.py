@@ -7,7 +7,9 @@ from privlib.anonymization.src.entities.dataset import Dataset
 from privlib.anonymization.src.entities.record import Record
 from privlib.anonymization.src.utils import utils
 import copy
+from concurrent.futures import ProcessPoolExecutor
 from timeit import default_timer as timer
+import numpy as np
 
 
 class Differential_privacy(Anonymization_scheme):
@@ -29,7 +31,7 @@ class Differential_privacy(Anonymization_scheme):
 
     """
 
-    def __init__(self, original_dataset, k, epsilon):
+    def __init__(self, original_dataset, k, epsilon, n_jobs=1, seed=None):
         """Constructor, called from inherited classes
 
         Parameters
@@ -43,6 +45,14 @@ class Differential_privacy(Anonymization_scheme):
         epsilon : float
             The desired level of differential privacy during the anonymization process
 
+        n_jobs : int
+            Optional, the number of processes used to anonymize the quasi-identifier attributes in parallel.
+            By default, the attributes are anonymized one after another
+
+        seed : int
+            Optional, the master seed of the random generators adding the noise. Each attribute gets its own
+            random stream spawned from it, so the anonymization is reproducible whatever the value of n_jobs
+
         See Also
         --------
         :class:`Dataset`
@@ -50,6 +60,8 @@ class Differential_privacy(Anonymization_scheme):
         super().__init__(original_dataset)
         self.k = k
         self.epsilon = epsilon
+        self.n_jobs = n_jobs
+        self.seed = seed
 
     def calculate_anonymization(self, algorithm):
         """calculate_anonymization
@@ -70,8 +82,9 @@ class Differential_privacy(Anonymization_scheme):
 
     def individual_ranking(self, algorithm):
         t_ini = timer()
-        self.anonymized_dataset = copy.deepcopy(self.original_dataset)
+        self.anonymized_dataset = self.original_dataset.copy_on_write()
         reference_record_original = copy.copy(Record.reference_record)
+        tasks = []
         for i in range(self.original_dataset.num_attr):
             name = self.original_dataset.header[i]
             attribute = self.original_dataset.attributes[name]
@@ -79,20 +92,12 @@ class Differential_privacy(Anonymization_scheme):
             if sensitivity != Sensitivity_type.QUASI_IDENTIFIER.value:
                 continue
             print(f"Anonymizing attribute: {name} ({attribute.attribute_type})")
-            # Creating a temporal list of records with only this attribute
-            temp = []
-            for record in self.original_dataset.records:
-                rec = Record(record.id, [record.values[i]])
-                temp.append(rec)
-            # Individual ranking works on an attribute
-            Record.reference_record = Record(0, [reference_record_original.values[i]])
-            Record.calculate_distances_to_reference_record(temp)
-
+            ids = [record.id for record in self.original_dataset.records]
+            values = [record.values[i] for record in self.original_dataset.records]
             # if values can not be negative put 0 in min_value in xml settings
             min_value = self.original_dataset.attributes[name].min_value
             max_value = self.original_dataset.attributes[name].max_value
             if min_value == "" or max_value == "":
-                values = [record.values[0] for record in temp]
                 min_value_margin, max_value_margin = values[0].calculate_min_max(
                     values, constants.BORDER_MARGIN
                 )
@@ -101,20 +106,35 @@ class Differential_privacy(Anonymization_scheme):
                 if max_value == "":
                     max_value = max_value_margin
             applicable_epsilon = self.epsilon / self.original_dataset.num_attr_quasi
-
-            clusters = algorithm.create_clusters(temp, self.k)
-            for cluster in clusters:
-                centroid = algorithm.calculate_centroid(
-                    cluster,
-                    epsilon=applicable_epsilon,
-                    k=self.k,
-                    min_value=min_value,
-                    max_value=max_value,
-                )
-                for record in cluster:
-                    self.anonymized_dataset.records[record.id].values[
-                        i
-                    ] = centroid.values[0]
+            tasks.append(
+                [
+                    algorithm,
+                    self.k,
+                    applicable_epsilon,
+                    i,
+                    ids,
+                    values,
+                    reference_record_original.values[i],
+                    min_value,
+                    max_value,
+                    Record.header,
+                    Record.attributes,
+                    Record.standard_deviations,
+                ]
+            )
+        # Each attribute gets its own random stream
+        seeds = np.random.SeedSequence(self.seed).spawn(len(tasks))
+        for task, seed in zip(tasks, seeds):
+            task.append(seed)
+        if self.n_jobs == 1:
+            results = map(Differential_privacy.rank_attribute, tasks)
+        else:
+            with ProcessPoolExecutor(max_workers=self.n_jobs) as executor:
+                results = list(executor.map(Differential_privacy.rank_attribute, tasks))
+        for i, clusters in results:
+            for ids, centroid in clusters:
+                for id in ids:
+                    self.anonymized_dataset.records[id].values[i] = centroid
         # this is to allow other anonymizations without re-load the dataset
         Dataset.calculate_standard_deviations(self.original_dataset.records)
         Record.set_reference_record(self.original_dataset)
@@ -124,6 +144,69 @@ class Differential_privacy(Anonymization_scheme):
             f"Anonymization runtime: {utils.format_time(Anonymization_scheme.runtime)}"
         )
 
+    @staticmethod
+    def rank_attribute(task):
+        """rank_attribute
+
+        Function to perform the individual ranking of an attribute: the values of the attribute are clustered
+        and the differentially private centroid of each cluster is calculated.
+        It only depends on the task given as parameter, so the attributes can be ranked in parallel processes.
+
+        Parameters
+        ----------
+        task : list
+            The clustering algorithm, k, epsilon, the index of the attribute, the identifiers of the records
+            and their values for the attribute, the reference value, the min and max values of the attribute,
+            the header, attributes and standard deviations of the dataset and the seed of the random generator
+
+        Returns
+        -------
+        int, list
+            The index of the attribute and, for each cluster, the identifiers of its records and the centroid.
+        """
+        (
+            algorithm,
+            k,
+            epsilon,
+            i,
+            ids,
+            values,
+            reference_value,
+            min_value,
+            max_value,
+            header,
+            attributes,
+            standard_deviations,
+            seed,
+        ) = task
+        # The worker process may not share the class attributes of Record
+        Record.header = header
+        Record.attributes = attributes
+        Record.standard_deviations = standard_deviations
+        # Creating a temporal list of records with only this attribute
+        temp = []
+        for id, value in zip(ids, values):
+            rec = Record(id, [value])
+            temp.append(rec)
+        # Individual ranking works on an attribute
+        Record.reference_record = Record(0, [reference_value])
+        Record.calculate_distances_to_reference_record(temp)
+        rng = np.random.default_rng(seed)
+        clusters = algorithm.create_clusters(temp, k)
+        result = []
+        for cluster in clusters:
+            centroid = algorithm.calculate_centroid(
+                cluster,
+                epsilon=epsilon,
+                k=k,
+                min_value=min_value,
+                max_value=max_value,
+                rng=rng,
+            )
+            result.append(([record.id for record in cluster], centroid.values[0]))
+
+        return i, result
+
     def __str__(self):
         return (
             "Differential_privacy, k = "
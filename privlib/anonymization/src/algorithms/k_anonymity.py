@@ -3,7 +3,7 @@ from privlib.anonymization.src.algorithms.anonymization_scheme import (
 )
 from privlib.anonymization.src.utils.sensitivity_type import Sensitivity_type
 from privlib.anonymization.src.utils import utils
-import copy
+from privlib.anonymization.src.utils import constants
 from timeit import default_timer as timer
 
 
@@ -26,7 +26,7 @@ class K_anonymity(Anonymization_scheme):
 
     """
 
-    def __init__(self, original_dataset, k):
+    def __init__(self, original_dataset, k, grouped=False, fast_centroid=False):
         """Constructor, called from inherited classes
 
         Parameters
@@ -37,12 +37,24 @@ class K_anonymity(Anonymization_scheme):
         k : int
             The size of the clusters in the clustering process
 
+        grouped : bool
+            Optional, if True the centroids of all the clusters are calculated at once with grouped array
+            reductions over the columns of the data set (see assign_centroids in :class:`Anonymization_scheme`).
+            A columnar data set is always anonymized this way, so it remains columnar
+
+        fast_centroid : bool
+            Optional, if True the centroids of the semantic categorical attributes are found with the faster
+            search of calculate_fast_centroid in :class:`Semantic_categorical_wordnet`
+
         See Also
         --------
         :class:`Dataset`
         """
         super().__init__(original_dataset)
         self.k = k
+        self.grouped = grouped
+        if fast_centroid:
+            self.centroid_kwargs[constants.FAST_CENTROID] = True
 
     def calculate_anonymization(self, algorithm):
         """calculate_anonymization
@@ -60,20 +72,29 @@ class K_anonymity(Anonymization_scheme):
         """
         t_ini = timer()
         print("Anonymizing " + str(self) + " via " + str(algorithm))
-        clusters = algorithm.create_clusters(self.original_dataset.records, self.k)
-        self.anonymized_dataset = copy.deepcopy(self.original_dataset)
-        for cluster in clusters:
-            centroid = algorithm.calculate_centroid(cluster)
-            for record in cluster:
-                for i in range(self.original_dataset.num_attr):
-                    name = self.original_dataset.header[i]
-                    attribute = self.original_dataset.attributes[name]
-                    sensitivity = attribute.sensitivity_type
-                    if sensitivity != Sensitivity_type.QUASI_IDENTIFIER.value:
-                        continue
-                    self.anonymized_dataset.records[record.id].values[
-                        i
-                    ] = centroid.values[i]
+        if self.original_dataset.columnar:
+            # the clusters are given by the rows of the records, so the data set remains columnar
+            clusters = self.create_clusters_rows(algorithm, self.k)
+        else:
+            clusters = algorithm.create_clusters(self.original_dataset.records, self.k)
+        self.anonymized_dataset = self.original_dataset.copy_on_write()
+        if self.original_dataset.columnar:
+            self.assign_centroids_rows(clusters, algorithm)
+        elif self.grouped:
+            self.assign_centroids(clusters, algorithm)
+        else:
+            for cluster in clusters:
+                centroid = algorithm.calculate_centroid(cluster, **self.centroid_kwargs)
+                for record in cluster:
+                    for i in range(self.original_dataset.num_attr):
+                        name = self.original_dataset.header[i]
+                        attribute = self.original_dataset.attributes[name]
+                        sensitivity = attribute.sensitivity_type
+                        if sensitivity != Sensitivity_type.QUASI_IDENTIFIER.value:
+                            continue
+                        self.anonymized_dataset.records[record.id].values[
+                            i
+                        ] = centroid.values[i]
         self.suppress_identifiers()
         Anonymization_scheme.runtime = timer() - t_ini
         print(
@@ -1,5 +1,7 @@
 from privlib.anonymization.src.algorithms.algorithm import Algorithm
 from privlib.anonymization.src.entities.dataset import Dataset
+from privlib.anonymization.src.entities.column_store import Column_store
+from privlib.anonymization.src.entities.record import Record
 from tqdm.auto import tqdm
 import numpy as np
 
@@ -24,6 +26,24 @@ class Mdav(Algorithm):
 
     """
 
+    def __init__(self, vectorized=False):
+        """Constructor, creates an instance of the MDAV algorithm
+
+        Parameters
+        ----------
+        vectorized : bool
+            Optional, if True the clustering is performed by create_clusters_vectorized, that calculates
+            the distances over whole columns of values instead of record by record. The resulting clusters
+            are the same
+
+        See Also
+        --------
+        :class:`Column_store`
+        """
+        self.vectorized = vectorized
+        if vectorized:
+            self.create_clusters = Mdav.create_clusters_vectorized
+
     @staticmethod
     def create_clusters(records, k):
         """create_clusters
@@ -81,6 +101,114 @@ class Mdav(Algorithm):
 
         return clusters
 
+    @staticmethod
+    def create_clusters_vectorized(records, k):
+        """create_clusters_vectorized
+
+        Function to perform the clustering of the list of records given as parameter.
+        The records are stored by columns and the clustering is performed by create_clusters_rows,
+        the resulting clusters are the same as the ones given by create_clusters.
+        The size of the resulting clusters will be >= k
+
+        Parameters
+        ----------
+        records : list of :class:`Record`
+            The list of records to perform the clustering.
+        k : int
+            The desired level of clusters (size of cluster >= k)
+
+        Returns
+        -------
+        : :list of list of :class:`Record`
+            A list where each item is a list a cluster of records.
+
+        See Also
+        --------
+        :class:`Record`
+        :class:`Column_store`
+        """
+        Dataset.calculate_standard_deviations(records)
+        column_store = Column_store.from_records(records, Record.header)
+        clusters_rows = Mdav.create_clusters_rows(column_store, k)
+        clusters = [[records[row] for row in rows] for rows in clusters_rows]
+
+        return clusters
+
+    @staticmethod
+    def create_clusters_rows(column_store, k):
+        """create_clusters_rows
+
+        Function to perform the clustering of the records stored in the columnar store given as parameter.
+        The distances from the centroid and from the selected records to the remaining ones are calculated
+        over whole columns, the standard deviations must be already calculated (see :class:`Record`).
+        The remaining rows are kept in the same order as the records in create_clusters, so that ties
+        are resolved in the same way and the resulting clusters are the same.
+        The size of the resulting clusters will be >= k
+
+        Parameters
+        ----------
+        column_store : :class:`Column_store`
+            The columnar store of the records to perform the clustering.
+        k : int
+            The desired level of clusters (size of cluster >= k)
+
+        Returns
+        -------
+        : :list of numpy.ndarray
+            A list where each item is the array with the rows of a cluster of records.
+
+        See Also
+        --------
+        :class:`Column_store`
+        """
+        pbar = tqdm(total=len(column_store))
+        D = np.arange(len(column_store))
+        clusters = []
+        while len(D) >= 3 * k:
+            centroid = Mdav.calculate_centroid_rows(column_store, D)
+            # calculate r (furthest from centroid)
+            r, i = Mdav.calculate_furthest_row(column_store.distances(centroid, D), D)
+            D = np.delete(D, i)
+            D, cluster = Mdav.create_cluster_rows(column_store, D, r, k)
+            clusters.append(cluster)
+            pbar.update(k)
+            # calculate s (Furthest from r)
+            s, i = Mdav.calculate_furthest_row(column_store.distances_to_row(r, D), D)
+            D = np.delete(D, i)
+            D, cluster = Mdav.create_cluster_rows(column_store, D, s, k)
+            clusters.append(cluster)
+            pbar.update(k)
+        if len(D) >= 2 * k:
+            centroid = Mdav.calculate_centroid_rows(column_store, D)
+            # calculate r (furthest from centroid)
+            r, i = Mdav.calculate_furthest_row(column_store.distances(centroid, D), D)
+            D = np.delete(D, i)
+            D, cluster = Mdav.create_cluster_rows(column_store, D, r, k)
+            clusters.append(cluster)
+            pbar.update(k)
+        if len(D) > 0:
+            clusters.append(D)
+            pbar.update(len(D))
+            pbar.close()
+
+        return clusters
+
+    @staticmethod
+    def calculate_furthest_row(distances, rows):
+        index = np.argmax(distances)
+        furthest = rows[index]
+
+        return furthest, index
+
+    @staticmethod
+    def create_cluster_rows(column_store, rows, row, k):
+        distances = column_store.distances_to_row(row, rows)
+        rows = rows[np.argpartition(distances, k - 1)]
+        c = np.concatenate(([row], rows[: k - 1]))
+        rows = rows[k - 1 :]
+
+        return rows, c
+
     @staticmethod
     def distance(c1, c2):
         return c1.distance(c2)
@@ -3,7 +3,7 @@ from privlib.anonymization.src.algorithms.anonymization_scheme import (
 )
 from privlib.anonymization.src.utils.sensitivity_type import Sensitivity_type
 from privlib.anonymization.src.utils import utils
-import copy
+from privlib.anonymization.src.utils import constants
 from timeit import default_timer as timer
 
 
@@ -26,7 +26,7 @@ class T_closeness(Anonymization_scheme):
 
     """
 
-    def __init__(self, original_dataset, k, t):
+    def __init__(self, original_dataset, k, t, grouped=False, fast_centroid=False):
         """Constructor, called from inherited classes
 
         Parameters
@@ -40,6 +40,14 @@ class T_closeness(Anonymization_scheme):
         t : float
             The desired level of t-closeness privacy in the confidential attribute
 
+        grouped : bool
+            Optional, if True the centroids of all the clusters are calculated at once with grouped array
+            reductions over the columns of the data set (see assign_centroids in :class:`Anonymization_scheme`)
+
+        fast_centroid : bool
+            Optional, if True the centroids of the semantic categorical attributes are found with the faster
+            search of calculate_fast_centroid in :class:`Semantic_categorical_wordnet`
+
         See Also
         --------
         :class:`Dataset`
@@ -47,6 +55,9 @@ class T_closeness(Anonymization_scheme):
         super().__init__(original_dataset)
         self.k = k
         self.t = t
+        self.grouped = grouped
+        if fast_centroid:
+            self.centroid_kwargs[constants.FAST_CENTROID] = True
 
     def calculate_anonymization(self, algorithm):
         """calculate_anonymization
@@ -65,20 +76,23 @@ class T_closeness(Anonymization_scheme):
         t_ini = timer()
         print("Anonymizing " + str(self) + " via " + str(algorithm))
         clusters = self.create_k_t_clusters()
-        self.anonymized_dataset = copy.deepcopy(self.original_dataset)
+        self.anonymized_dataset = self.original_dataset.copy_on_write()
         print("Anonymizing")
-        for cluster in clusters:
-            centroid = algorithm.calculate_centroid(cluster)
-            for record in cluster:
-                for i in range(self.original_dataset.num_attr):
-                    name = self.original_dataset.header[i]
-                    attribute = self.original_dataset.attributes[name]
-                    sensitivity = attribute.sensitivity_type
-                    if sensitivity != Sensitivity_type.QUASI_IDENTIFIER.value:
-                        continue
-                    self.anonymized_dataset.records[record.id].values[
-                        i
-                    ] = centroid.values[i]
+        if self.grouped:
+            self.assign_centroids(clusters, algorithm)
+        else:
+            for cluster in clusters:
+                centroid = algorithm.calculate_centroid(cluster, **self.centroid_kwargs)
+                for record in cluster:
+                    for i in range(self.original_dataset.num_attr):
+                        name = self.original_dataset.header[i]
+                        attribute = self.original_dataset.attributes[name]
+                        sensitivity = attribute.sensitivity_type
+                        if sensitivity != Sensitivity_type.QUASI_IDENTIFIER.value:
+                            continue
+                        self.anonymized_dataset.records[record.id].values[
+                            i
+                        ] = centroid.values[i]
         self.suppress_identifiers()
         Anonymization_scheme.runtime = timer() - t_ini
         print(
@@ -86,7 +100,7 @@ class T_closeness(Anonymization_scheme):
         )
 
     def create_k_t_clusters(self):
-        self.anonymized_dataset = copy.deepcopy(self.original_dataset)
+        self.anonymized_dataset = self.original_dataset.copy_on_write()
         index_confidential = self.get_index_confidential_attribute()
         print(
             "Sorting by confidential attribute: "
@@ -2,6 +2,7 @@ from privlib.anonymization.src.attribute_types.value import Value
 from privlib.anonymization.src.utils import constants
 from privlib.anonymization.src.utils import utils
 import math
+import numpy as np
 
 
 class Coordinate(Value):
@@ -119,13 +120,13 @@ class Coordinate(Value):
         min_value = float(kwargs[constants.MIN_VALUE].coordinate_lat)
         scale = (max_value - min_value) / (k * epsilon)
         dp_centroid_lat = utils.add_laplace_noise(
-            mean.coordinate_lat, scale, max_value, min_value
+            mean.coordinate_lat, scale, max_value, min_value, kwargs.get(constants.RNG)
         )
         max_value = float(kwargs[constants.MAX_VALUE].coordinate_lon)
         min_value = float(kwargs[constants.MIN_VALUE].coordinate_lon)
         scale = (max_value - min_value) / (k * epsilon)
         dp_centroid_lon = utils.add_laplace_noise(
-            mean.coordinate_lon, scale, max_value, min_value
+            mean.coordinate_lon, scale, max_value, min_value, kwargs.get(constants.RNG)
         )
         dp_centroid = Coordinate([dp_centroid_lat, dp_centroid_lon])
 
@@ -260,6 +261,247 @@ class Coordinate(Value):
 
         return Coordinate.reference_value
 
+    @staticmethod
+    def to_array(values):
+        """to_array
+
+        Converts the list of coordinates received as parameter into an array with a row (lat, lon) per coordinate.
+
+        Parameters
+        ----------
+        values :
+            The list of coordinates to convert
+
+        Returns
+        -------
+        numpy.ndarray
+            The array of coordinates.
+
+        See Also
+        --------
+        :class:`Value`
+        """
+        return np.array(
+            [[value.coordinate_lat, value.coordinate_lon] for value in values],
+            dtype=np.float64,
+        ).reshape(-1, 2)
+
+    @staticmethod
+    def from_array(item):
+        """from_array
+
+        Creates the coordinate represented by a row (lat, lon) of the array.
+
+        Parameters
+        ----------
+        item :
+            The row of the array
+
+        Returns
+        -------
+        Coordinate
+            The coordinate.
+        """
+        return Coordinate([float(item[0]), float(item[1])])
+
+    @staticmethod
+    def distance_array(data, item):
+        """distance_array
+
+        Calculates the distances between each coordinate in the array data and the given coordinate.
+
+        Parameters
+        ----------
+        data :
+            The array of coordinates returned by to_array
+        item :
+            The row (lat, lon) representing the other coordinate
+
+        Returns
+        -------
+        numpy.ndarray
+            The distances between each coordinate in data and the given coordinate.
+        """
+        # float_power as the ** operator (np.power takes a different path for squares)
+        return np.sqrt(
+            np.float_power(item[0] - data[:, 0], 2)
+            + np.float_power(item[1] - data[:, 1], 2)
+        )
+
+    @staticmethod
+    def calculate_column_standard_deviation(column):
+        """calculate_column_standard_deviation
+
+        Calculates the standard deviation of the coordinates stored in the column.
+        As in calculate_standard_deviation, it is the square root of the variance (see calculate_column_variance).
+
+        Parameters
+        ----------
+        column : :class:`Column`
+            The column to calculate the standard deviation
+
+        Returns
+        -------
+        float
+            The standard deviation of the column.
+        """
+        variance = Coordinate.calculate_column_variance(column)
+        std = math.sqrt(variance)
+
+        return std
+
+    @staticmethod
+    def calculate_column_reference_value(column):
+        """calculate_column_reference_value
+
+        Calculates the reference value of the coordinates stored in the column.
+
+        Parameters
+        ----------
+        column : :class:`Column`
+            The column to calculate the reference value
+
+        Returns
+        -------
+        Coordinate
+            The coordinate reference value.
+        """
+        return Coordinate.calculate_reference_value(None)
+
+    @staticmethod
+    def calculate_column_centroid(column, rows, **kwargs):
+        """calculate_column_centroid
+
+        Calculates the coordinate that is the centroid of the coordinates stored in the given rows
+        of the column. It gives the same centroid as calculate_centroid with the list of coordinates
+
+        Parameters
+        ----------
+        column : :class:`Column`
+            The column storing the coordinates
+        rows : numpy.ndarray
+            The rows of the coordinates to calculate its centroid
+
+        **kwargs : optional
+            Additional arguments that the specific attribute type value may need to calculate the centroid
+
+        Returns
+        -------
+        Coordinate
+            The coordinate that is the centroid of the coordinates in rows.
+        """
+        if constants.EPSILON in kwargs.keys():
+            return Value.calculate_column_centroid(column, rows, **kwargs)
+        lats = column.data[rows, 0].tolist()
+        lons = column.data[rows, 1].tolist()
+        mean_lat = sum(lats) / len(lats)
+        mean_lon = sum(lons) / len(lons)
+
+        return Coordinate([mean_lat, mean_lon])
+
+    @staticmethod
+    def calculate_column_centroids(column, rows, labels, **kwargs):
+        """calculate_column_centroids
+
+        Calculates the coordinate centroid of each group of coordinates stored in the given rows of the column,
+        with grouped sums. It gives the same centroids as calculate_column_centroid applied to each group
+
+        Parameters
+        ----------
+        column : :class:`Column`
+            The column storing the coordinates
+        rows : numpy.ndarray
+            The rows of the coordinates, grouped
+        labels : numpy.ndarray
+            The group of each row
+
+        **kwargs : optional
+            Additional arguments that the specific attribute type value may need to calculate the centroid
+
+        Returns
+        -------
+        list
+            The list with the centroid of each group.
+        """
+        if constants.EPSILON in kwargs.keys():
+            return Value.calculate_column_centroids(column, rows, labels, **kwargs)
+        # bincount sums sequentially as sum
+        sums_lat = np.bincount(labels, weights=column.data[rows, 0])
+        sums_lon = np.bincount(labels, weights=column.data[rows, 1])
+        counts = np.bincount(labels)
+        centroids = []
+        for sum_lat, sum_lon, count in zip(
+            sums_lat.tolist(), sums_lon.tolist(), counts.tolist()
+        ):
+            centroids.append(Coordinate([sum_lat / count, sum_lon / count]))
+
+        return centroids
+
+    @staticmethod
+    def calculate_column_mean(column):
+        """calculate_column_mean
+
+        Calculates the mean of the coordinates stored in the column.
+        The latitudes and longitudes are added in order (cumulative sum), as in calculate_mean.
+
+        Parameters
+        ----------
+        column : :class:`Column`
+            The column to calculate the mean
+
+        Returns
+        -------
+        Coordinate
+            The mean of the column.
+        """
+        sums = np.cumsum(column.data, axis=0)[-1]
+        return Coordinate([float(sums[0] / len(column)), float(sums[1] / len(column))])
+
+    @staticmethod
+    def calculate_column_variance(column):
+        """calculate_column_variance
+
+        Calculates the variance of the coordinates stored in the column.
+        The squared distances to the mean are added in order, as in calculate_variance.
+
+        Parameters
+        ----------
+        column : :class:`Column`
+            The column to calculate the variance
+
+        Returns
+        -------
+        float
+            The variance of the column.
+        """
+        mean = Coordinate.calculate_column_mean(column)
+        partial = Coordinate.distance_array(column.data, column.item(mean))
+        return float(np.cumsum(partial * partial)[-1] / len(column))
+
+    @staticmethod
+    def paired_distance_array(data, other_data):
+        """paired_distance_array
+
+        Calculates the distance between each coordinate in the array data and the coordinate in the same row
+        of the array other_data.
+
+        Parameters
+        ----------
+        data :
+            The array of coordinates returned by to_array
+        other_data :
+            The array of the other coordinates
+
+        Returns
+        -------
+        numpy.ndarray
+            The distances between each pair of coordinates.
+        """
+        return np.sqrt(
+            np.float_power(other_data[:, 0] - data[:, 0], 2)
+            + np.float_power(other_data[:, 1] - data[:, 1], 2)
+        )
+
     def __eq__(self, other):
         if (
             self.value.coordinate_lat == other.value.coordinate_lat
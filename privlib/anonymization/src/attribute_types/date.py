@@ -107,7 +107,9 @@ class Date(Value):
         max_value = Date.date_to_timestamp(kwargs[constants.MAX_VALUE])
         min_value = Date.date_to_timestamp(kwargs[constants.MIN_VALUE])
         scale = (max_value - min_value) / (k * epsilon)
-        dp_centroid = utils.add_laplace_noise(mean, scale, max_value, min_value)
+        dp_centroid = utils.add_laplace_noise(
+            mean, scale, max_value, min_value, kwargs.get(constants.RNG)
+        )
         dp_centroid = Date.timestamp_to_date(dp_centroid)
         dp_centroid = Date(dp_centroid)
 
@@ -248,6 +250,149 @@ class Date(Value):
 
         return Date.reference_value
 
+    @staticmethod
+    def to_array(values):
+        """to_array
+
+        Converts the list of dates received as parameter into the array of their timestamps.
+
+        Parameters
+        ----------
+        values :
+            The list of dates to convert
+
+        Returns
+        -------
+        numpy.ndarray
+            The array of timestamps.
+
+        See Also
+        --------
+        :class:`Value`
+        """
+        return np.array([value.timestamp for value in values], dtype=np.float64)
+
+    @staticmethod
+    def from_array(item):
+        """from_array
+
+        Creates the date represented by a timestamp of the array.
+
+        Parameters
+        ----------
+        item :
+            The timestamp
+
+        Returns
+        -------
+        Date
+            The date.
+        """
+        return Date(Date.timestamp_to_date(item))
+
+    @staticmethod
+    def calculate_column_standard_deviation(column):
+        """calculate_column_standard_deviation
+
+        Calculates the standard deviation of the dates stored in the column.
+
+        Parameters
+        ----------
+        column : :class:`Column`
+            The column to calculate the standard deviation
+
+        Returns
+        -------
+        float
+            The standard deviation of the column.
+        """
+        return np.std(column.data)
+
+    @staticmethod
+    def calculate_column_reference_value(column):
+        """calculate_column_reference_value
+
+        Calculates the reference value of the dates stored in the column.
+
+        Parameters
+        ----------
+        column : :class:`Column`
+            The column to calculate the reference value
+
+        Returns
+        -------
+        Date
+            The date reference value.
+        """
+        Date.reference_value = Date.from_array(column.data.min())
+
+        return Date.reference_value
+
+    @staticmethod
+    def calculate_column_centroid(column, rows, **kwargs):
+        """calculate_column_centroid
+
+        Calculates the date that is the centroid of the dates stored in the given rows
+        of the column. It gives the same centroid as calculate_centroid with the list of dates
+
+        Parameters
+        ----------
+        column : :class:`Column`
+            The column storing the dates
+        rows : numpy.ndarray
+            The rows of the dates to calculate its centroid
+
+        **kwargs : optional
+            Additional arguments that the specific attribute type value may need to calculate the centroid
+
+        Returns
+        -------
+        Date
+            The date that is the centroid of the dates in rows.
+        """
+        if constants.EPSILON in kwargs.keys():
+            return Value.calculate_column_centroid(column, rows, **kwargs)
+        # date resulting of the mean of timestamps, summed sequentially as in calculate_mean
+        mean = float(np.cumsum(column.data[rows])[-1]) / len(rows)
+        centroid = Date(Date.timestamp_to_date(mean))
+
+        return centroid
+
+    @staticmethod
+    def calculate_column_centroids(column, rows, labels, **kwargs):
+        """calculate_column_centroids
+
+        Calculates the date centroid of each group of dates stored in the given rows of the column,
+        with grouped sums of timestamps. It gives the same centroids as calculate_column_centroid applied to each group
+
+        Parameters
+        ----------
+        column : :class:`Column`
+            The column storing the dates
+        rows : numpy.ndarray
+            The rows of the dates, grouped
+        labels : numpy.ndarray
+            The group of each row
+
+        **kwargs : optional
+            Additional arguments that the specific attribute type value may need to calculate the centroid
+
+        Returns
+        -------
+        list
+            The list with the centroid of each group.
+        """
+        if constants.EPSILON in kwargs.keys():
+            return Value.calculate_column_centroids(column, rows, labels, **kwargs)
+        # dates resulting of the means of timestamps, bincount sums sequentially as in calculate_mean
+        sums = np.bincount(labels, weights=column.data[rows])
+        counts = np.bincount(labels)
+        centroids = []
+        for total, count in zip(sums.tolist(), counts.tolist()):
+            centroids.append(Date(Date.timestamp_to_date(total / count)))
+
+        return centroids
+
     @staticmethod
     def date_to_timestamp(date):
         date_temp = date.split("/")
@@ -259,6 +404,46 @@ class Date(Value):
         d = datetime.fromtimestamp(timestamp)
         return str(d.day) + "/" + str(d.month) + "/" + str(d.year)
 
+    @staticmethod
+    def calculate_column_mean(column):
+        """calculate_column_mean
+
+        Calculates the mean of the dates stored in the column.
+        The timestamps are added in order (cumulative sum), as in calculate_mean.
+
+        Parameters
+        ----------
+        column : :class:`Column`
+            The column to calculate the mean
+
+        Returns
+        -------
+            The mean of the column.
+        """
+        mean = float(np.cumsum(column.data)[-1] / len(column))
+        return Date.timestamp_to_date(mean)
+
+    @staticmethod
+    def calculate_column_variance(column):
+        """calculate_column_variance
+
+        Calculates the variance of the dates stored in the column.
+        The squared distances to the mean are added in order, as in calculate_variance.
+
+        Parameters
+        ----------
+        column : :class:`Column`
+            The column to calculate the variance
+
+        Returns
+        -------
+        float
+            The variance of the column.
+        """
+        mean = Date(Date.calculate_column_mean(column))
+        partial = column.data - mean.timestamp
+        return float(np.cumsum(partial * partial)[-1] / len(column))
+
     def __eq__(self, other):
         return self.timestamp == other.timestamp
 
@@ -113,7 +113,9 @@ class Datetime(Value):
         max_value = Datetime.datetime_to_timestamp(kwargs[constants.MAX_VALUE])
         min_value = Datetime.datetime_to_timestamp(kwargs[constants.MIN_VALUE])
         scale = (max_value - min_value) / (k * epsilon)
-        dp_centroid = utils.add_laplace_noise(mean, scale, max_value, min_value)
+        dp_centroid = utils.add_laplace_noise(
+            mean, scale, max_value, min_value, kwargs.get(constants.RNG)
+        )
         dp_centroid = Datetime.timestamp_to_datetime(dp_centroid)
         dp_centroid = Datetime(dp_centroid)
 
@@ -254,6 +256,149 @@ class Datetime(Value):
 
         return Datetime.reference_value
 
+    @staticmethod
+    def to_array(values):
+        """to_array
+
+        Converts the list of datetimes received as parameter into the array of their timestamps.
+
+        Parameters
+        ----------
+        values :
+            The list of datetimes to convert
+
+        Returns
+        -------
+        numpy.ndarray
+            The array of timestamps.
+
+        See Also
+        --------
+        :class:`Value`
+        """
+        return np.array([value.timestamp for value in values], dtype=np.float64)
+
+    @staticmethod
+    def from_array(item):
+        """from_array
+
+        Creates the datetime represented by a timestamp of the array.
+
+        Parameters
+        ----------
+        item :
+            The timestamp
+
+        Returns
+        -------
+        Datetime
+            The datetime.
+        """
+        return Datetime(Datetime.timestamp_to_datetime(item))
+
+    @staticmethod
+    def calculate_column_standard_deviation(column):
+        """calculate_column_standard_deviation
+
+        Calculates the standard deviation of the datetimes stored in the column.
+
+        Parameters
+        ----------
+        column : :class:`Column`
+            The column to calculate the standard deviation
+
+        Returns
+        -------
+        float
+            The standard deviation of the column.
+        """
+        return np.std(column.data)
+
+    @staticmethod
+    def calculate_column_reference_value(column):
+        """calculate_column_reference_value
+
+        Calculates the reference value of the datetimes stored in the column.
+
+        Parameters
+        ----------
+        column : :class:`Column`
+            The column to calculate the reference value
+
+        Returns
+        -------
+        Datetime
+            The datetime reference value.
+        """
+        Datetime.reference_value = Datetime.from_array(column.data.min())
+
+        return Datetime.reference_value
+
+    @staticmethod
+    def calculate_column_centroid(column, rows, **kwargs):
+        """calculate_column_centroid
+
+        Calculates the datetime that is the centroid of the datetimes stored in the given rows
+        of the column. It gives the same centroid as calculate_centroid with the list of datetimes
+
+        Parameters
+        ----------
+        column : :class:`Column`
+            The column storing the datetimes
+        rows : numpy.ndarray
+            The rows of the datetimes to calculate its centroid
+
+        **kwargs : optional
+            Additional arguments that the specific attribute type value may need to calculate the centroid
+
+        Returns
+        -------
+        Datetime
+            The datetime that is the centroid of the datetimes in rows.
+        """
+        if constants.EPSILON in kwargs.keys():
+            return Value.calculate_column_centroid(column, rows, **kwargs)
+        # datetime resulting of the mean of timestamps, summed sequentially as in calculate_mean
+        mean = float(np.cumsum(column.data[rows])[-1]) / len(rows)
+        centroid = Datetime(Datetime.timestamp_to_datetime(mean))
+
+        return centroid
+
+    @staticmethod
+    def calculate_column_centroids(column, rows, labels, **kwargs):
+        """calculate_column_centroids
+
+        Calculates the datetime centroid of each group of datetimes stored in the given rows of the column,
+        with grouped sums of timestamps. It gives the same centroids as calculate_column_centroid applied to each group
+
+        Parameters
+        ----------
+        column : :class:`Column`
+            The column storing the datetimes
+        rows : numpy.ndarray
+            The rows of the datetimes, grouped
+        labels : numpy.ndarray
+            The group of each row
+
+        **kwargs : optional
+            Additional arguments that the specific attribute type value may need to calculate the centroid
+
+        Returns
+        -------
+        list
+            The list with the centroid of each group.
+        """
+        if constants.EPSILON in kwargs.keys():
+            return Value.calculate_column_centroids(column, rows, labels, **kwargs)
+        # datetimes resulting of the means of timestamps, bincount sums sequentially as in calculate_mean
+        sums = np.bincount(labels, weights=column.data[rows])
+        counts = np.bincount(labels)
+        centroids = []
+        for total, count in zip(sums.tolist(), counts.tolist()):
+            centroids.append(Datetime(Datetime.timestamp_to_datetime(total / count)))
+
+        return centroids
+
     @staticmethod
     def datetime_to_timestamp(date):
         date = datetime.fromisoformat(date)
@@ -264,6 +409,46 @@ class Datetime(Value):
         d = datetime.fromtimestamp(timestamp)
         return str(d)
 
+    @staticmethod
+    def calculate_column_mean(column):
+        """calculate_column_mean
+
+        Calculates the mean of the datetimes stored in the column.
+        The timestamps are added in order (cumulative sum), as in calculate_mean.
+
+        Parameters
+        ----------
+        column : :class:`Column`
+            The column to calculate the mean
+
+        Returns
+        -------
+            The mean of the column.
+        """
+        mean = float(np.cumsum(column.data)[-1] / len(column))
+        return Datetime.timestamp_to_datetime(mean)
+
+    @staticmethod
+    def calculate_column_variance(column):
+        """calculate_column_variance
+
+        Calculates the variance of the datetimes stored in the column.
+        The squared distances to the mean are added in order, as in calculate_variance.
+
+        Parameters
+        ----------
+        column : :class:`Column`
+            The column to calculate the variance
+
+        Returns
+        -------
+        float
+            The variance of the column.
+        """
+        mean = Datetime(Datetime.calculate_column_mean(column))
+        partial = column.data - mean.timestamp
+        return float(np.cumsum(partial * partial)[-1] / len(column))
+
     def __eq__(self, other):
         return self.timestamp == other.timestamp
 
@@ -113,7 +113,9 @@ class Numerical_continuous(Value):
         max_value = float(kwargs[constants.MAX_VALUE])
         min_value = float(kwargs[constants.MIN_VALUE])
         scale = (max_value - min_value) / (k * epsilon)
-        dp_centroid = utils.add_laplace_noise(mean, scale, max_value, min_value)
+        dp_centroid = utils.add_laplace_noise(
+            mean, scale, max_value, min_value, kwargs.get(constants.RNG)
+        )
         dp_centroid = round(dp_centroid, Numerical_continuous.decimals)
         dp_centroid = Numerical_continuous(str(dp_centroid))
 
@@ -260,6 +262,232 @@ class Numerical_continuous(Value):
 
         return Numerical_continuous.reference_value
 
+    @staticmethod
+    def to_array(values):
+        """to_array
+
+        Converts the list of numerical continuous values received as parameter into a float array.
+
+        Parameters
+        ----------
+        values :
+            The list of numerical continuous values to convert
+
+        Returns
+        -------
+        numpy.ndarray
+            The array of numerical continuous values.
+
+        See Also
+        --------
+        :class:`Value`
+        """
+        return np.array([value.value for value in values], dtype=np.float64)
+
+    @staticmethod
+    def from_array(item):
+        """from_array
+
+        Creates the numerical continuous value represented by an item of the float array.
+
+        Parameters
+        ----------
+        item :
+            The item of the float array
+
+        Returns
+        -------
+        Numerical_continuous
+            The numerical continuous value.
+        """
+        return Numerical_continuous(item)
+
+    @staticmethod
+    def calculate_column_standard_deviation(column):
+        """calculate_column_standard_deviation
+
+        Calculates the standard deviation of the numerical continuous values stored in the column.
+
+        Parameters
+        ----------
+        column : :class:`Column`
+            The column to calculate the standard deviation
+
+        Returns
+        -------
+        float
+            The standard deviation of the column.
+        """
+        return np.std(column.data)
+
+    @staticmethod
+    def calculate_column_reference_value(column):
+        """calculate_column_reference_value
+
+        Calculates the reference value of the numerical continuous values stored in the column.
+
+        Parameters
+        ----------
+        column : :class:`Column`
+            The column to calculate the reference value
+
+        Returns
+        -------
+        Numerical_continuous
+            The numerical continuous reference value.
+        """
+        Numerical_continuous.reference_value = Numerical_continuous.from_array(
+            column.data.min()
+        )
+
+        return Numerical_continuous.reference_value
+
+    @staticmethod
+    def calculate_column_centroid(column, rows, **kwargs):
+        """calculate_column_centroid
+
+        Calculates the numerical continuous that is the centroid of the values stored in the given rows
+        of the column. It gives the same centroid as calculate_centroid with the list of values
+
+        Parameters
+        ----------
+        column : :class:`Column`
+            The column storing the numerical continuous values
+        rows : numpy.ndarray
+            The rows of the values to calculate its centroid
+
+        **kwargs : optional
+            Additional arguments that the specific attribute type value may need to calculate the centroid
+
+        Returns
+        -------
+        Numerical_continuous
+            The value that is the centroid of the values in rows.
+        """
+        if constants.EPSILON in kwargs.keys():
+            return Value.calculate_column_centroid(column, rows, **kwargs)
+        # Avoiding unnecessary decimals, the number of decimals of each row is calculated only once
+        decimals = Numerical_continuous.calculate_column_decimals(column)
+        Numerical_continuous.decimals = int(decimals[rows].max())
+        # mean, summed sequentially as in calculate_mean
+        mean = float(np.cumsum(column.data[rows])[-1]) / len(rows)
+        mean = round(mean, Numerical_continuous.decimals)
+        centroid = Numerical_continuous(str(mean))
+
+        return centroid
+
+    @staticmethod
+    def calculate_column_centroids(column, rows, labels, **kwargs):
+        """calculate_column_centroids
+
+        Calculates the numerical continuous centroid of each group of values stored in the given rows of the column,
+        with grouped sums. It gives the same centroids as calculate_column_centroid applied to each group
+
+        Parameters
+        ----------
+        column : :class:`Column`
+            The column storing the numerical continuous values
+        rows : numpy.ndarray
+            The rows of the values, grouped
+        labels : numpy.ndarray
+            The group of each row
+
+        **kwargs : optional
+            Additional arguments that the specific attribute type value may need to calculate the centroid
+
+        Returns
+        -------
+        list
+            The list with the centroid of each group.
+        """
+        if constants.EPSILON in kwargs.keys():
+            return Value.calculate_column_centroids(column, rows, labels, **kwargs)
+        decimals = np.maximum.reduceat(
+            Numerical_continuous.calculate_column_decimals(column)[rows],
+            Value.group_starts(labels),
+        )
+        # means, bincount sums sequentially as in calculate_mean
+        sums = np.bincount(labels, weights=column.data[rows])
+        counts = np.bincount(labels)
+        centroids = []
+        for total, count, number_decimals in zip(
+            sums.tolist(), counts.tolist(), decimals.tolist()
+        ):
+            mean = round(total / count, number_decimals)
+            centroids.append(Numerical_continuous(str(mean)))
+        Numerical_continuous.decimals = int(decimals[-1])
+
+        return centroids
+
+    @staticmethod
+    def calculate_column_decimals(column):
+        """calculate_column_decimals
+
+        Calculates the number of decimals of each numerical continuous value stored in the column.
+        They are calculated only once per distinct value and kept in the cache of the column
+
+        Parameters
+        ----------
+        column : :class:`Column`
+            The column storing the numerical continuous values
+
+        Returns
+        -------
+        numpy.ndarray
+            The number of decimals of each value.
+        """
+        if "decimals" not in column.cache:
+            uniques, inverse = np.unique(column.data, return_inverse=True)
+            decimals = [
+                Numerical_continuous.calculate_max_number_decimals(
+                    [Numerical_continuous(unique)]
+                )
+                for unique in uniques
+            ]
+            column.cache["decimals"] = np.array(decimals)[inverse]
+
+        return column.cache["decimals"]
+
+    @staticmethod
+    def calculate_column_mean(column):
+        """calculate_column_mean
+
+        Calculates the mean of the numerical continuous values stored in the column.
+        The values are added in order (cumulative sum), as in calculate_mean.
+
+        Parameters
+        ----------
+        column : :class:`Column`
+            The column to calculate the mean
+
+        Returns
+        -------
+        float
+            The mean of the column.
+        """
+        return float(np.cumsum(column.data)[-1] / len(column))
+
+    @staticmethod
+    def calculate_column_variance(column):
+        """calculate_column_variance
+
+        Calculates the variance of the numerical continuous values stored in the column.
+        The squared distances to the mean are added in order, as in calculate_variance.
+
+        Parameters
+        ----------
+        column : :class:`Column`
+            The column to calculate the variance
+
+        Returns
+        -------
+        float
+            The variance of the column.
+        """
+        mean = Numerical_continuous.calculate_column_mean(column)
+        partial = column.data - mean
+        return float(np.cumsum(partial * partial)[-1] / len(column))
+
     def __eq__(self, other):
         return self.value == other.value
 
@@ -105,7 +105,9 @@ class Numerical_discrete(Value):
         max_value = int(np.rint(float(kwargs[constants.MAX_VALUE])))
         min_value = int(np.rint(float(kwargs[constants.MIN_VALUE])))
         scale = (max_value - min_value) / (k * epsilon)
-        dp_centroid = utils.add_laplace_noise(mean, scale, max_value, min_value)
+        dp_centroid = utils.add_laplace_noise(
+            mean, scale, max_value, min_value, kwargs.get(constants.RNG)
+        )
         dp_centroid = Numerical_discrete(str(round(dp_centroid)))
 
         return dp_centroid
@@ -240,6 +242,194 @@ class Numerical_discrete(Value):
 
         return Numerical_discrete.reference_value
 
+    @staticmethod
+    def to_array(values):
+        """to_array
+
+        Converts the list of numerical discrete values received as parameter into an integer array.
+
+        Parameters
+        ----------
+        values :
+            The list of numerical discrete values to convert
+
+        Returns
+        -------
+        numpy.ndarray
+            The array of numerical discrete values.
+
+        See Also
+        --------
+        :class:`Value`
+        """
+        return np.array([value.value for value in values], dtype=np.int64)
+
+    @staticmethod
+    def from_array(item):
+        """from_array
+
+        Creates the numerical discrete value represented by an item of the integer array.
+
+        Parameters
+        ----------
+        item :
+            The item of the integer array
+
+        Returns
+        -------
+        Numerical_discrete
+            The numerical discrete value.
+        """
+        return Numerical_discrete(item)
+
+    @staticmethod
+    def calculate_column_standard_deviation(column):
+        """calculate_column_standard_deviation
+
+        Calculates the standard deviation of the numerical discrete values stored in the column.
+
+        Parameters
+        ----------
+        column : :class:`Column`
+            The column to calculate the standard deviation
+
+        Returns
+        -------
+        float
+            The standard deviation of the column.
+        """
+        return np.std(column.data)
+
+    @staticmethod
+    def calculate_column_reference_value(column):
+        """calculate_column_reference_value
+
+        Calculates the reference value of the numerical discrete values stored in the column.
+
+        Parameters
+        ----------
+        column : :class:`Column`
+            The column to calculate the reference value
+
+        Returns
+        -------
+        Numerical_discrete
+            The numerical discrete reference value.
+        """
+        Numerical_discrete.reference_value = Numerical_discrete.from_array(
+            column.data.min()
+        )
+
+        return Numerical_discrete.reference_value
+
+    @staticmethod
+    def calculate_column_centroid(column, rows, **kwargs):
+        """calculate_column_centroid
+
+        Calculates the numerical discrete that is the centroid of the values stored in the given rows
+        of the column. It gives the same centroid as calculate_centroid with the list of values
+
+        Parameters
+        ----------
+        column : :class:`Column`
+            The column storing the numerical discrete values
+        rows : numpy.ndarray
+            The rows of the values to calculate its centroid
+
+        **kwargs : optional
+            Additional arguments that the specific attribute type value may need to calculate the centroid
+
+        Returns
+        -------
+        Numerical_discrete
+            The value that is the centroid of the values in rows.
+        """
+        if constants.EPSILON in kwargs.keys():
+            return Value.calculate_column_centroid(column, rows, **kwargs)
+        # mean
+        mean = int(column.data[rows].sum()) / len(rows)
+        centroid = Numerical_discrete(str(round(mean)))
+
+        return centroid
+
+    @staticmethod
+    def calculate_column_centroids(column, rows, labels, **kwargs):
+        """calculate_column_centroids
+
+        Calculates the numerical discrete centroid of each group of values stored in the given rows of the column,
+        with grouped sums. It gives the same centroids as calculate_column_centroid applied to each group
+
+        Parameters
+        ----------
+        column : :class:`Column`
+            The column storing the numerical discrete values
+        rows : numpy.ndarray
+            The rows of the values, grouped
+        labels : numpy.ndarray
+            The group of each row
+
+        **kwargs : optional
+            Additional arguments that the specific attribute type value may need to calculate the centroid
+
+        Returns
+        -------
+        list
+            The list with the centroid of each group.
+        """
+        if constants.EPSILON in kwargs.keys():
+            return Value.calculate_column_centroids(column, rows, labels, **kwargs)
+        # means
+        sums = np.add.reduceat(column.data[rows], Value.group_starts(labels))
+        counts = np.bincount(labels)
+        centroids = []
+        for total, count in zip(sums.tolist(), counts.tolist()):
+            centroids.append(Numerical_discrete(str(round(total / count))))
+
+        return centroids
+
+    @staticmethod
+    def calculate_column_mean(column):
+        """calculate_column_mean
+
+        Calculates the mean of the numerical discrete values stored in the column.
+
+        Parameters
+        ----------
+        column : :class:`Column`
+            The column to calculate the mean
+
+        Returns
+        -------
+        float
+            The mean of the column.
+        """
+        return int(column.data.sum()) / len(column)
+
+    @staticmethod
+    def calculate_column_variance(column):
+        """calculate_column_variance
+
+        Calculates the variance of the numerical discrete values stored in the column.
+        The squared distances to the (rounded) mean are added as integers, as in calculate_variance.
+        If they may overflow the integer array, the values are materialized.
+
+        Parameters
+        ----------
+        column : :class:`Column`
+            The column to calculate the variance
+
+        Returns
+        -------
+        float
+            The variance of the column.
+        """
+        mean = round(Numerical_discrete.calculate_column_mean(column))
+        partial = column.data - mean
+        maximum = int(np.abs(partial).max())
+        if maximum * maximum * len(column) >= 2**63:
+            return Value.calculate_column_variance(column)
+        return int((partial * partial).sum()) / len(column)
+
     def __eq__(self, other):
         return self.value == other.value
 
@@ -115,7 +115,9 @@ class Plain_categorical(Value):
         scale = (max_value - min_value) / (k * epsilon)
         rankings = [value.rank for value in values]
         mean_ranking = sum(rankings) / len(rankings)
-        dp_rank = utils.add_laplace_noise(mean_ranking, scale, max_value, min_value)
+        dp_rank = utils.add_laplace_noise(
+            mean_ranking, scale, max_value, min_value, kwargs.get(constants.RNG)
+        )
         dp_rank = np.rint(dp_rank)
         centroid = Plain_categorical.rank_values[dp_rank]
 
@@ -255,6 +257,213 @@ class Plain_categorical(Value):
 
         return Plain_categorical.reference_value
 
+    @staticmethod
+    def calculate_column_standard_deviation(column):
+        """calculate_column_standard_deviation
+
+        Calculates the standard deviation of the plain categorical values stored in the column.
+        As calculate_standard_deviation, it ranks the categories by frequency
+
+        Parameters
+        ----------
+        column : :class:`Column`
+            The column to calculate the standard deviation
+
+        Returns
+        -------
+        float
+            The standard deviation of the column, in this case 0.5.
+        """
+        Plain_categorical.rank_values = {}
+        counts = np.bincount(column.codes, minlength=len(column.categories))
+        order = np.argsort(-counts, kind="stable")
+        order = order[counts[order] > 0]
+        for rank, code in enumerate(order):
+            category = column.categories[code]
+            category.rank = rank + 1
+            Plain_categorical.rank_values[rank + 1] = category.value
+        return 0.5
+
+    @staticmethod
+    def calculate_column_reference_value(column):
+        """calculate_column_reference_value
+
+        Calculates the reference value of the plain categorical values stored in the column,
+        the most common value.
+
+        Parameters
+        ----------
+        column : :class:`Column`
+            The column to calculate the reference value
+
+        Returns
+        -------
+        Plain_categorical
+            The plain categorical reference value.
+        """
+        counts = np.bincount(column.codes, minlength=len(column.categories))
+        Plain_categorical.reference_value = column.categories[np.argmax(counts)]
+
+        return Plain_categorical.reference_value
+
+    @staticmethod
+    def calculate_column_centroid(column, rows, **kwargs):
+        """calculate_column_centroid
+
+        Calculates the plain categorical value that is the centroid of the values stored in the given rows
+        of the column. It gives the same centroid as calculate_centroid with the list of values,
+        the most common value (in case of tie, the first one appearing)
+
+        Parameters
+        ----------
+        column : :class:`Column`
+            The column storing the plain categorical values
+        rows : numpy.ndarray
+            The rows of the values to calculate its centroid
+
+        **kwargs : optional
+            Additional arguments that the specific attribute type value may need to calculate the centroid
+
+        Returns
+        -------
+        Plain categorical
+            The value that is the centroid of the values in rows.
+        """
+        if constants.EPSILON in kwargs.keys():
+            return Value.calculate_column_centroid(column, rows, **kwargs)
+        # mode
+        codes, first_rows, counts = np.unique(
+            column.codes[rows], return_index=True, return_counts=True
+        )
+        candidates = np.flatnonzero(counts == counts.max())
+        code = codes[candidates[np.argmin(first_rows[candidates])]]
+
+        return Plain_categorical(column.categories[code].value)
+
+    @staticmethod
+    def calculate_column_centroids(column, rows, labels, **kwargs):
+        """calculate_column_centroids
+
+        Calculates the plain categorical centroid of each group of values stored in the given rows of the column,
+        the most common value of the group (in case of tie, the first one appearing), with grouped counts.
+        It gives the same centroids as calculate_column_centroid applied to each group
+
+        Parameters
+        ----------
+        column : :class:`Column`
+            The column storing the plain categorical values
+        rows : numpy.ndarray
+            The rows of the values, grouped
+        labels : numpy.ndarray
+            The group of each row
+
+        **kwargs : optional
+            Additional arguments that the specific attribute type value may need to calculate the centroid
+
+        Returns
+        -------
+        list
+            The list with the centroid of each group.
+        """
+        if constants.EPSILON in kwargs.keys():
+            return Value.calculate_column_centroids(column, rows, labels, **kwargs)
+        # modes, counting the pairs (group, code)
+        num_categories = len(column.categories)
+        keys = labels.astype(np.int64) * num_categories + column.codes[rows]
+        keys, first_positions, counts = np.unique(
+            keys, return_index=True, return_counts=True
+        )
+        groups = keys // num_categories
+        # for each group, the most common code and, in case of tie, the first one appearing
+        order = np.lexsort((first_positions, -counts, groups))
+        firsts = order[Value.group_starts(groups[order])]
+        centroids = []
+        for code in (keys[firsts] % num_categories).tolist():
+            centroids.append(Plain_categorical(column.categories[code].value))
+
+        return centroids
+
+    @staticmethod
+    def embed_columns(columns):
+        """embed_columns
+
+        Maps the plain categorical values stored in the given columns to the vertices of a simplex:
+        each distinct value is a one-hot vector scaled so that two different values are at distance 1.
+        The simplex needs a dimension per distinct value, so the values are not embedded if there are more than
+        constants.MAX_EMBEDDED_CATEGORIES
+
+        Parameters
+        ----------
+        columns : list
+            The list of columns (:class:`Column`) storing the plain categorical values
+
+        Returns
+        -------
+        list
+            The list of two dimensional numpy arrays with the points of each column,
+            or None if there are too many distinct values.
+        """
+        positions = {}
+        for column in columns:
+            for category in column.categories:
+                positions.setdefault(category.value, len(positions))
+        if len(positions) > constants.MAX_EMBEDDED_CATEGORIES:
+            return None
+        identity = np.eye(len(positions)) / np.sqrt(2)
+        points = []
+        for column in columns:
+            codes = [positions[category.value] for category in column.categories]
+            points.append(identity[np.array(codes)[column.codes]])
+
+        return points
+
+    @staticmethod
+    def calculate_column_mean(column):
+        """calculate_column_mean
+
+        Calculates the mean of the plain categorical values stored in the column, the most common one.
+        As in calculate_mean, the ties are resolved in favour of the value that appears first.
+
+        Parameters
+        ----------
+        column : :class:`Column`
+            The column to calculate the mean
+
+        Returns
+        -------
+        Plain_categorical
+            The mean of the column.
+        """
+        codes, first_rows, counts = np.unique(
+            column.codes, return_index=True, return_counts=True
+        )
+        most_common = np.flatnonzero(counts == counts.max())
+        code = codes[most_common[np.argmin(first_rows[most_common])]]
+        return column.categories[code]
+
+    @staticmethod
+    def calculate_column_variance(column):
+        """calculate_column_variance
+
+        Calculates the variance of the plain categorical values stored in the column.
+        The distance to the mean is 0 or 1, so the variance is the ratio of values different from the mean.
+
+        Parameters
+        ----------
+        column : :class:`Column`
+            The column to calculate the variance
+
+        Returns
+        -------
+        float
+            The variance of the column.
+        """
+        mean = Plain_categorical.calculate_column_mean(column)
+        different = np.array(
+            [category.value != mean.value for category in column.categories]
+        )
+        return int(np.count_nonzero(different[column.codes])) / len(column)
+
     def __eq__(self, value):
         return self.value == value.value
 
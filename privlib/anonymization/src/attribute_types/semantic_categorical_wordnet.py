@@ -1,8 +1,10 @@
 from privlib.anonymization.src.attribute_types.value import Value
 from privlib.anonymization.src.utils import constants
+from privlib.anonymization.src.utils.wordnet_similarity import Wordnet_similarity
 import nltk
 from nltk.corpus import wordnet
 from random import sample
+import numpy as np
 
 
 class Semantic_categorical_wordnet(Value):
@@ -13,7 +15,6 @@ class Semantic_categorical_wordnet(Value):
     """
 
     reference_value = None
-    sims_wp = {}
     try:
         nltk.find("corpora/wordnet")
     except LookupError:
@@ -82,26 +83,12 @@ class Semantic_categorical_wordnet(Value):
         float
             The similarity between the two semantic categorical values in wordnet ontology.
             The values are disambiguated as the synsets with the maximum similarity in wordnet
-        """
-        key = word1 + "," + word2
-        if key in Semantic_categorical_wordnet.sims_wp:
-            return Semantic_categorical_wordnet.sims_wp[key]
-        else:
-            key = word2 + "," + word1
-            if key in Semantic_categorical_wordnet.sims_wp:
-                return Semantic_categorical_wordnet.sims_wp[key]
-
-        syns1 = wordnet.synsets(word1, pos="n")
-        syns2 = wordnet.synsets(word2, pos="n")
-        max_sim = 0
-        for syn1 in syns1:
-            for syn2 in syns2:
-                sim = syn1.wup_similarity(syn2)
-                if sim > max_sim:
-                    max_sim = sim
-        Semantic_categorical_wordnet.sims_wp[key] = max_sim
 
-        return max_sim
+        See Also
+        --------
+        :class:`Wordnet_similarity`
+        """
+        return Wordnet_similarity.word_similarity(word1, word2)
 
     @staticmethod
     def similarity_wp_word_syn(word, syn):
@@ -126,7 +113,7 @@ class Semantic_categorical_wordnet(Value):
         syns_word = wordnet.synsets(word, pos="n")
         max_sim = 0
         for syn_word in syns_word:
-            sim = syn_word.wup_similarity(syn)
+            sim = Wordnet_similarity.synset_similarity(syn_word, syn)
             if sim > max_sim:
                 max_sim = sim
 
@@ -153,11 +140,41 @@ class Semantic_categorical_wordnet(Value):
         """
         mean = 0
         for syn2 in list_syns:
-            mean += syn.wup_similarity(syn2)
+            mean += Wordnet_similarity.synset_similarity(syn, syn2)
         mean /= len(list_syns)
 
         return mean
 
+    @staticmethod
+    def load_similarity_matrix(values, cache_dir=None, n_jobs=1):
+        """load_similarity_matrix
+
+        Loads the similarity matrix between the distinct semantic categorical values received as parameter,
+        so the similarities are not recalculated by distance. The matrix is calculated (optionally in parallel)
+        and stored on disk the first time, after that it is memory-mapped from disk.
+
+        Parameters
+        ----------
+        values :
+            The list of semantic categorical values (or the words) of the vocabulary
+        cache_dir : str
+            Optional, the directory to store the matrix, by default SIMILARITY_CACHE_DIR in constants
+        n_jobs : int
+            The number of processes used to calculate the similarities the first time
+
+        Returns
+        -------
+        numpy.ndarray
+            The similarity matrix, or None if the vocabulary is too large.
+
+        See Also
+        --------
+        :class:`Wordnet_similarity`
+        """
+        words = [value if isinstance(value, str) else value.value for value in values]
+
+        return Wordnet_similarity.load_matrix(words, cache_dir, n_jobs)
+
     @staticmethod
     def calculate_centroid(values, **kwargs):
         """calculate_centroid
@@ -173,7 +190,8 @@ class Semantic_categorical_wordnet(Value):
             The list of semantic categorical values to calculate its centroid
 
         **kwargs : optional
-            Additional arguments that the specific attribute type value may need to calculate the centroid
+            Additional arguments that the specific attribute type value may need to calculate the centroid.
+            If fast_centroid (FAST_CENTROID in constants) is True, the centroid is found by calculate_fast_centroid
 
         Returns
         -------
@@ -185,6 +203,8 @@ class Semantic_categorical_wordnet(Value):
                 values, **kwargs
             )
             return centroid
+        if kwargs.get(constants.FAST_CENTROID, False):
+            return Semantic_categorical_wordnet.calculate_fast_centroid(values)
         # centroid that maximizes similarity
         candidates = set()
         for value in values:
@@ -192,7 +212,7 @@ class Semantic_categorical_wordnet(Value):
                 for parents in syn.hypernym_paths():
                     for parent in parents:
                         candidates.add(parent)
-        syn_max = sample(candidates, 1)[0]
+        syn_max = sample(list(candidates), 1)[0]
         max_sim = Semantic_categorical_wordnet.mean_similarity_wp(syn_max, candidates)
         for syn in candidates:
             sim = Semantic_categorical_wordnet.mean_similarity_wp(syn, candidates)
@@ -204,6 +224,83 @@ class Semantic_categorical_wordnet(Value):
 
         return centroid
 
+    @staticmethod
+    def calculate_fast_centroid(values, counts=None):
+        """calculate_fast_centroid
+
+        Calculates the semantic categorical value that is the centroid of the list of semantic categorical values
+        given as parameter. The candidates are the parents in wordnet of the values (as in calculate_centroid),
+        but each candidate is scored by its similarity to the values (weighted by their counts)
+        instead of to all the other candidates.
+        The candidates that are parents of more values, and deeper in wordnet, are scored first, and a candidate
+        is discarded as soon as it can not beat the best one. Ties are resolved in favour of the candidate found
+        first in the values.
+        It is used by calculate_centroid if its fast_centroid argument is True.
+
+        Parameters
+        ----------
+        values :
+            The list of semantic categorical values to calculate its centroid
+        counts : list
+            Optional, the number of occurrences of each value, if it is omitted, the repeated values are counted
+
+        Returns
+        -------
+        Semantic_categorical_wordnet
+            The value that is the centroid of the list of semantic categorical values.
+        """
+        if counts is None:
+            counts = [1] * len(values)
+        words = {}
+        for value, count in zip(values, counts):
+            words[value.value] = words.get(value.value, 0) + count
+        counts = list(words.values())
+        syns_words = [wordnet.synsets(word, pos="n") for word in words]
+        # candidates in order of appearance, with the total count of the values they are parent of
+        candidates = {}
+        for syns_word, count in zip(syns_words, counts):
+            parents_word = set()
+            for syn in syns_word:
+                for parents in syn.hypernym_paths():
+                    for parent in parents:
+                        if parent not in candidates:
+                            candidates[parent] = 0
+                        parents_word.add(parent)
+            for parent in parents_word:
+                candidates[parent] += count
+        candidates = list(candidates.items())
+        order = sorted(
+            range(len(candidates)),
+            key=lambda i: (-candidates[i][1], -candidates[i][0].max_depth(), i),
+        )
+        total = sum(counts)
+        max_sim = -1
+        max_index = None
+        for i in order:
+            syn = candidates[i][0]
+            sim = 0
+            remaining = total
+            for syns_word, count in zip(syns_words, counts):
+                sim_word = 0
+                for syn_word in syns_word:
+                    partial = Wordnet_similarity.synset_similarity(syn_word, syn)
+                    if partial > sim_word:
+                        sim_word = partial
+                sim += count * sim_word
+                remaining -= count
+                # the similarity of each remaining value is at most 1
+                if sim + remaining < max_sim:
+                    break
+            else:
+                if sim > max_sim or (sim == max_sim and i < max_index):
+                    max_sim = sim
+                    max_index = i
+        syn_max = candidates[max_index][0]
+        centroid = Semantic_categorical_wordnet(syn_max.lemmas()[0].name())
+        centroid.syn = syn_max
+
+        return centroid
+
     @staticmethod
     def calculate_dp_centroid(values, **kwargs):
         """calculate_centroid
@@ -350,6 +447,119 @@ class Semantic_categorical_wordnet(Value):
 
         return Semantic_categorical_wordnet.reference_value
 
+    @staticmethod
+    def calculate_column_standard_deviation(column):
+        """calculate_column_standard_deviation
+
+        Calculates the standard deviation of the semantic categorical values stored in the column.
+
+        Parameters
+        ----------
+        column : :class:`Column`
+            The column to calculate the standard deviation
+
+        Returns
+        -------
+        float
+            The standard deviation of the column, in this case 0.5.
+        """
+        return 0.5
+
+    @staticmethod
+    def calculate_column_reference_value(column):
+        """calculate_column_reference_value
+
+        Calculates the reference value of the semantic categorical values stored in the column.
+        As in calculate_reference_value, it is the root of the wordnet ontology (entity synset).
+
+        Parameters
+        ----------
+        column : :class:`Column`
+            The column to calculate the reference value
+
+        Returns
+        -------
+        Semantic_categorical_wordnet
+            The semantic categorical reference value.
+        """
+        return Semantic_categorical_wordnet.calculate_reference_value(None)
+
+    @staticmethod
+    def calculate_column_centroid(column, rows, **kwargs):
+        """calculate_column_centroid
+
+        Calculates the semantic categorical value that is the centroid of the values stored in the given rows
+        of the column. The candidates only depend on the distinct values, so each one is taken once.
+
+        Parameters
+        ----------
+        column : :class:`Column`
+            The column storing the semantic categorical values
+        rows : numpy.ndarray
+            The rows of the values to calculate its centroid
+
+        **kwargs : optional
+            Additional arguments that the specific attribute type value may need to calculate the centroid
+
+        Returns
+        -------
+        Semantic_categorical_wordnet
+            The value that is the centroid of the values in rows.
+        """
+        codes, counts = np.unique(column.codes[rows], return_counts=True)
+        values = [column.categories[code] for code in codes]
+        if (
+            kwargs.get(constants.FAST_CENTROID, False)
+            and constants.EPSILON not in kwargs.keys()
+        ):
+            return Semantic_categorical_wordnet.calculate_fast_centroid(values, counts)
+
+        return Semantic_categorical_wordnet.calculate_centroid(values, **kwargs)
+
+    @staticmethod
+    def calculate_column_mean(column):
+        """calculate_column_mean
+
+        Calculates the mean of the semantic categorical values stored in the column, that is their centroid
+
+        Parameters
+        ----------
+        column : :class:`Column`
+            The column to calculate the mean
+
+        Returns
+        -------
+        Semantic_categorical_wordnet
+            The mean of the column.
+        """
+        return column.calculate_centroid(np.arange(len(column)))
+
+    @staticmethod
+    def calculate_column_variance(column):
+        """calculate_column_variance
+
+        Calculates the variance of the semantic categorical values stored in the column.
+        The similarity to the mean is calculated once per category.
+
+        Parameters
+        ----------
+        column : :class:`Column`
+            The column to calculate the variance
+
+        Returns
+        -------
+        float
+            The variance of the column.
+        """
+        mean = Semantic_categorical_wordnet.calculate_column_mean(column)
+        table = np.zeros(len(column.categories))
+        for code in np.unique(column.codes):
+            table[code] = Semantic_categorical_wordnet.similarity_wp_word_syn(
+                column.categories[code].value, mean.syn
+            )
+        partial = table[column.codes]
+        return float(np.cumsum(partial * partial)[-1] / len(column))
+
     def __eq__(self, other):
         return self.value == other.value
 
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+import numpy as np
 
 
 class Value(ABC):
@@ -162,3 +163,277 @@ class Value(ABC):
             The reference value.
         """
         pass
+
+    @staticmethod
+    def to_array(values):
+        """to_array
+
+        Converts the list of values received as parameter into the numerical array stored in a
+        :class:`Column` of the columnar store. Attribute types without a numerical representation
+        return None, and they are stored as integer codes of their distinct values.
+
+        Parameters
+        ----------
+        values :
+            The list of values to convert
+
+        Returns
+        -------
+        numpy.ndarray
+            The numerical array representing the list of values, or None.
+        """
+        return None
+
+    @staticmethod
+    def from_array(item):
+        """from_array
+
+        Creates the value represented by an item of the numerical array returned by to_array.
+        It is only called for attribute types implementing to_array.
+
+        Parameters
+        ----------
+        item :
+            The item of the numerical array
+
+        Returns
+        -------
+        Value
+            The value represented by the item.
+        """
+        raise NotImplementedError("The attribute type is not stored as an array")
+
+    @staticmethod
+    def distance_array(data, item):
+        """distance_array
+
+        Calculates the distances between each item of the numerical array data and the given item.
+        It is equivalent to call distance on each value represented in data.
+
+        Parameters
+        ----------
+        data :
+            The numerical array returned by to_array
+        item :
+            The item representing the other value to calculate the distance
+
+        Returns
+        -------
+        numpy.ndarray
+            The distances between each item in data and the given item.
+        """
+        return data - item
+
+    @staticmethod
+    def paired_distance_array(data, other_data):
+        """paired_distance_array
+
+        Calculates the distance between each item of the numerical array data and the item in the same position
+        of the numerical array other_data. It is equivalent to call distance on each pair of values.
+
+        Parameters
+        ----------
+        data :
+            The numerical array returned by to_array
+        other_data :
+            The numerical array of the other values, of the same length
+
+        Returns
+        -------
+        numpy.ndarray
+            The distances between each pair of items.
+        """
+        return data - other_data
+
+    @staticmethod
+    def embed_columns(columns):
+        """embed_columns
+
+        Maps the values stored in the given columns (of the same attribute) to points in a common Euclidean space,
+        so that the Euclidean distance between two points is the distance between the values they represent.
+        By default, the numerical arrays returned by to_array are taken as points.
+        Attribute types whose distance can not be embedded return None.
+
+        Parameters
+        ----------
+        columns : list
+            The list of columns (:class:`Column`) storing the values of the attribute
+
+        Returns
+        -------
+        list
+            The list of two dimensional numpy arrays with the points of each column, or None.
+        """
+        if any(column.is_coded() for column in columns):
+            return None
+
+        return [
+            column.data.reshape(len(column), -1).astype(np.float64)
+            for column in columns
+        ]
+
+    @staticmethod
+    def calculate_column_standard_deviation(column):
+        """calculate_column_standard_deviation
+
+        Calculates the standard deviation of the values stored in the column received as parameter.
+        By default, the values are materialized and calculate_standard_deviation is applied.
+        Attribute types can override it to work directly with the column arrays.
+
+        Parameters
+        ----------
+        column : :class:`Column`
+            The column to calculate the standard deviation
+
+        Returns
+        -------
+        float
+            The standard deviation of the column.
+        """
+        values = column.values()
+        return values[0].calculate_standard_deviation(values)
+
+    @staticmethod
+    def calculate_column_mean(column):
+        """calculate_column_mean
+
+        Calculates the mean of the values stored in the column received as parameter.
+        It must return the same mean as calculate_mean applied to the list of values.
+        By default, the values are materialized and calculate_mean is applied.
+        Attribute types can override it to work directly with the column arrays.
+
+        Parameters
+        ----------
+        column : :class:`Column`
+            The column to calculate the mean
+
+        Returns
+        -------
+            The mean of the column.
+        """
+        values = column.values()
+        return values[0].calculate_mean(values)
+
+    @staticmethod
+    def calculate_column_variance(column):
+        """calculate_column_variance
+
+        Calculates the variance of the values stored in the column received as parameter.
+        It must return the same variance as calculate_variance applied to the list of values.
+        By default, the values are materialized and calculate_variance is applied.
+        Attribute types can override it to work directly with the column arrays.
+
+        Parameters
+        ----------
+        column : :class:`Column`
+            The column to calculate the variance
+
+        Returns
+        -------
+        float
+            The variance of the column.
+        """
+        values = column.values()
+        return values[0].calculate_variance(values)
+
+    @staticmethod
+    def calculate_column_reference_value(column):
+        """calculate_column_reference_value
+
+        Calculates the reference value of the values stored in the column received as parameter.
+        By default, the values are materialized and calculate_reference_value is applied.
+        Attribute types can override it to work directly with the column arrays.
+
+        Parameters
+        ----------
+        column : :class:`Column`
+            The column to calculate the reference value
+
+        Returns
+        -------
+        Value
+            The reference value.
+        """
+        values = column.values()
+        return values[0].calculate_reference_value(values)
+
+    @staticmethod
+    def calculate_column_centroid(column, rows, **kwargs):
+        """calculate_column_centroid
+
+        Calculates the value that is the centroid of the values stored in the given rows of the column.
+        It must return the same centroid as calculate_centroid applied to the list of values in the order of rows.
+        By default, the values are materialized and calculate_centroid is applied.
+        Attribute types can override it to work directly with the column arrays.
+
+        Parameters
+        ----------
+        column : :class:`Column`
+            The column storing the values
+        rows : numpy.ndarray
+            The rows of the values to calculate its centroid
+
+        **kwargs : optional
+            Additional arguments that the specific attribute type value may need to calculate the centroid
+
+        Returns
+        -------
+        Value
+            The value that is the centroid of the values in rows.
+        """
+        values = column.values(rows)
+        return values[0].calculate_centroid(values, **kwargs)
+
+    @staticmethod
+    def calculate_column_centroids(column, rows, labels, **kwargs):
+        """calculate_column_centroids
+
+        Calculates the centroid of each group of values stored in the given rows of the column.
+        The rows are given grouped (the rows of each group are contiguous) and labels indicates the group of
+        each row, numbered from 0 in order of appearance. The centroid of each group must be the same as
+        calculate_column_centroid applied to its rows.
+        By default, calculate_column_centroid is applied to each group.
+        Attribute types can override it to calculate all the centroids at once with grouped array reductions.
+
+        Parameters
+        ----------
+        column : :class:`Column`
+            The column storing the values
+        rows : numpy.ndarray
+            The rows of the values, grouped
+        labels : numpy.ndarray
+            The group of each row
+
+        **kwargs : optional
+            Additional arguments that the specific attribute type value may need to calculate the centroid
+
+        Returns
+        -------
+        list
+            The list with the centroid of each group.
+        """
+        starts = Value.group_starts(labels)
+        stops = np.append(starts[1:], len(labels))
+        centroids = []
+        for start, stop in zip(starts, stops):
+            centroids.append(column.calculate_centroid(rows[start:stop], **kwargs))
+
+        return centroids
+
+    @staticmethod
+    def group_starts(labels):
+        """group_starts
+
+        Calculates the position where each group starts in a grouped array of labels
+
+        Parameters
+        ----------
+        labels : numpy.ndarray
+            The group of each position, the positions of each group are contiguous
+
+        Returns
+        -------
+        numpy.ndarray
+            The position of the first item of each group.
+        """
+        return np.flatnonzero(np.diff(labels, prepend=-1))
@@ -0,0 +1,454 @@
+import copy
+import numpy as np
+import pandas as pd
+
+
+class Column:
+    """Column
+
+    Class that represents the values of an attribute in the columnar store of a :class:`Dataset`.
+    The values of attribute types with a numerical representation (see to_array in :class:`Value`) are stored
+    in a typed numpy array (data). The values of the rest of attribute types (categoricals) are stored as an array
+    of integer codes (codes) pointing to the list of distinct values (categories).
+    The :class:`Value` instances are only created on demand.
+
+    See Also
+    --------
+    :class:`Column_store`
+    """
+
+    def __init__(self, name, value_class, data=None, codes=None, categories=None):
+        """Constructor, creates an instance of a column
+
+        Parameters
+        ----------
+        name : str
+            The name of the attribute
+        value_class :
+            The class implementing the attribute type, it inherits from :class:`Value`
+        data : numpy.ndarray
+            The numerical array of the values, for attribute types implementing to_array
+        codes : numpy.ndarray
+            The integer codes of the values, for the rest of attribute types
+        categories : list
+            The list of distinct values pointed by the codes
+
+        See Also
+        --------
+        :class:`Value`
+        """
+        self.name = name
+        self.value_class = value_class
+        self.data = data
+        self.codes = codes
+        self.categories = categories
+        # Attribute type specific data calculated once from the column (see calculate_column_centroid)
+        self.cache = {}
+
+    @staticmethod
+    def from_values(name, value_class, values):
+        """from_values
+
+        Creates a column from a list of values
+
+        Parameters
+        ----------
+        name : str
+            The name of the attribute
+        value_class :
+            The class implementing the attribute type
+        values : list
+            The list of values (instances of value_class)
+
+        Returns
+        -------
+        Column
+            The column storing the values.
+        """
+        data = value_class.to_array(values)
+        if data is not None:
+            return Column(name, value_class, data=data)
+        codes, uniques = Column.factorize([value.value for value in values])
+        first_rows = np.unique(codes, return_index=True)[1]
+        categories = [copy.copy(values[row]) for row in first_rows]
+
+        return Column(name, value_class, codes=codes, categories=categories)
+
+    @staticmethod
+    def from_raw(name, value_class, raw_values):
+        """from_raw
+
+        Creates a column from the raw values (as read from the data source) of an attribute.
+        Each distinct raw value is converted only once into an instance of value_class.
+
+        Parameters
+        ----------
+        name : str
+            The name of the attribute
+        value_class :
+            The class implementing the attribute type
+        raw_values :
+            The sequence of raw values
+
+        Returns
+        -------
+        Column
+            The column storing the values.
+        """
+        codes, uniques = Column.factorize(raw_values)
+        instances = [value_class(unique) for unique in uniques]
+        data = value_class.to_array(instances)
+        if data is not None:
+            return Column(name, value_class, data=data[codes])
+
+        return Column(name, value_class, codes=codes, categories=instances)
+
+    @staticmethod
+    def concatenate(columns):
+        """concatenate
+
+        Creates a column with the values of the given columns (of the same attribute), one after another.
+        For categoricals, the categories of the columns are merged, keeping the first instance of each one.
+
+        Parameters
+        ----------
+        columns : list
+            The list of columns to concatenate
+
+        Returns
+        -------
+        Column
+            The column storing the values of all the columns.
+        """
+        name = columns[0].name
+        value_class = columns[0].value_class
+        if not columns[0].is_coded():
+            data = np.concatenate([column.data for column in columns])
+            return Column(name, value_class, data=data)
+        categories = [category for column in columns for category in column.categories]
+        merged_codes, uniques = Column.factorize(
+            [category.value for category in categories]
+        )
+        first_rows = np.unique(merged_codes, return_index=True)[1]
+        codes = []
+        start = 0
+        for column in columns:
+            stop = start + len(column.categories)
+            codes.append(merged_codes[start:stop][column.codes])
+            start = stop
+
+        return Column(
+            name,
+            value_class,
+            codes=np.concatenate(codes),
+            categories=[categories[row] for row in first_rows],
+        )
+
+    @staticmethod
+    def factorize(keys):
+        """factorize
+
+        Encodes the keys as integer codes of their distinct values, in order of appearance
+
+        Parameters
+        ----------
+        keys :
+            The sequence of keys
+
+        Returns
+        -------
+        numpy.ndarray, list
+            The codes and the list of distinct keys.
+        """
+        try:
+            keys = pd.Series(list(keys), dtype=object).to_numpy()
+            codes, uniques = pd.factorize(keys, use_na_sentinel=False)
+        except TypeError:
+            # Unhashable keys (e.g. lists), they are identified by their string representation
+            keys = list(keys)
+            str_codes, str_uniques = pd.factorize(
+                pd.Series([str(key) for key in keys], dtype=object)
+            )
+            first_rows = np.unique(str_codes, return_index=True)[1]
+            codes = str_codes
+            uniques = [keys[row] for row in first_rows]
+
+        return codes.astype(np.int32), list(uniques)
+
+    def is_coded(self):
+        """is_coded
+
+        Returns
+        -------
+        bool
+            True if the values are stored as integer codes of categories.
+        """
+        return self.codes is not None
+
+    def item(self, value):
+        """item
+
+        Converts a value into its numerical representation in this column
+
+        Parameters
+        ----------
+        value : :class:`Value`
+            The value to convert
+
+        Returns
+        -------
+            The item of the numerical array representing the value.
+        """
+        return self.value_class.to_array([value])[0]
+
+    def value(self, row):
+        """value
+
+        Creates the value stored in the given row. A new instance is created on each call,
+        so it can be modified without affecting the column
+
+        Parameters
+        ----------
+        row : int
+            The row of the value
+
+        Returns
+        -------
+        Value
+            The value stored in the row.
+        """
+        if self.is_coded():
+            return copy.copy(self.categories[self.codes[row]])
+
+        return self.value_class.from_array(self.data[row])
+
+    def values(self, rows=None):
+        """values
+
+        Creates the list of values stored in the column (or in the given rows).
+        For categoricals, the instances of the same category are shared, so they must not be modified.
+
+        Parameters
+        ----------
+        rows : numpy.ndarray
+            Optional, the rows to take, if it is omitted, it is taken the whole column
+
+        Returns
+        -------
+        list
+            The list of values.
+        """
+        if self.is_coded():
+            codes = self.codes if rows is None else self.codes[rows]
+            return [self.categories[code] for code in codes]
+        data = self.data if rows is None else self.data[rows]
+
+        return [self.value_class.from_array(item) for item in data]
+
+    def take(self, rows):
+        """take
+
+        Creates a new column with the values stored in the given rows.
+        The list of categories is shared with this column.
+
+        Parameters
+        ----------
+        rows : numpy.ndarray
+            The rows to take
+
+        Returns
+        -------
+        Column
+            The column with the values in rows.
+        """
+        if self.is_coded():
+            return Column(
+                self.name,
+                self.value_class,
+                codes=self.codes[rows],
+                categories=self.categories,
+            )
+
+        return Column(self.name, self.value_class, data=self.data[rows])
+
+    def distances(self, value, rows=None):
+        """distances
+
+        Calculates the distance between each value in the column (or in the given rows) and the given value.
+        It is equivalent to call the distance method of each stored value.
+        For categoricals, the distance is calculated once per category.
+
+        Parameters
+        ----------
+        value : :class:`Value`
+            The value to calculate the distances
+        rows : numpy.ndarray
+            Optional, the rows to take, if it is omitted, it is taken the whole column
+
+        Returns
+        -------
+        numpy.ndarray
+            The distances.
+        """
+        if not self.is_coded():
+            data = self.data if rows is None else self.data[rows]
+            return self.value_class.distance_array(data, self.item(value))
+        codes = self.codes if rows is None else self.codes[rows]
+        table = np.zeros(len(self.categories))
+        for code in np.unique(codes):
+            table[code] = self.categories[code].distance(value)
+
+        return table[codes]
+
+    def distances_to_row(self, row, rows=None):
+        """distances_to_row
+
+        Calculates the distance between each value in the column (or in the given rows) and the value
+        stored in row. It is equivalent to call the distance method of each stored value.
+
+        Parameters
+        ----------
+        row : int
+            The row of the value to calculate the distances
+        rows : numpy.ndarray
+            Optional, the rows to take, if it is omitted, it is taken the whole column
+
+        Returns
+        -------
+        numpy.ndarray
+            The distances.
+        """
+        if not self.is_coded():
+            data = self.data if rows is None else self.data[rows]
+            return self.value_class.distance_array(data, self.data[row])
+
+        return self.distances(self.categories[self.codes[row]], rows)
+
+    def paired_distances(self, other):
+        """paired_distances
+
+        Calculates the distance between each value in the column and the value in the same row of the other column
+        (of the same attribute). It is equivalent to call the distance method of each pair of values.
+        For categoricals, the distance is calculated once per distinct pair of categories.
+
+        Parameters
+        ----------
+        other : :class:`Column`
+            The other column, of the same length
+
+        Returns
+        -------
+        numpy.ndarray
+            The distances.
+        """
+        if not self.is_coded():
+            return self.value_class.paired_distance_array(self.data, other.data)
+        num_other = len(other.categories)
+        pairs = self.codes.astype(np.int64) * num_other + other.codes
+        uniques, inverse = np.unique(pairs, return_inverse=True)
+        table = np.zeros(len(uniques))
+        for j, pair in enumerate(uniques):
+            code, other_code = divmod(int(pair), num_other)
+            table[j] = self.categories[code].distance(other.categories[other_code])
+
+        return table[inverse]
+
+    def calculate_centroid(self, rows, **kwargs):
+        """calculate_centroid
+
+        Calculates the centroid of the values stored in the given rows applying the specific
+        attribute type implementation
+
+        Parameters
+        ----------
+        rows : numpy.ndarray
+            The rows of the values to calculate its centroid
+
+        **kwargs : optional
+            Additional arguments that the specific attribute type value may need to calculate the centroid
+
+        Returns
+        -------
+        Value
+            The value that is the centroid of the values in rows.
+        """
+        return self.value_class.calculate_column_centroid(self, rows, **kwargs)
+
+    def calculate_centroids(self, rows, labels, **kwargs):
+        """calculate_centroids
+
+        Calculates the centroid of each group of values stored in the given rows applying the specific
+        attribute type implementation
+
+        Parameters
+        ----------
+        rows : numpy.ndarray
+            The rows of the values, grouped (the rows of each group are contiguous)
+        labels : numpy.ndarray
+            The group of each row, numbered from 0 in order of appearance
+
+        **kwargs : optional
+            Additional arguments that the specific attribute type value may need to calculate the centroid
+
+        Returns
+        -------
+        list
+            The list with the centroid of each group.
+        """
+        return self.value_class.calculate_column_centroids(self, rows, labels, **kwargs)
+
+    def calculate_standard_deviation(self):
+        """calculate_standard_deviation
+
+        Calculates the standard deviation of the column applying the specific attribute type implementation
+
+        Returns
+        -------
+        float
+            The standard deviation of the column.
+        """
+        return self.value_class.calculate_column_standard_deviation(self)
+
+    def calculate_reference_value(self):
+        """calculate_reference_value
+
+        Calculates the reference value of the column applying the specific attribute type implementation
+
+        Returns
+        -------
+        Value
+            The reference value of the column.
+        """
+        return self.value_class.calculate_column_reference_value(self)
+
+    def calculate_mean(self):
+        """calculate_mean
+
+        Calculates the mean of the column applying the specific attribute type implementation
+
+        Returns
+        -------
+            The mean of the column.
+        """
+        return self.value_class.calculate_column_mean(self)
+
+    def calculate_variance(self):
+        """calculate_variance
+
+        Calculates the variance of the column applying the specific attribute type implementation
+
+        Returns
+        -------
+        float
+            The variance of the column.
+        """
+        return self.value_class.calculate_column_variance(self)
+
+    def __len__(self):
+        if self.is_coded():
+            return len(self.codes)
+
+        return len(self.data)
+
+    def __str__(self):
+        return self.name
@@ -0,0 +1,350 @@
+import numpy as np
+from privlib.anonymization.src.entities.column import Column
+from privlib.anonymization.src.entities.record import Record
+from privlib.anonymization.src.utils.sensitivity_type import Sensitivity_type
+
+
+class Column_store:
+    """Column_store
+
+    Class that stores the records of a :class:`Dataset` by columns, a :class:`Column` per attribute.
+    The records and values are created on demand, as views of the stored columns, so the existing
+    :class:`Record` and :class:`Value` API remains available while the algorithms can work on whole arrays.
+    The metadata (header, attributes, standard deviations and reference record) is shared with :class:`Record`.
+    """
+
+    def __init__(self, columns):
+        """Constructor, creates an instance of a columnar store
+
+        Parameters
+        ----------
+        columns : list
+            The list of columns, following the order of the header
+
+        See Also
+        --------
+        :class:`Column`
+        """
+        self.columns = columns
+        self.distances_to_reference_record = None
+
+    @staticmethod
+    def from_records(records, header):
+        """from_records
+
+        Creates a columnar store from a list of records
+
+        Parameters
+        ----------
+        records : list
+            The list of records
+        header : list
+            The name of the attributes, following the order of the values in the records
+
+        Returns
+        -------
+        Column_store
+            The columnar store with the values of the records.
+        """
+        columns = []
+        for i in range(len(records[0].values)):
+            values = [record.values[i] for record in records]
+            columns.append(Column.from_values(header[i], type(values[0]), values))
+        column_store = Column_store(columns)
+        column_store.distances_to_reference_record = np.array(
+            [record.distance_to_reference_record for record in records],
+            dtype=np.float64,
+        )
+
+        return column_store
+
+    @staticmethod
+    def concatenate(column_stores):
+        """concatenate
+
+        Creates a columnar store with the records of the given columnar stores, one after another.
+        The rows of the records (their identifiers) are renumbered accordingly.
+
+        Parameters
+        ----------
+        column_stores : list
+            The list of columnar stores to concatenate
+
+        Returns
+        -------
+        Column_store
+            The columnar store with the records of all the columnar stores.
+        """
+        columns = []
+        for i in range(len(column_stores[0].columns)):
+            columns.append(
+                Column.concatenate([column_store[i] for column_store in column_stores])
+            )
+
+        return Column_store(columns)
+
+    @staticmethod
+    def is_quasi_identifier(name):
+        """is_quasi_identifier
+
+        Parameters
+        ----------
+        name : str
+            The name of the attribute
+
+        Returns
+        -------
+        bool
+            True if the attribute is a quasi-identifier.
+        """
+        sensitivity_type = Record.attributes[name].sensitivity_type
+        return sensitivity_type == Sensitivity_type.QUASI_IDENTIFIER.value
+
+    def record(self, row):
+        """record
+
+        Creates the record stored in the given row, as a new instance
+
+        Parameters
+        ----------
+        row : int
+            The row of the record, it is also its identifier
+
+        Returns
+        -------
+        Record
+            The record stored in the row.
+        """
+        record = Record(row, [column.value(row) for column in self.columns])
+        if self.distances_to_reference_record is not None:
+            record.distance_to_reference_record = self.distances_to_reference_record[
+                row
+            ]
+
+        return record
+
+    def records(self):
+        """records
+
+        Creates the list of records stored in the columnar store
+
+        Returns
+        -------
+        list
+            The list of records.
+        """
+        return [self.record(row) for row in range(len(self))]
+
+    def take(self, rows):
+        """take
+
+        Creates a new columnar store with the records stored in the given rows
+
+        Parameters
+        ----------
+        rows : numpy.ndarray
+            The rows to take
+
+        Returns
+        -------
+        Column_store
+            The columnar store with the records in rows.
+        """
+        column_store = Column_store([column.take(rows) for column in self.columns])
+        if self.distances_to_reference_record is not None:
+            column_store.distances_to_reference_record = (
+                self.distances_to_reference_record[rows]
+            )
+
+        return column_store
+
+    def calculate_standard_deviations(self):
+        """calculate_standard_deviations
+
+        Calculates the standard deviation of each column and stores them in :class:`Record`.
+        It is the columnar counterpart of calculate_standard_deviations in :class:`Dataset`
+        """
+        Record.standard_deviations = []
+        for column in self.columns:
+            Record.standard_deviations.append(column.calculate_standard_deviation())
+
+    def set_reference_record(self):
+        """set_reference_record
+
+        Creates and stores in :class:`Record` the record formed by the reference value of each attribute,
+        and calculates the distance of each stored record to it.
+        It is the columnar counterpart of set_reference_record in :class:`Record`
+        """
+        reference_values = []
+        for column in self.columns:
+            sensitivity_type = Record.attributes[column.name].sensitivity_type
+            if (
+                sensitivity_type == Sensitivity_type.QUASI_IDENTIFIER.value
+                or sensitivity_type == Sensitivity_type.IDENTIFIER.value
+            ):
+                reference_values.append(column.calculate_reference_value())
+            else:
+                reference_values.append(None)
+        Record.reference_record = Record(0, reference_values)
+        self.distances_to_reference_record = self.distances(Record.reference_record)
+
+    def distances(self, record, rows=None):
+        """distances
+
+        Calculates the distance between each stored record (or the records in the given rows) and the given record.
+        It is equivalent to call the distance method of each :class:`Record`, so only the quasi-identifier
+        attributes are taken into account and the distance is normalized by the standard deviations.
+
+        Parameters
+        ----------
+        record : :class:`Record`
+            The record to calculate the distances
+        rows : numpy.ndarray
+            Optional, the rows to take, if it is omitted, they are taken all the records
+
+        Returns
+        -------
+        numpy.ndarray
+            The distances.
+        """
+        # Euclidean distance normalized by standard deviation
+        partial = 0
+        num_quasi = 0
+        for i, column in enumerate(self.columns):
+            # Taking into account only quasi_identifiers
+            if Column_store.is_quasi_identifier(column.name):
+                distance = column.distances(record.values[i], rows)
+                distance = distance / Record.standard_deviations[i]
+                partial = partial + distance * distance
+                num_quasi += 1
+        partial = partial / num_quasi
+
+        return np.sqrt(partial)
+
+    def distances_to_row(self, row, rows=None):
+        """distances_to_row
+
+        Calculates the distance between each stored record (or the records in the given rows) and the record
+        stored in row. It is equivalent to call the distance method of each :class:`Record`
+
+        Parameters
+        ----------
+        row : int
+            The row of the record to calculate the distances
+        rows : numpy.ndarray
+            Optional, the rows to take, if it is omitted, they are taken all the records
+
+        Returns
+        -------
+        numpy.ndarray
+            The distances.
+        """
+        # Euclidean distance normalized by standard deviation
+        partial = 0
+        num_quasi = 0
+        for i, column in enumerate(self.columns):
+            # Taking into account only quasi_identifiers
+            if Column_store.is_quasi_identifier(column.name):
+                distance = column.distances_to_row(row, rows)
+                distance = distance / Record.standard_deviations[i]
+                partial = partial + distance * distance
+                num_quasi += 1
+        partial = partial / num_quasi
+
+        return np.sqrt(partial)
+
+    def paired_distances(self, column_store):
+        """paired_distances
+
+        Calculates the distance between each stored record and the record in the same row of the given
+        columnar store (of the same dataset schema). It is equivalent to call the distance method of each
+        pair of :class:`Record`
+
+        Parameters
+        ----------
+        column_store : :class:`Column_store`
+            The other columnar store, with the same number of records
+
+        Returns
+        -------
+        numpy.ndarray
+            The distances.
+        """
+        # Euclidean distance normalized by standard deviation
+        partial = 0
+        num_quasi = 0
+        for i, column in enumerate(self.columns):
+            # Taking into account only quasi_identifiers
+            if Column_store.is_quasi_identifier(column.name):
+                distance = column.paired_distances(column_store[i])
+                distance = distance / Record.standard_deviations[i]
+                partial = partial + distance * distance
+                num_quasi += 1
+        partial = partial / num_quasi
+
+        return np.sqrt(partial)
+
+    def equal_records(self):
+        """equal_records
+
+        Groups the stored records that are equal, i.e., that have the same value in all the attributes.
+
+        Returns
+        -------
+        numpy.ndarray, numpy.ndarray
+            The group of each stored record and the number of records in each group.
+        """
+        keys = []
+        for column in self.columns:
+            if column.is_coded():
+                keys.append(column.codes)
+            else:
+                data = column.data.reshape(len(column), -1)
+                keys.append(np.unique(data, axis=0, return_inverse=True)[1].ravel())
+        _, groups, counts = np.unique(
+            np.column_stack(keys), axis=0, return_inverse=True, return_counts=True
+        )
+
+        return groups.ravel(), counts
+
+    @staticmethod
+    def embed_quasi_identifiers(column_stores):
+        """embed_quasi_identifiers
+
+        Maps the records stored in the given columnar stores (of the same dataset schema) to points in a common
+        Euclidean space, so that the Euclidean distance between two points is the distance between the records
+        they represent (see distance in :class:`Record`). Only the quasi-identifier attributes are embedded,
+        normalized by the standard deviations. See embed_columns in :class:`Value`
+
+        Parameters
+        ----------
+        column_stores : list
+            The list of columnar stores
+
+        Returns
+        -------
+        list
+            The list of two dimensional numpy arrays with the points of each columnar store,
+            or None if there is a quasi-identifier attribute type that can not be embedded.
+        """
+        points = [[] for _ in column_stores]
+        num_quasi = 0
+        for i, column in enumerate(column_stores[0].columns):
+            if Column_store.is_quasi_identifier(column.name):
+                columns = [column_store[i] for column_store in column_stores]
+                embedded = column.value_class.embed_columns(columns)
+                if embedded is None:
+                    return None
+                for j, column_points in enumerate(embedded):
+                    points[j].append(column_points / Record.standard_deviations[i])
+                num_quasi += 1
+
+        return [
+            np.hstack(column_points) / np.sqrt(num_quasi) for column_points in points
+        ]
+
+    def __getitem__(self, index):
+        return self.columns[index]
+
+    def __len__(self):
+        return len(self.columns[0])
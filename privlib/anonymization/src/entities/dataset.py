@@ -3,12 +3,16 @@ from xml.dom import minidom
 import pandas as pd
 from IPython.display import display
 from privlib.anonymization.src.entities.attribute import Attribute
-from privlib.anonymization.src.utils.utils import get_class
+from privlib.anonymization.src.utils.utils import load_class
 from privlib.anonymization.src.attribute_types.attribute_type import Attribute_type
 from privlib.anonymization.src.entities.record import Record
+from privlib.anonymization.src.entities.column import Column
+from privlib.anonymization.src.entities.column_store import Column_store
 from privlib.anonymization.src.utils.sensitivity_type import Sensitivity_type
 from privlib.anonymization.src.utils import constants
+import copy
 import random
+import numpy as np
 
 
 class Dataset(ABC):
@@ -23,7 +27,15 @@ class Dataset(ABC):
 
     """
 
-    def __init__(self, name, settings_path, attrs_settings, separator, sample=None):
+    def __init__(
+        self,
+        name,
+        settings_path,
+        attrs_settings,
+        separator,
+        sample=None,
+        columnar=False,
+    ):
         """Constructor, creates an instance of a dataset
 
         Parameters
@@ -38,6 +50,9 @@ class Dataset(ABC):
             The separator character of the csv file
         sample :
             Optional, Load only a random sample of size sample, if it is omitted, it is loaded the whole dataset
+        columnar :
+            Optional, if True the dataset is stored by columns (see :class:`Column_store`) instead of as a list of
+            records. The records are created on demand the first time they are accessed
 
         See Also
         --------
@@ -48,18 +63,26 @@ class Dataset(ABC):
         self.attrs_settings = attrs_settings
         self.separator = separator
         self.attributes = {}
-        self.records = []
+        self.columnar = columnar
+        self._records = None if columnar else []
+        self._columns = None
+        self._column_chunks = []
         self.header = []
         self.available_attribute_types = {}
+        self.attribute_classes = {}
         self.num_attr = 0
         self.num_attr_quasi = 0
         self.load_dataset_settings()
         self.load_available_attribute_types()
         self.load_header()
         self.load_dataset()
+        self.finish_columns()
         if sample is not None:
             self.take_sample(sample)
-        Dataset.calculate_standard_deviations(self.records)
+        if self.columnar:
+            self._columns.calculate_standard_deviations()
+        else:
+            Dataset.calculate_standard_deviations(self.records)
         self.set_reference_record()
         print("Dataset loaded: " + self.name)
         print("Records loaded: " + str(len(self)))
@@ -76,7 +99,8 @@ class Dataset(ABC):
     def load_dataset(self):
         """load_dataset
 
-        Load the dataset. The specific implementation should call the add_record method.
+        Load the dataset. The specific implementation should call the add_record method,
+        or the add_columns method if the dataset is columnar.
         """
         pass
 
@@ -141,16 +165,103 @@ class Dataset(ABC):
         """
         values = []
         for i in range(len(values_in)):
-            print(self.available_attribute_types)
-            attribute = self.attributes[self.header[i]]
+            value_class = self.get_attribute_class(self.header[i])
+            values.append(value_class(values_in[i]))
+        record = Record(len(self.records), values)
+        self.records.append(record)
+
+    def add_columns(self, columns_in):
+        """add_columns
+
+        Parameters
+        ----------
+        columns_in :
+            The values of the records to be stored in the dataset, given by columns. It consist of a list with
+            the sequence of values of each attribute, following the order of the header
+
+        Adds the records to the columnar store of the dataset.
+        The load_dataset method implementation should call this method, instead of add_record,
+        when the dataset is columnar. It can be called several times (e.g. once per chunk of the data source),
+        the records are appended to the ones already added. The chunks are kept apart and joined only once,
+        by finish_columns, when the dataset is loaded.
+        If the dataset is not columnar, the records are appended to the list of records, each distinct value
+        of an attribute is converted only once into an instance of its attribute type.
+
+        See Also
+        --------
+        :class:`Column_store`
+        """
+        if not self.columnar:
+            instances = []
+            for i in range(len(columns_in)):
+                value_class = self.get_attribute_class(self.header[i])
+                codes, uniques = Column.factorize(columns_in[i])
+                uniques = [value_class(unique) for unique in uniques]
+                # Each record gets its own instance, the repeated values are copied
+                first = np.zeros(len(codes), dtype=bool)
+                first[np.unique(codes, return_index=True)[1]] = True
+                instances.append(
+                    [
+                        uniques[code] if is_first else copy.copy(uniques[code])
+                        for code, is_first in zip(codes.tolist(), first.tolist())
+                    ]
+                )
+            for values in zip(*instances):
+                self._records.append(Record(len(self._records), list(values)))
+            return
+        columns = []
+        for i in range(len(columns_in)):
+            name = self.header[i]
+            value_class = self.get_attribute_class(name)
+            columns.append(Column.from_raw(name, value_class, columns_in[i]))
+        self._column_chunks.append(Column_store(columns))
+
+    def finish_columns(self):
+        """finish_columns
+
+        Joins into the columnar store of the dataset the chunks of records added by add_columns, so the records
+        loaded are copied only once. It is called after load_dataset.
+
+        See Also
+        --------
+        :class:`Column_store`
+        """
+        if len(self._column_chunks) == 0:
+            return
+        column_stores = self._column_chunks
+        if self._columns is not None:
+            column_stores = [self._columns] + column_stores
+        if len(column_stores) == 1:
+            self._columns = column_stores[0]
+        else:
+            self._columns = Column_store.concatenate(column_stores)
+        self._column_chunks = []
+
+    def get_attribute_class(self, name):
+        """get_attribute_class
+
+        Parameters
+        ----------
+        name :
+            The name of the attribute
+
+        Returns the class implementing the attribute type of the attribute.
+        The class is loaded only the first time, then it is taken from attribute_classes
+
+        See Also
+        --------
+        :class:`Attribute_type`
+        """
+        value_class = self.attribute_classes.get(name)
+        if value_class is None:
+            attribute = self.attributes[name]
             path = self.available_attribute_types[attribute.attribute_type][1]
             module = self.available_attribute_types[attribute.attribute_type][2]
             class_type = self.available_attribute_types[attribute.attribute_type][3]
-            value = values_in[i]
-            instance = get_class(path, module, class_type, value)
-            values.append(instance)
-        record = Record(len(self.records), values)
-        self.records.append(record)
+            value_class = load_class(path, module, class_type)
+            self.attribute_classes[name] = value_class
+
+        return value_class
 
     def load_dataset_settings(self):
         """load_dataset_settings
@@ -235,15 +346,114 @@ class Dataset(ABC):
             Record.standard_deviations.append(standard_deviation)
 
     def take_sample(self, sample):
+        if self.columnar:
+            rows = random.sample(range(len(self)), sample)
+            self._columns = self._columns.take(np.array(rows))
+            return
         self.records = random.sample(self.records, sample)
         for id, record in enumerate(self.records):
             record.id = id
 
     def set_reference_record(self):
-        Record.set_reference_record(self)
+        if self.columnar:
+            self._columns.set_reference_record()
+        else:
+            Record.set_reference_record(self)
+
+    @property
+    def records(self):
+        """records
+
+        The list of records of the dataset.
+        If the dataset is columnar, the records are created from the columnar store the first time they are
+        accessed, and from then on the dataset is stored as a list of records (columnar is set to False).
+        The algorithms that work by columns (see columns) do not access the records of a columnar dataset
+        """
+        if self._records is None:
+            self._records = self._columns.records()
+            self.columnar = False
+        # the records may be modified from here on, so the columnar store created from them is discarded
+        self._columns = None
+        return self._records
+
+    @records.setter
+    def records(self, records):
+        self._records = records
+        self._columns = None
+        self.columnar = False
+
+    @property
+    def columns(self):
+        """columns
+
+        The columnar store of the dataset (see :class:`Column_store`).
+        If the dataset is not columnar, the columnar store is created from the records and kept until
+        the records are accessed again
+        """
+        if self._columns is None:
+            self._columns = Column_store.from_records(self._records, self.header)
+        return self._columns
+
+    def record_ids(self):
+        """record_ids
+
+        The identifiers of the records of the dataset, in the order of the records.
+        The identifiers of the records of a columnar dataset are their rows
+
+        Returns
+        -------
+        numpy.ndarray
+            The identifiers.
+        """
+        if self.columnar:
+            return np.arange(len(self._columns))
+        return np.array([record.id for record in self._records], dtype=np.int64)
+
+    def copy_on_write(self):
+        """copy_on_write
+
+        Creates a copy of the dataset that shares the values with this one, instead of copying them.
+        The copy has its own records (or its own list of columns, if the dataset is columnar), so the values
+        of the copy can be replaced without affecting this dataset. The shared values must not be modified.
+        It allows several anonymizations of the same loaded dataset without copying all the values each time
+
+        Returns
+        -------
+        Dataset
+            The copy of the dataset.
+        """
+        dataset = copy.copy(self)
+        if self.columnar:
+            dataset._columns = Column_store(list(self._columns.columns))
+            dataset._columns.distances_to_reference_record = (
+                self._columns.distances_to_reference_record
+            )
+        else:
+            dataset._columns = None
+            dataset._records = []
+            for record in self._records:
+                record_copy = Record(record.id, list(record.values))
+                record_copy.distance_to_reference_record = (
+                    record.distance_to_reference_record
+                )
+                dataset._records.append(record_copy)
+
+        return dataset
+
+    def to_columnar(self):
+        """to_columnar
+
+        Converts the dataset into a columnar dataset, storing the records by columns
+        """
+        if not self.columnar:
+            self._columns = Column_store.from_records(self._records, self.header)
+            self._records = None
+            self.columnar = True
 
     def __len__(self):
-        return len(self.records)
+        if self.columnar:
+            return len(self._columns)
+        return len(self._records)
 
     def __str__(self):
         return self.name
@@ -1,4 +1,5 @@
 from privlib.anonymization.src.entities.dataset import Dataset
+import pandas as pd
 
 
 class Dataset_CSV(Dataset):
@@ -11,7 +12,15 @@ class Dataset_CSV(Dataset):
 
     """
 
-    def __init__(self, dataset_path, settings_path, separator, sample=None):
+    def __init__(
+        self,
+        dataset_path,
+        settings_path,
+        separator,
+        sample=None,
+        columnar=False,
+        chunksize=None,
+    ):
         """Constructor, creates an instance of a dataset loaded from a csv formatted file
 
         Parameters
@@ -24,6 +33,13 @@ class Dataset_CSV(Dataset):
             The separator character of the csv file
         sample :
             Optional, Load only a random sample of size sample, if it is omitted, it is loaded the whole dataset
+        columnar :
+            Optional, if True the dataset is stored by columns instead of as a list of records
+        chunksize :
+            Optional, if it is given, the csv file is parsed with pandas in chunks of chunksize lines
+            (quoted fields are supported) and the records are added by columns, converting each distinct value
+            of a chunk only once. If it is omitted, the file is read line by line and each line is split by the
+            separator, so quoted fields are not supported
 
         See Also
         --------
@@ -31,7 +47,8 @@ class Dataset_CSV(Dataset):
         """
         self.dataset_path = dataset_path
         self.name = dataset_path
-        super().__init__(self.name, settings_path, None, separator, sample)
+        self.chunksize = chunksize
+        super().__init__(self.name, settings_path, None, separator, sample, columnar)
 
     def load_header(self):
         """load_header
@@ -58,14 +75,50 @@ class Dataset_CSV(Dataset):
         --------
         :class:`Dataset`
         """
+        if self.chunksize is not None:
+            self.load_dataset_chunks()
+            return
         file = open(self.dataset_path, "r")
         file.readline()  # Skip header
-        for line in file:
-            record_str = line.strip("\n")
-            record_str = record_str.split(self.separator)
-            super().add_record(record_str)
+        if self.columnar:
+            records_str = []
+            for line in file:
+                record_str = line.strip("\n")
+                records_str.append(record_str.split(self.separator))
+            super().add_columns(list(zip(*records_str)))
+        else:
+            for line in file:
+                record_str = line.strip("\n")
+                record_str = record_str.split(self.separator)
+                super().add_record(record_str)
         file.close()
 
+    def load_dataset_chunks(self):
+        """load_dataset_chunks
+
+        Load the dataset parsing the csv formatted file in chunks of chunksize lines.
+        The values are read as strings and each chunk is added by columns, the chunks are joined once all
+        of them are read
+
+        See Also
+        --------
+        :class:`Dataset`
+        """
+        reader = pd.read_csv(
+            self.dataset_path,
+            sep=self.separator,
+            header=None,
+            names=self.header,
+            skiprows=1,
+            dtype=str,
+            keep_default_na=False,
+            chunksize=self.chunksize,
+        )
+        for chunk in reader:
+            columns = [chunk.iloc[:, i].to_numpy() for i in range(len(self.header))]
+            super().add_columns(columns)
+        super().finish_columns()
+
     def description(self):
         super().dataset_description()
 
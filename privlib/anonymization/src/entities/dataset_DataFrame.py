@@ -12,7 +12,7 @@ class Dataset_DataFrame(Dataset):
 
     """
 
-    def __init__(self, dataframe, settings_path, sample=None):
+    def __init__(self, dataframe, settings_path, sample=None, columnar=False):
         """Constructor, creates an instance of a dataset loaded from a pandas Dataframe
 
         Parameters
@@ -23,6 +23,8 @@ class Dataset_DataFrame(Dataset):
             The path of the xml file where it is stored the dataset metadata description
         sample :
             Optional, Load only a random sample of size sample, if it is omitted, it is loaded the whole dataset
+        columnar :
+            Optional, if True the dataset is stored by columns instead of as a list of records
 
         See Also
         --------
@@ -30,7 +32,7 @@ class Dataset_DataFrame(Dataset):
         """
         self.df = dataframe
         print("Loading dataset")
-        super().__init__(self.df.name, settings_path, None, ",", sample)
+        super().__init__(self.df.name, settings_path, None, ",", sample, columnar)
 
     def load_header(self):
         """load_header
@@ -54,10 +56,33 @@ class Dataset_DataFrame(Dataset):
         --------
         :class:`Dataset`
         """
+        if self.columnar:
+            super().add_columns([self.df[name] for name in self.header])
+            return
         for i in range(len(self.df)):
             row = self.df.iloc[i].values
             super().add_record(row)
 
+    def copy_on_write(self):
+        """copy_on_write
+
+        Extends the inherited copy_on_write method, the copy has its own dataframe, so converting the anonymized
+        dataset back does not modify the dataframe of this dataset
+
+        Returns
+        -------
+        Dataset
+            The copy of the dataset.
+
+        See Also
+        --------
+        :class:`Dataset`
+        """
+        dataset = super().copy_on_write()
+        dataset.df = self.df.copy()
+
+        return dataset
+
     def description(self):
         print("Dataset: " + self.name)
         print("Dataset head:")
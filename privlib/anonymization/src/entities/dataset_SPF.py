@@ -12,7 +12,9 @@ class Dataset_SPF(Dataset):
 
     """
 
-    def __init__(self, spf, path_settings=None, attrs_settings=None, sample=None):
+    def __init__(
+        self, spf, path_settings=None, attrs_settings=None, sample=None, columnar=False
+    ):
         """Constructor, creates an instance of a dataset loaded from a SPF (sequential privacy frame) object
 
         Parameters
@@ -25,6 +27,8 @@ class Dataset_SPF(Dataset):
             Alternatively, The dataset metadata description can be hardcoded and loaded with this parameter
         sample :
             Optional, Load only a random sample of size sample, if it is omitted, it is loaded the whole dataset
+        columnar :
+            Optional, if True the dataset is stored by columns instead of as a list of records
 
         See Also
         --------
@@ -35,7 +39,7 @@ class Dataset_SPF(Dataset):
         self.settings_path = path_settings
         self.attrs_settings = attrs_settings
         print("Loading dataset")
-        super().__init__("spf", path_settings, attrs_settings, ",", sample)
+        super().__init__("spf", path_settings, attrs_settings, ",", sample, columnar)
         self.add_attrs_settings_to_spf()
 
     def load_header(self):
@@ -62,6 +66,9 @@ class Dataset_SPF(Dataset):
         :class:`Dataset`
         :class:`SequentialPrivacyFrame`
         """
+        if self.columnar:
+            super().add_columns([self.spf[name] for name in self.header])
+            return
         for i in range(len(self.spf)):
             row = self.spf.iloc[i].values
             super().add_record(row)
@@ -89,6 +96,26 @@ class Dataset_SPF(Dataset):
         elif self.attrs_settings is not None:
             self.spf.attrs["attrs_settings"] = self.attrs_settings
 
+    def copy_on_write(self):
+        """copy_on_write
+
+        Extends the inherited copy_on_write method, the copy has its own SPF, so converting the anonymized
+        dataset back does not modify the SPF of this dataset
+
+        Returns
+        -------
+        Dataset
+            The copy of the dataset.
+
+        See Also
+        --------
+        :class:`Dataset`
+        """
+        dataset = super().copy_on_write()
+        dataset.spf = self.spf.copy()
+
+        return dataset
+
     def description(self):
         print("Dataset: " + self.name)
         print("Dataset head:")
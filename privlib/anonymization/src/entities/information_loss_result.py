@@ -53,15 +53,16 @@ class Information_loss_result:
     def description(self):
         print("")
         print("Information loss metrics:")
-        print(f"SSE: {self.SSE:.3f}")
+        if self.SSE is not None:
+            print(f"SSE: {self.SSE:.3f}")
         table = []
-        for i in range(len(self.original_mean)):
+        for i in range(len(self.attribute_name)):
             row = [
                 self.attribute_name[i],
-                self.original_mean[i],
-                self.anonymized_mean[i],
-                self.original_variance[i],
-                self.anonymized_variance[i],
+                Information_loss_result.item(self.original_mean, i),
+                Information_loss_result.item(self.anonymized_mean, i),
+                Information_loss_result.item(self.original_variance, i),
+                Information_loss_result.item(self.anonymized_variance, i),
             ]
             table.append(row)
         df = pd.DataFrame(
@@ -76,35 +77,56 @@ class Information_loss_result:
         )
         display(df)
 
+    @staticmethod
+    def item(metric, i):
+        """item
+
+        Gets the metric of the attribute i, or None if the metric was not calculated
+
+        Parameters
+        ----------
+        metric : list
+            The list of the metric for each attribute, or None
+        i : int
+            The index of the attribute
+
+        Returns
+        -------
+            The metric of the attribute.
+        """
+        if metric is None:
+            return None
+        return metric[i]
+
     def __str__(self):
         s = "SSE: " + str(self.SSE) + "\n"
-        for i in range(len(self.original_mean)):
+        for i in range(len(self.attribute_name)):
             s += (
                 "Attribute: "
                 + self.attribute_name[i]
                 + " Original data set mean: "
-                + str(self.original_mean[i])
+                + str(Information_loss_result.item(self.original_mean, i))
                 + "\n"
             )
             s += (
                 "Attribute: "
                 + self.attribute_name[i]
                 + " Anonymized data set mean: "
-                + str(self.anonymized_mean[i])
+                + str(Information_loss_result.item(self.anonymized_mean, i))
                 + "\n"
             )
             s += (
                 "Attribute: "
                 + self.attribute_name[i]
                 + " Original data set variance: "
-                + str(self.original_variance[i])
+                + str(Information_loss_result.item(self.original_variance, i))
                 + "\n"
             )
             s += (
                 "Attribute: "
                 + self.attribute_name[i]
                 + " Anonymized data set variance: "
-                + str(self.anonymized_variance[i])
+                + str(Information_loss_result.item(self.anonymized_variance, i))
                 + "\n"
             )
 
@@ -0,0 +1,396 @@
+import importlib.util
+import os
+import random
+import tempfile
+import unittest
+import nltk
+import numpy as np
+import pandas as pd
+from privlib.anonymization.src.algorithms.anonymization_scheme import (
+    Anonymization_scheme,
+)
+from privlib.anonymization.src.algorithms.differential_privacy import (
+    Differential_privacy,
+)
+from privlib.anonymization.src.algorithms.k_anonymity import K_anonymity
+from privlib.anonymization.src.algorithms.mdav import Mdav
+from privlib.anonymization.src.algorithms.microaggregation import Microaggregation
+from privlib.anonymization.src.entities.dataset_CSV import Dataset_CSV
+from privlib.anonymization.src.entities.dataset_DataFrame import Dataset_DataFrame
+from privlib.anonymization.src.entities.dataset_SPF import Dataset_SPF
+from privlib.anonymization.src.attribute_types.plain_categorical import (
+    Plain_categorical,
+)
+from privlib.anonymization.src.entities.column import Column
+from privlib.anonymization.src.entities.record import Record
+from privlib.anonymization.src.attribute_types.attribute_type import Attribute_type
+from privlib.anonymization.src.utils import constants
+from privlib.anonymization.src.utils.sensitivity_type import Sensitivity_type
+from privlib.riskAssessment.sequentialprivacyframe import SequentialPrivacyFrame
+
+SETTINGS = """<?xml version="1.0" encoding="utf-8"?>
+<schema>
+    <attribute name="hours-per-week" sensitivity_type="quasi_identifier" attribute_type="numerical_discrete" min_value="1" max_value="99"/>
+    <attribute name="age" sensitivity_type="quasi_identifier" attribute_type="numerical_continuous" min_value="0" max_value="100"/>
+    <attribute name="income" sensitivity_type="confidential" attribute_type="numerical_discrete"/>
+    <attribute name="date" sensitivity_type="quasi_identifier" attribute_type="date"/>
+    <attribute name="occupation" sensitivity_type="quasi_identifier" attribute_type="plain_categorical"/>
+    <attribute name="location" sensitivity_type="quasi_identifier" attribute_type="coordinate"/>
+    <attribute name="datetime" sensitivity_type="quasi_identifier" attribute_type="datetime"/>
+</schema>
+"""
+
+
+def make_dataframe(n, seed=0):
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(n):
+        rows.append(
+            [
+                rng.randint(1, 10),
+                round(rng.uniform(17, 90), 1),
+                rng.randint(0, 90000),
+                "%d/%d/%d"
+                % (rng.randint(1, 28), rng.randint(1, 12), rng.randint(2010, 2012)),
+                rng.choice(["clerk", "executive", "tech", "sales"]),
+                "%.4f:%.4f" % (rng.uniform(43, 44), rng.uniform(10, 11)),
+                "2011-%02d-%02d %02d:00:00"
+                % (rng.randint(1, 12), rng.randint(1, 28), rng.randint(0, 23)),
+            ]
+        )
+    df = pd.DataFrame(
+        rows,
+        columns=[
+            "hours-per-week",
+            "age",
+            "income",
+            "date",
+            "occupation",
+            "location",
+            "datetime",
+        ],
+    )
+    df.name = "synthetic"
+    return df
+
+
+class TestColumnar(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.settings_path = os.path.join(cls.tmp.name, "metadata.xml")
+        with open(cls.settings_path, "w") as file:
+            file.write(SETTINGS)
+        cls.df = make_dataframe(400)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def load(self, columnar=False):
+        return Dataset_DataFrame(self.df, self.settings_path, columnar=columnar)
+
+    def test_columnar_load(self):
+        dataset = self.load()
+        standard_deviations = list(Record.standard_deviations)
+        distances = [record.distance_to_reference_record for record in dataset.records]
+        records = [str(record) for record in dataset.records]
+        dataset_columnar = self.load(columnar=True)
+        self.assertTrue(dataset_columnar.columnar)
+        self.assertEqual(len(dataset_columnar), len(dataset))
+        np.testing.assert_allclose(Record.standard_deviations, standard_deviations)
+        np.testing.assert_allclose(
+            dataset_columnar.columns.distances_to_reference_record, distances
+        )
+        self.assertEqual([str(record) for record in dataset_columnar.records], records)
+        self.assertFalse(dataset_columnar.columnar)
+
+    def test_chunked_csv(self):
+        csv_path = os.path.join(self.tmp.name, "synthetic.csv")
+        self.df.to_csv(csv_path, index=False)
+        dataset = Dataset_CSV(csv_path, self.settings_path, ",")
+        records = [str(record) for record in dataset.records]
+        for columnar in [False, True]:
+            dataset_chunked = Dataset_CSV(
+                csv_path, self.settings_path, ",", columnar=columnar, chunksize=150
+            )
+            self.assertEqual(dataset_chunked.columnar, columnar)
+            self.assertEqual(
+                [record.id for record in dataset_chunked.records],
+                list(range(len(records))),
+            )
+            self.assertEqual(
+                [str(record) for record in dataset_chunked.records], records
+            )
+
+    def test_vectorized_mdav(self):
+        dataset = self.load()
+        for k in [1, 3, 7]:
+            clusters = Mdav().create_clusters(dataset.records, k)
+            clusters_vectorized = Mdav(vectorized=True).create_clusters(
+                dataset.records, k
+            )
+            self.assertEqual(
+                [[record.id for record in cluster] for cluster in clusters],
+                [[record.id for record in cluster] for cluster in clusters_vectorized],
+            )
+
+    def test_grouped_centroids(self):
+        dataset = self.load()
+        for k in [2, 9]:
+            anonymized = []
+            for grouped in [False, True]:
+                anonymization_scheme = K_anonymity(dataset, k, grouped=grouped)
+                anonymization_scheme.calculate_anonymization(Mdav(vectorized=True))
+                anonymized.append(
+                    [
+                        str(record)
+                        for record in anonymization_scheme.anonymized_dataset.records
+                    ]
+                )
+            self.assertEqual(anonymized[1], anonymized[0])
+
+    def test_columnar_anonymization(self):
+        settings_path = os.path.join(self.tmp.name, "metadata_identifier.xml")
+        with open(settings_path, "w") as file:
+            file.write(
+                SETTINGS.replace(
+                    "<schema>",
+                    '<schema>\n    <attribute name="id" sensitivity_type="identifier" '
+                    'attribute_type="numerical_discrete"/>',
+                )
+            )
+        df = self.df.copy()
+        df.insert(0, "id", range(len(df)))
+        df.name = "synthetic"
+        for algorithm in [Mdav(), Mdav(vectorized=True)]:
+            dataset = Dataset_DataFrame(df, settings_path)
+            anonymization_scheme = K_anonymity(dataset, 3)
+            anonymization_scheme.calculate_anonymization(algorithm)
+            anonymized_dataset = anonymization_scheme.anonymized_dataset
+            records = [str(record) for record in anonymized_dataset.records]
+            information_loss = Anonymization_scheme.calculate_information_loss(
+                dataset, anonymized_dataset, vectorized=True
+            )
+            risk = Anonymization_scheme.calculate_indexed_record_linkage(
+                dataset, anonymized_dataset
+            )
+            dataset_columnar = Dataset_DataFrame(df, settings_path, columnar=True)
+            anonymization_scheme = K_anonymity(dataset_columnar, 3)
+            anonymization_scheme.calculate_anonymization(algorithm)
+            anonymized_columnar = anonymization_scheme.anonymized_dataset
+            information_loss_columnar = Anonymization_scheme.calculate_information_loss(
+                dataset_columnar, anonymized_columnar, vectorized=True
+            )
+            risk_columnar = Anonymization_scheme.calculate_indexed_record_linkage(
+                dataset_columnar, anonymized_columnar
+            )
+            self.assertTrue(dataset_columnar.columnar)
+            self.assertTrue(anonymized_columnar.columnar)
+            self.assertEqual(str(information_loss_columnar), str(information_loss))
+            self.assertEqual(risk_columnar.disclosure_risk, risk.disclosure_risk)
+            self.assertEqual(
+                [str(record) for record in anonymized_columnar.records], records
+            )
+
+    def test_copy_on_write(self):
+        dataset = self.load()
+        records = [str(record) for record in dataset.records]
+        anonymization_scheme = K_anonymity(dataset, 3)
+        anonymization_scheme.calculate_anonymization(Mdav(vectorized=True))
+        anonymized_dataset = anonymization_scheme.anonymized_dataset
+        self.assertEqual([str(record) for record in dataset.records], records)
+        self.assertIsNot(anonymized_dataset.records, dataset.records)
+        # the confidential attribute is not anonymized, its values are shared
+        index = dataset.header.index("income")
+        self.assertIs(
+            anonymized_dataset.records[0].values[index],
+            dataset.records[0].values[index],
+        )
+
+    def test_differential_privacy_seed(self):
+        dataset = self.load()
+        records = [str(record) for record in dataset.records]
+        anonymized = []
+        for n_jobs in [1, 3, 1]:
+            anonymization_scheme = Differential_privacy(
+                dataset, 5, 1.0, n_jobs=n_jobs, seed=7
+            )
+            anonymization_scheme.calculate_anonymization(Microaggregation())
+            anonymized.append(
+                [
+                    str(record)
+                    for record in anonymization_scheme.anonymized_dataset.records
+                ]
+            )
+        self.assertEqual(anonymized[1], anonymized[0])
+        self.assertEqual(anonymized[2], anonymized[0])
+        self.assertNotEqual(anonymized[0], records)
+        self.assertEqual([str(record) for record in dataset.records], records)
+
+    def test_spf_unchanged(self):
+        path_csv = os.path.join(
+            os.path.dirname(__file__), "..", "..", "input_datasets", "ToyDataset.txt"
+        )
+        spf = SequentialPrivacyFrame.from_file(
+            path_csv, elements=["lat", "lng"], sequence_id="seq"
+        )
+        settings = {
+            "elements": {
+                constants.SENSITIVITY_TYPE: Sensitivity_type.QUASI_IDENTIFIER.value,
+                constants.ATTRIBUTE_TYPE: Attribute_type.COORDINATE.value,
+            },
+            "datetime": {
+                constants.SENSITIVITY_TYPE: Sensitivity_type.QUASI_IDENTIFIER.value,
+                constants.ATTRIBUTE_TYPE: Attribute_type.DATETIME.value,
+            },
+        }
+        for name in ["uid", "sequence", "order"]:
+            settings[name] = {
+                constants.SENSITIVITY_TYPE: Sensitivity_type.IDENTIFIER.value,
+                constants.ATTRIBUTE_TYPE: Attribute_type.NUMERICAL_DISCRETE.value,
+            }
+        original = spf.copy()
+        dataset = Dataset_SPF(spf, attrs_settings=settings)
+        anonymization_scheme = K_anonymity(dataset, 3)
+        anonymization_scheme.calculate_anonymization(Mdav())
+        spf_anonymized = anonymization_scheme.anonymized_dataset_to_SPF()
+        self.assertFalse(spf_anonymized.equals(original))
+        pd.testing.assert_frame_equal(spf, original)
+        self.assertIs(dataset.spf, spf)
+
+    def test_vectorized_information_loss(self):
+        dataset = self.load()
+        anonymization_scheme = K_anonymity(dataset, 3)
+        anonymization_scheme.calculate_anonymization(Mdav(vectorized=True))
+        anonymized_dataset = anonymization_scheme.anonymized_dataset
+        information_loss = Anonymization_scheme.calculate_information_loss(
+            dataset, anonymized_dataset
+        )
+        information_loss_vectorized = Anonymization_scheme.calculate_information_loss(
+            dataset, anonymized_dataset, vectorized=True
+        )
+        self.assertEqual(str(information_loss_vectorized), str(information_loss))
+        information_loss_sse = Anonymization_scheme.calculate_information_loss(
+            dataset, anonymized_dataset, vectorized=True, metrics=[constants.SSE]
+        )
+        self.assertEqual(information_loss_sse.SSE, information_loss.SSE)
+        self.assertIsNone(information_loss_sse.original_mean)
+        self.assertIsNone(information_loss_sse.anonymized_variance)
+
+    def test_indexed_record_linkage(self):
+        dataset = self.load()
+        for k in [1, 4]:
+            anonymization_scheme = K_anonymity(dataset, k)
+            anonymization_scheme.calculate_anonymization(Mdav(vectorized=True))
+            anonymized_dataset = anonymization_scheme.anonymized_dataset
+            risk = Anonymization_scheme.calculate_record_linkage(
+                dataset, anonymized_dataset
+            )
+            risk_indexed = Anonymization_scheme.calculate_indexed_record_linkage(
+                dataset, anonymized_dataset, batch_size=50
+            )
+            self.assertEqual(risk_indexed.disclosure_risk, risk.disclosure_risk)
+
+    @unittest.skipUnless(importlib.util.find_spec("scipy"), "scipy is not available")
+    def test_indexed_record_linkage_ties(self):
+        # few distinct values, so many records are at the same distance
+        df = self.df.copy()
+        df["hours-per-week"] = df["hours-per-week"] % 3
+        df["age"] = (df["age"] // 30).astype(float)
+        df["date"] = np.where(df.index % 2 == 0, "1/1/2011", "1/6/2011")
+        df["location"] = np.where(
+            df.index % 3 == 0, "43.5000:10.5000", "43.0000:10.0000"
+        )
+        df["datetime"] = np.where(
+            df.index % 4 == 0, "2011-01-01 00:00:00", "2011-06-01 00:00:00"
+        )
+        df.name = "synthetic"
+        dataset = Dataset_DataFrame(df, self.settings_path)
+        for k in [1, 3]:
+            anonymization_scheme = K_anonymity(dataset, k)
+            anonymization_scheme.calculate_anonymization(Mdav(vectorized=True))
+            anonymized_dataset = anonymization_scheme.anonymized_dataset
+            risk = Anonymization_scheme.calculate_record_linkage(
+                dataset, anonymized_dataset
+            )
+            risk_indexed = Anonymization_scheme.calculate_indexed_record_linkage(
+                dataset, anonymized_dataset, batch_size=50
+            )
+            self.assertEqual(risk_indexed.disclosure_risk, risk.disclosure_risk)
+
+    def test_embed_plain_categorical(self):
+        words = ["clerk", "tech", "clerk", "sales"]
+        column = Column.from_values(
+            "occupation", Plain_categorical, [Plain_categorical(w) for w in words]
+        )
+        points = Plain_categorical.embed_columns([column])[0]
+        self.assertEqual(points.shape, (4, 3))
+        self.assertAlmostEqual(np.linalg.norm(points[0] - points[1]), 1)
+        self.assertAlmostEqual(np.linalg.norm(points[0] - points[2]), 0)
+        words = [str(i) for i in range(constants.MAX_EMBEDDED_CATEGORIES + 1)]
+        column = Column.from_values(
+            "occupation", Plain_categorical, [Plain_categorical(w) for w in words]
+        )
+        self.assertIsNone(Plain_categorical.embed_columns([column]))
+
+    def test_similarity_matrix(self):
+        try:
+            nltk.find("corpora/wordnet")
+        except LookupError:
+            self.skipTest("wordnet is not available")
+        from privlib.anonymization.src.attribute_types.semantic_categorical_wordnet import (
+            Semantic_categorical_wordnet,
+        )
+        from privlib.anonymization.src.utils.wordnet_similarity import (
+            Wordnet_similarity,
+        )
+
+        words = ["dog", "cat", "car", "teacher", "river", "bank"]
+        values = [Semantic_categorical_wordnet(word) for word in words]
+        Wordnet_similarity.clear()
+        distances = [[value.distance(other) for other in values] for value in values]
+        for n_jobs in [1, 2]:
+            Wordnet_similarity.clear()
+            matrix = Semantic_categorical_wordnet.load_similarity_matrix(
+                values, cache_dir=self.tmp.name, n_jobs=n_jobs
+            )
+            self.assertIsInstance(matrix, np.memmap)
+            self.assertEqual(
+                [[value.distance(other) for other in values] for value in values],
+                distances,
+            )
+        Wordnet_similarity.clear()
+
+    def test_fast_semantic_centroid(self):
+        try:
+            nltk.find("corpora/wordnet")
+        except LookupError:
+            self.skipTest("wordnet is not available")
+        from privlib.anonymization.src.attribute_types.semantic_categorical_wordnet import (
+            Semantic_categorical_wordnet,
+        )
+        from privlib.anonymization.src.entities.column import Column
+
+        words = ["dog", "cat", "dog", "teacher", "doctor", "dog", "nurse"]
+        values = [Semantic_categorical_wordnet(word) for word in words]
+        centroid = Semantic_categorical_wordnet.calculate_fast_centroid(values[:1])
+        self.assertEqual(
+            centroid.syn,
+            Semantic_categorical_wordnet.calculate_fast_centroid(
+                [values[0], values[2]]
+            ).syn,
+        )
+        self.assertIn(centroid.syn, nltk.corpus.wordnet.synsets("dog", pos="n"))
+        column = Column.from_values("occupation", Semantic_categorical_wordnet, values)
+        rows = np.arange(len(values))
+        self.assertEqual(
+            column.calculate_centroid(rows, fast_centroid=True).syn,
+            Semantic_categorical_wordnet.calculate_centroid(
+                values, fast_centroid=True
+            ).syn,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,9 +6,35 @@ ATTRIBUTE = "attribute"
 NAME = "name"
 SENSITIVITY_TYPE = "sensitivity_type"
 ATTRIBUTE_TYPE = "attribute_type"
+# random generator used to add the noise in differential privacy anonymization
+RNG = "rng"
+FAST_CENTROID = "fast_centroid"
 # window size is used in the disclosure risk calculation
 # it indicates the % of the num of records in the dataset
 WINDOW_SIZE = 1
 # border margin is used in differential privacy anonymization
 # it indicates the margin to be applied to the attribute domain
 BORDER_MARGIN = 1.5
+# batch size is used in the indexed disclosure risk calculation
+# it indicates the num of anonymized records queried at once
+BATCH_SIZE = 10000
+# index tolerance is used in the indexed disclosure risk calculation
+# it indicates the relative margin to retrieve the candidates to the nearest record
+INDEX_TOLERANCE = 1e-9
+# max embedded categories is used in the indexed disclosure risk calculation
+# it indicates the largest num of plain categorical values mapped to the spatial index,
+# above it the distances to all the records are calculated (one dimension per value)
+MAX_EMBEDDED_CATEGORIES = 64
+# similarity cache dir is used by the semantic categorical attribute type
+# it indicates the directory where the wordnet similarity matrices are stored
+SIMILARITY_CACHE_DIR = "~/.cache/privlib/wordnet"
+# similarity matrix max words is used by the semantic categorical attribute type
+# it indicates the largest vocabulary whose similarity matrix is precomputed
+SIMILARITY_MATRIX_MAX_WORDS = 20000
+# similarity cache size is used by the semantic categorical attribute type
+# it indicates the num of similarities kept in memory (least recently used are evicted)
+SIMILARITY_CACHE_SIZE = 1000000
+# information loss metrics, they can be selected in the information loss calculation
+SSE = "SSE"
+MEAN = "mean"
+VARIANCE = "variance"
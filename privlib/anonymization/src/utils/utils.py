@@ -15,25 +15,40 @@ def get_class(fully_qualified_path, module_name, class_name, *instantiation):
     :param instantiation: Any fields required to instantiate the class eg the value
     :return: An instance of the class
     """
+    c = load_class(fully_qualified_path, module_name, class_name)
+    instance = c(*instantiation)
+    return instance
+
+
+def load_class(fully_qualified_path, module_name, class_name):
+    """
+    Returns the class (not instantiated) for the given string descriptors
+    :param fully_qualified_path: The path to the module eg("anonymization.src.attribute_types.numerical_discrete")
+    :param module_name: The module name eg("numerical_discrete")
+    :param class_name: The class name eg("Numerical_discrete")
+    :return: The class
+    """
     p = __import__(fully_qualified_path)
     modules = fully_qualified_path.split(".")
     m = getattr(p, modules[1])
     for i in range(2, len(modules)):
         m = getattr(m, modules[i])
     c = getattr(m, class_name)
-    instance = c(*instantiation)
-    return instance
+    return c
 
 
-def random_laplace(mu, scale):
+def random_laplace(mu, scale, rng=None):
     """
     Returns a random laplace distributed value with location and scale
     :param (float) mu: the position of the distribution peak
     :param (float) scale: The exponential decay
+    :param (numpy.random.Generator) rng: Optional, the random generator, if it is omitted a new one is created
     :return: the laplace random distributed value
     :rtype: float
     """
-    return np.random.default_rng().laplace(mu, scale)
+    if rng is None:
+        rng = np.random.default_rng()
+    return rng.laplace(mu, scale)
 
 
 def random_laplace2(mu, scale):
@@ -59,7 +74,7 @@ def inverse_laplace(mu, scale, x):
     return result
 
 
-def add_laplace_noise(value, scale, max_value, min_value):
+def add_laplace_noise(value, scale, max_value, min_value, rng=None):
     """
     Add Laplace noise to a value given as parameter.
     The value will be bounded between max and min values given as parameters
@@ -67,10 +82,11 @@ def add_laplace_noise(value, scale, max_value, min_value):
     :param (float) scale: The exponential decay
     :param (float) max_value: max possible value in the domain
     :param (float) min_value: min possible value in the domain
+    :param (numpy.random.Generator) rng: Optional, the random generator used to draw the noise
     :return: The value with the noise added
     :rtype: float
     """
-    noise = random_laplace(0, scale)
+    noise = random_laplace(0, scale, rng)
     dp_value = value + noise
     if dp_value > max_value:
         dp_value = max_value
@@ -0,0 +1,335 @@
+import hashlib
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from nltk.corpus import wordnet
+import numpy as np
+from privlib.anonymization.src.utils import constants
+
+
+class Wordnet_similarity:
+    """Wordnet_similarity
+
+    Class that stores the Wu-Palmer similarities in wordnet used by :class:`Semantic_categorical_wordnet`.
+    The similarities between the words of a vocabulary (the distinct values of an attribute) can be precomputed
+    once in a similarity matrix, that is stored on disk (numpy .npy format, keyed by wordnet version and vocabulary)
+    and memory-mapped when it is reused. The similarities not covered by the matrix are kept in bounded caches
+    that evict the least recently used ones.
+
+    See Also
+    --------
+    :class:`Semantic_categorical_wordnet`
+    """
+
+    vocabulary = {}
+    matrix = None
+    words_cache = OrderedDict()
+    synsets_cache = OrderedDict()
+    row_words = None
+
+    @staticmethod
+    def word_similarity(word1, word2):
+        """word_similarity
+
+        Calculates the similarity in wordnet between two words.
+        The words are disambiguated as the synsets with the maximum similarity.
+        It is taken from the similarity matrix if both words are in its vocabulary.
+
+        Parameters
+        ----------
+        word1 : str
+            The first word.
+        word2 : str
+            The second word.
+
+        Returns
+        -------
+        float
+            The similarity between the two words.
+        """
+        vocabulary = Wordnet_similarity.vocabulary
+        if word1 in vocabulary and word2 in vocabulary:
+            return float(
+                Wordnet_similarity.matrix[vocabulary[word1], vocabulary[word2]]
+            )
+        key = (word1, word2) if word1 <= word2 else (word2, word1)
+        similarity = Wordnet_similarity.get_cached(Wordnet_similarity.words_cache, key)
+        if similarity is None:
+            similarity = Wordnet_similarity.calculate_word_similarity(word1, word2)
+            Wordnet_similarity.set_cached(
+                Wordnet_similarity.words_cache, key, similarity
+            )
+
+        return similarity
+
+    @staticmethod
+    def synset_similarity(syn1, syn2):
+        """synset_similarity
+
+        Calculates the Wu-Palmer similarity between two synsets in wordnet
+
+        Parameters
+        ----------
+        syn1 :
+            The first synset.
+        syn2 :
+            The second synset.
+
+        Returns
+        -------
+        float
+            The similarity between the two synsets.
+        """
+        name1 = syn1.name()
+        name2 = syn2.name()
+        key = (name1, name2) if name1 <= name2 else (name2, name1)
+        similarity = Wordnet_similarity.get_cached(
+            Wordnet_similarity.synsets_cache, key
+        )
+        if similarity is None:
+            similarity = syn1.wup_similarity(syn2)
+            Wordnet_similarity.set_cached(
+                Wordnet_similarity.synsets_cache, key, similarity
+            )
+
+        return similarity
+
+    @staticmethod
+    def calculate_word_similarity(word1, word2):
+        """calculate_word_similarity
+
+        Calculates (without caching) the similarity in wordnet between two words,
+        as the maximum similarity of their noun synsets
+
+        Parameters
+        ----------
+        word1 : str
+            The first word.
+        word2 : str
+            The second word.
+
+        Returns
+        -------
+        float
+            The similarity between the two words.
+        """
+        syns1 = wordnet.synsets(word1, pos="n")
+        syns2 = wordnet.synsets(word2, pos="n")
+        max_sim = 0
+        for syn1 in syns1:
+            for syn2 in syns2:
+                sim = syn1.wup_similarity(syn2)
+                if sim > max_sim:
+                    max_sim = sim
+
+        return max_sim
+
+    @staticmethod
+    def get_cached(cache, key):
+        """get_cached
+
+        Gets a similarity from the cache, marking it as the most recently used
+
+        Parameters
+        ----------
+        cache : OrderedDict
+            The cache.
+        key : tuple
+            The pair of words or synsets.
+
+        Returns
+        -------
+        float
+            The similarity, or None if it is not in the cache.
+        """
+        similarity = cache.get(key)
+        if similarity is not None:
+            cache.move_to_end(key)
+
+        return similarity
+
+    @staticmethod
+    def set_cached(cache, key, similarity):
+        """set_cached
+
+        Stores a similarity in the cache, evicting the least recently used one if it is full
+        (see SIMILARITY_CACHE_SIZE in constants)
+
+        Parameters
+        ----------
+        cache : OrderedDict
+            The cache.
+        key : tuple
+            The pair of words or synsets.
+        similarity : float
+            The similarity to store.
+        """
+        cache[key] = similarity
+        if len(cache) > constants.SIMILARITY_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    @staticmethod
+    def init_rows(words):
+        """init_rows
+
+        Stores the words of the vocabulary used by calculate_row. It is the initializer of the worker processes
+        that build the similarity matrix, so the words are sent once to each worker
+
+        Parameters
+        ----------
+        words : list
+            The sorted list of distinct words.
+        """
+        Wordnet_similarity.row_words = words
+
+    @staticmethod
+    def calculate_row(i, words=None):
+        """calculate_row
+
+        Calculates the similarities of a word of the vocabulary with itself and the following words.
+        It is the task run (optionally in parallel) to build the similarity matrix
+
+        Parameters
+        ----------
+        i : int
+            The row of the word.
+        words : list
+            Optional, the sorted list of distinct words, by default the ones stored by init_rows.
+
+        Returns
+        -------
+        int, list
+            The row and the list of similarities.
+        """
+        if words is None:
+            words = Wordnet_similarity.row_words
+        similarities = []
+        for j in range(i, len(words)):
+            similarities.append(
+                Wordnet_similarity.calculate_word_similarity(words[i], words[j])
+            )
+
+        return i, similarities
+
+    @staticmethod
+    def build_matrix(words, n_jobs=1):
+        """build_matrix
+
+        Calculates the similarity matrix between the given words
+
+        Parameters
+        ----------
+        words : list
+            The sorted list of distinct words.
+        n_jobs : int
+            The number of processes used to calculate the similarities.
+
+        Returns
+        -------
+        numpy.ndarray
+            The symmetric similarity matrix.
+        """
+        matrix = np.zeros((len(words), len(words)), dtype=np.float64)
+        if n_jobs == 1:
+            for i in range(len(words)):
+                Wordnet_similarity.fill_row(
+                    matrix, *Wordnet_similarity.calculate_row(i, words)
+                )
+        else:
+            with ProcessPoolExecutor(
+                max_workers=n_jobs,
+                initializer=Wordnet_similarity.init_rows,
+                initargs=(words,),
+            ) as executor:
+                results = executor.map(
+                    Wordnet_similarity.calculate_row, range(len(words)), chunksize=16
+                )
+                for i, similarities in results:
+                    Wordnet_similarity.fill_row(matrix, i, similarities)
+
+        return matrix
+
+    @staticmethod
+    def fill_row(matrix, i, similarities):
+        matrix[i, i:] = similarities
+        matrix[i:, i] = similarities
+
+    @staticmethod
+    def matrix_path(words, cache_dir=None):
+        """matrix_path
+
+        Gets the path of the file storing the similarity matrix of the given words.
+        The name of the file depends on the wordnet version and the vocabulary.
+
+        Parameters
+        ----------
+        words : list
+            The sorted list of distinct words.
+        cache_dir : str
+            Optional, the directory of the file, by default SIMILARITY_CACHE_DIR in constants.
+
+        Returns
+        -------
+        str
+            The path of the file.
+        """
+        if cache_dir is None:
+            cache_dir = os.path.expanduser(constants.SIMILARITY_CACHE_DIR)
+        digest = hashlib.sha1("\n".join(words).encode("utf-8")).hexdigest()
+        name = f"wup_wordnet-{wordnet.get_version()}_{digest}.npy"
+
+        return os.path.join(cache_dir, name)
+
+    @staticmethod
+    def load_matrix(words, cache_dir=None, n_jobs=1):
+        """load_matrix
+
+        Loads the similarity matrix between the distinct given words, so it is used by word_similarity.
+        The matrix is calculated and stored on disk the first time, after that it is memory-mapped from disk.
+        Vocabularies larger than SIMILARITY_MATRIX_MAX_WORDS (in constants) are not precomputed,
+        their similarities are only kept in the bounded cache.
+
+        Parameters
+        ----------
+        words :
+            The words of the vocabulary.
+        cache_dir : str
+            Optional, the directory to store the matrix, by default SIMILARITY_CACHE_DIR in constants.
+        n_jobs : int
+            The number of processes used to calculate the similarities the first time.
+
+        Returns
+        -------
+        numpy.ndarray
+            The similarity matrix, or None if the vocabulary is too large.
+        """
+        words = sorted(set(words))
+        if len(words) > constants.SIMILARITY_MATRIX_MAX_WORDS:
+            print(
+                f"Vocabulary too large for the similarity matrix ({len(words)} words)"
+            )
+            return None
+        path = Wordnet_similarity.matrix_path(words, cache_dir)
+        if not os.path.exists(path):
+            print(f"Calculating similarity matrix ({len(words)} words)")
+            matrix = Wordnet_similarity.build_matrix(words, n_jobs)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            path_tmp = f"{path}.{os.getpid()}.tmp"
+            with open(path_tmp, "wb") as file:
+                np.save(file, matrix)
+            os.replace(path_tmp, path)
+        Wordnet_similarity.matrix = np.load(path, mmap_mode="r")
+        Wordnet_similarity.vocabulary = {word: i for i, word in enumerate(words)}
+
+        return Wordnet_similarity.matrix
+
+    @staticmethod
+    def clear():
+        """clear
+
+        Unloads the similarity matrix and empties the caches
+        """
+        Wordnet_similarity.vocabulary = {}
+        Wordnet_similarity.matrix = None
+        Wordnet_similarity.words_cache.clear()
+        Wordnet_similarity.synsets_cache.clear()
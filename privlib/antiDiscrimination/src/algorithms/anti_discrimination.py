@@ -7,9 +7,15 @@ import itertools
 from tqdm.auto import tqdm
 import pickle
 import copy
+import math
+import fim
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from privlib.antiDiscrimination.src.entities.anti_discrimination_metrics import (
     Anti_discrimination_metrics,
 )
+from privlib.antiDiscrimination.src.entities.indexed_records import Indexed_records
+from privlib.antiDiscrimination.src.utils.rule_cache import Rule_cache
 
 
 class Anti_discrimination(Anonymization_scheme):
@@ -33,8 +39,20 @@ class Anti_discrimination(Anonymization_scheme):
     """
 
     hash_num_rec = {}
-
-    def __init__(self, original_dataset, min_support, min_confidence, alfa, DI):
+    search_state = None
+
+    def __init__(
+        self,
+        original_dataset,
+        min_support,
+        min_confidence,
+        alfa,
+        DI,
+        indexed=False,
+        fpgrowth=False,
+        n_jobs=1,
+        rule_cache_dir=None,
+    ):
         """Constructor, called from inherited classes
 
         Parameters
@@ -54,6 +72,24 @@ class Anti_discrimination(Anonymization_scheme):
         DI : list of tuples
             Predetermined discriminatory items, each tuple corresponds to: (attribute,discriminatory value)
 
+        indexed : bool
+            Optional, if True, the records are indexed by item (see :class:`Indexed_records`), so the number of
+            records containing an item set is calculated intersecting bitmaps instead of scanning the records.
+            The rules and the anonymized data set are the same.
+
+        fpgrowth : bool
+            Optional, if True, the frequent rules are mined with FP-growth (pyfim) instead of enumerating
+            all the combinations of items. The rules (and their order) are the same.
+
+        n_jobs : int
+            Optional, the number of processes used to search the RR rules (the PND rules are shared out among
+            them). The rules are merged in the same order.
+
+        rule_cache_dir : str
+            Optional, the directory where the mined rules are stored (see :class:`Rule_cache`), keyed by the
+            content of the data set, min_support, min_confidence, alfa and DI. If the rules of the data set
+            are stored, they are loaded instead of mined. If it is omitted, the rules are not stored.
+
         See Also
         --------
         :class:`Dataset`
@@ -63,6 +99,10 @@ class Anti_discrimination(Anonymization_scheme):
         self.min_confidence = min_confidence
         self.alfa = alfa
         self.DI = self.to_item_DI(DI)
+        self.indexed = indexed
+        self.fpgrowth = fpgrowth
+        self.n_jobs = n_jobs
+        self.rule_cache = Rule_cache(rule_cache_dir) if rule_cache_dir else None
         # todo: now, last attribute is the class, change to read the class from settings (it has to be the last one)
         self.index_class = self.original_dataset.num_attr - 1
         self.FR_rules = []
@@ -78,16 +118,14 @@ class Anti_discrimination(Anonymization_scheme):
         """
         print("Anonymizing " + str(self))
         print("Alfa = " + str(self.alfa))
-        self.FR_rules, PD_rules, PND_rules = self.create_rules(
-            self.original_dataset, self.index_class
-        )
-        self.RR_rules, self.non_RR_rules = self.calculate_RR_rules(
-            self.original_dataset, PND_rules
-        )
-        self.MR_rules, self.PR_rules = self.calculate_MR_rules(
-            self.original_dataset, PD_rules
-        )
-        self.anonymized_dataset = copy.deepcopy(self.original_dataset)
+        (
+            self.FR_rules,
+            self.RR_rules,
+            self.non_RR_rules,
+            self.MR_rules,
+            self.PR_rules,
+        ) = self.calculate_rules(self.original_dataset, self.index_class)
+        self.anonymized_dataset = self.original_dataset.copy_on_write()
         self.anonymize_direct_indirect()
 
     # def calculate_anonymization(self, algorithm=None):
@@ -106,6 +144,209 @@ class Anti_discrimination(Anonymization_scheme):
     #     self.anonymized_dataset = copy.deepcopy(self.original_dataset)
     #     self.anonymize_indirect_rules()
 
+    def calculate_rules(self, dataset, index_class):
+        """calculate_rules
+
+        Calculates the frequent rules of the data set and classifies them in RR/non_RR and MR/PR rules.
+        If the scheme has a rule cache, the rules are loaded from it when they are stored, otherwise they are
+        stored after being calculated.
+
+        Parameters
+        ----------
+        dataset : :class:`Dataset`
+            The data set.
+        index_class : int
+            The index of the class attribute.
+
+        Returns
+        -------
+        list, list, list, list, list
+            The FR, RR, non_RR, MR and PR rules.
+        """
+        if self.rule_cache is not None:
+            records = [
+                [str(value) for value in record.values] for record in dataset.records
+            ]
+            parameters = [
+                index_class,
+                self.min_support,
+                self.min_confidence,
+                self.alfa,
+                [str(item) for item in self.DI],
+            ]
+            key = Rule_cache.calculate_key(dataset.header, records, parameters)
+            arrays = self.rule_cache.load(key)
+            if arrays is not None:
+                print("Loading rules from cache: " + self.rule_cache.entry_path(key))
+                # the counts of the item sets of other data sets must not be reused
+                Anti_discrimination.hash_num_rec = {}
+                return self.arrays_to_rules(arrays)
+        FR_rules, PD_rules, PND_rules = self.create_rules(dataset, index_class)
+        RR_rules, non_RR_rules = self.calculate_RR_rules(dataset, PND_rules)
+        MR_rules, PR_rules = self.calculate_MR_rules(dataset, PD_rules)
+        if self.rule_cache is not None:
+            arrays = self.rules_to_arrays(
+                FR_rules, PD_rules, PND_rules, RR_rules, non_RR_rules, MR_rules
+            )
+            self.rule_cache.save(key, arrays)
+
+        return FR_rules, RR_rules, non_RR_rules, MR_rules, PR_rules
+
+    @staticmethod
+    def rules_to_arrays(
+        FR_rules, PD_rules, PND_rules, RR_rules, non_RR_rules, MR_rules
+    ):
+        """rules_to_arrays
+
+        Encodes the rules as arrays of item codes, to be stored in the rule cache.
+        The PD/PND, MR/PR and RR/non_RR rules are stored as masks of the rules they are selected from.
+
+        Parameters
+        ----------
+        FR_rules : list
+            The FR rules.
+        PD_rules : list
+            The PD rules, in FR_rules.
+        PND_rules : list
+            The PND rules, in FR_rules.
+        RR_rules : list
+            The RR rules, pairs of a copy of a PND rule and its list of ABC rules.
+        non_RR_rules : list
+            The non_RR rules, in PND_rules.
+        MR_rules : list
+            The MR rules, in PD_rules.
+
+        Returns
+        -------
+        dict
+            The arrays by name.
+        """
+        codes = {}
+
+        def encode(item_sets):
+            offsets = [0]
+            values = []
+            for item_set in item_sets:
+                for item in item_set:
+                    values.append(codes.setdefault((item.index, item.item), len(codes)))
+                offsets.append(len(values))
+            return np.array(offsets, dtype=np.int64), np.array(values, dtype=np.int32)
+
+        arrays = {}
+        arrays["FR_offsets"], arrays["FR_premises"] = encode(
+            [rule.premise for rule in FR_rules]
+        )
+        arrays["FR_consequences"] = encode([rule.consequence for rule in FR_rules])[1]
+        arrays["FR_supports"] = np.array(
+            [rule.support for rule in FR_rules], dtype=np.float64
+        )
+        arrays["FR_confidences"] = np.array(
+            [rule.confidence for rule in FR_rules], dtype=np.float64
+        )
+        PD_ids = {id(rule) for rule in PD_rules}
+        arrays["FR_PD"] = np.array(
+            [id(rule) in PD_ids for rule in FR_rules], dtype=bool
+        )
+        MR_ids = {id(rule) for rule in MR_rules}
+        arrays["PD_MR"] = np.array(
+            [id(rule) in MR_ids for rule in PD_rules], dtype=bool
+        )
+        non_RR_ids = {id(rule) for rule in non_RR_rules}
+        arrays["PND_RR"] = np.array(
+            [id(rule) not in non_RR_ids for rule in PND_rules], dtype=bool
+        )
+        ABC_rules = [ABC_rule for RR_rule in RR_rules for ABC_rule in RR_rule[1]]
+        arrays["RR_offsets"] = np.cumsum(
+            [0] + [len(RR_rule[1]) for RR_rule in RR_rules], dtype=np.int64
+        )
+        for part in ["A", "B", "D"]:
+            arrays["ABC_" + part + "_offsets"], arrays["ABC_" + part] = encode(
+                [getattr(ABC_rule, part) for ABC_rule in ABC_rules]
+            )
+        arrays["item_indexes"] = np.array(
+            [index for index, value in codes], dtype=np.int32
+        )
+        arrays["item_values"] = np.array([value for index, value in codes], dtype=str)
+
+        return arrays
+
+    def arrays_to_rules(self, arrays):
+        """arrays_to_rules
+
+        Decodes the rules stored in the rule cache (see rules_to_arrays)
+
+        Parameters
+        ----------
+        arrays : dict
+            The arrays by name.
+
+        Returns
+        -------
+        list, list, list, list, list
+            The FR, RR, non_RR, MR and PR rules.
+        """
+        items = [
+            Item(str(value), int(index))
+            for index, value in zip(arrays["item_indexes"], arrays["item_values"])
+        ]
+
+        def decode(offsets, values, i):
+            return [items[code] for code in values[offsets[i] : offsets[i + 1]]]
+
+        FR_rules = []
+        PD_rules = []
+        PND_rules = []
+        for i in range(len(arrays["FR_supports"])):
+            rule = Rule(
+                decode(arrays["FR_offsets"], arrays["FR_premises"], i),
+                [items[arrays["FR_consequences"][i]]],
+                float(arrays["FR_supports"][i]),
+                float(arrays["FR_confidences"][i]),
+            )
+            FR_rules.append(rule)
+            if arrays["FR_PD"][i]:
+                PD_rules.append(rule)
+            else:
+                PND_rules.append(rule)
+
+        MR_rules = []
+        PR_rules = []
+        for rule, is_MR in zip(PD_rules, arrays["PD_MR"]):
+            rule.A = [item for item in rule.premise if item in self.DI]
+            rule.B = [item for item in rule.premise if item not in self.DI]
+            if is_MR:
+                MR_rules.append(rule)
+            else:
+                PR_rules.append(rule)
+
+        RR_rules = []
+        non_RR_rules = []
+        j = 0
+        RR_offsets = arrays["RR_offsets"]
+        for PND_rule, is_RR in zip(PND_rules, arrays["PND_RR"]):
+            if not is_RR:
+                non_RR_rules.append(PND_rule)
+                continue
+            ABC_rules = []
+            for k in range(RR_offsets[j], RR_offsets[j + 1]):
+                A = decode(arrays["ABC_A_offsets"], arrays["ABC_A"], k)
+                B = decode(arrays["ABC_B_offsets"], arrays["ABC_B"], k)
+                ABC_rule = Rule(A + B, PND_rule.consequence, None, None)
+                ABC_rule.A = A
+                ABC_rule.B = B
+                ABC_rule.D = decode(arrays["ABC_D_offsets"], arrays["ABC_D"], k)
+                ABC_rules.append(ABC_rule)
+            RR_rules.append(copy.deepcopy([PND_rule, ABC_rules]))
+            j += 1
+
+        print("FR Rules loaded: " + str(len(FR_rules)))
+        print("MR Rules loaded: " + str(len(MR_rules)))
+        print("PR Rules loaded: " + str(len(PR_rules)))
+        print("RR Rules loaded: " + str(len(RR_rules)))
+        print("non RR Rules loaded: " + str(len(non_RR_rules)))
+
+        return FR_rules, RR_rules, non_RR_rules, MR_rules, PR_rules
+
     def calculate_and_save_rules_direct(self):
         self.calculate_and_save_FR_rules()
         self.FR_rules, PD_rules, PND_rules = self.load_rules_FR()
@@ -128,15 +369,51 @@ class Anti_discrimination(Anonymization_scheme):
         )
         self.save_rules_FR(self.FR_rules, PD_rules, PND_rules)
 
-    def anonymize_indirect_rules(self):
+    def get_records(self, dataset):
+        """get_records
+
+        Gets the records of the data set as lists of strings, indexed by item if the scheme is indexed
+
+        Parameters
+        ----------
+        dataset : :class:`Dataset`
+            The data set.
+
+        Returns
+        -------
+        list
+            The list of records (:class:`Indexed_records` if the scheme is indexed).
+        """
         records = []
-        for record in self.anonymized_dataset.records:
-            records.append(
-                [
-                    str(record.values[i])
-                    for i in range(0, self.anonymized_dataset.num_attr)
-                ]
-            )
+        for record in dataset.records:
+            records.append([str(record.values[i]) for i in range(0, dataset.num_attr)])
+        if self.indexed:
+            records = Indexed_records(records)
+
+        return records
+
+    def set_class_value(self, records, row, value):
+        """set_class_value
+
+        Changes the class of a record, both in the list of records and in the anonymized data set
+
+        Parameters
+        ----------
+        records : list
+            The list of records (:class:`Indexed_records` if the scheme is indexed).
+        row : int
+            The row of the record.
+        value : str
+            The new class.
+        """
+        if isinstance(records, Indexed_records):
+            records.set_value(row, self.index_class, value)
+        else:
+            records[row][self.index_class] = value
+        self.anonymized_dataset.set_value(row, self.index_class, value)
+
+    def anonymize_indirect_rules(self):
+        records = self.get_records(self.anonymized_dataset)
         total_records = len(records)
         print("Anonymizing...")
         for RR_rule in tqdm(self.RR_rules):
@@ -161,8 +438,8 @@ class Anti_discrimination(Anonymization_scheme):
                 delta1 = support_XA
                 B = ABC_rule.B
                 BC = B + C
-                num_rule = self.count_items_no_hash(records, BC)
-                support_BC = num_rule / total_records
+                num_BC = self.count_items_no_hash(records, BC)
+                support_BC = num_BC / total_records
                 num_rule = self.count_items_no_hash(records, B)
                 support_B = num_rule / total_records
                 confidence_BC = support_BC / support_B
@@ -183,26 +460,17 @@ class Anti_discrimination(Anonymization_scheme):
                 while delta <= (beta1 * (beta2 + gamma - 1)) / (beta2 * self.alfa):
                     if len(DBc_impact) > 0:
                         first_dbc = DBc_impact.pop(0)
-                        records[first_dbc[0]][self.index_class] = C[0].item
-                        self.anonymized_dataset.records[first_dbc[0]].values[
-                            self.index_class
-                        ] = C[0].item
-                        num_rule = self.count_items_no_hash(records, BC)
-                        support_BC = num_rule / total_records
+                        self.set_class_value(records, first_dbc[0], C[0].item)
+                        # the record contained B and not C, so now it is one more record containing BC
+                        num_BC += 1
+                        support_BC = num_BC / total_records
                         confidence_BC = support_BC / support_B
                         delta = confidence_BC
                     else:
                         break
 
     def anonymize_direct_rules(self):
-        records = []
-        for record in self.anonymized_dataset.records:
-            records.append(
-                [
-                    str(record.values[i])
-                    for i in range(0, self.anonymized_dataset.num_attr)
-                ]
-            )
+        records = self.get_records(self.anonymized_dataset)
         total_records = len(records)
         print("Anonymizing...")
         for ABC_rule in tqdm(self.MR_rules):
@@ -218,8 +486,8 @@ class Anti_discrimination(Anonymization_scheme):
                 DBc_impact.append([dbc, impact])
             DBc_impact.sort(key=lambda x: x[1])
             BC = B + C
-            num_rule = self.count_items_no_hash(records, BC)
-            support_BC = num_rule / total_records
+            num_BC = self.count_items_no_hash(records, BC)
+            support_BC = num_BC / total_records
             num_rule = self.count_items_hash(records, B)
             support_B = num_rule / total_records
             confidence_BC = support_BC / support_B
@@ -228,31 +496,25 @@ class Anti_discrimination(Anonymization_scheme):
             cond = confidence_ABC / self.alfa
             while delta <= cond:
                 first_dbc = DBc_impact.pop(0)
-                records[first_dbc[0]][self.index_class] = C[0].item
-                self.anonymized_dataset.records[first_dbc[0]].values[
-                    self.index_class
-                ] = C[0].item
-                num_rule = self.count_items_no_hash(records, BC)
-                support_BC = num_rule / total_records
+                self.set_class_value(records, first_dbc[0], C[0].item)
+                # the record contained B and not C, so now it is one more record containing BC
+                num_BC += 1
+                support_BC = num_BC / total_records
                 confidence_BC = support_BC / support_B
                 delta = confidence_BC
 
     def anonymize_direct_indirect(self):
         print("Anonymizing " + str(self))
-        records = []
-        for record in self.anonymized_dataset.records:
-            records.append(
-                [
-                    str(record.values[i])
-                    for i in range(0, self.anonymized_dataset.num_attr)
-                ]
-            )
+        records = self.get_records(self.anonymized_dataset)
         total_records = len(records)
-        record_impact = []
         print("Calculating impacts...")
-        for record in tqdm(records):
-            impact = self.calculate_impact(self.FR_rules, record)
-            record_impact.append(impact)
+        if isinstance(records, Indexed_records):
+            record_impact = self.calculate_impacts(self.FR_rules, records)
+        else:
+            record_impact = []
+            for record in tqdm(records):
+                impact = self.calculate_impact(self.FR_rules, record)
+                record_impact.append(impact)
         print("Anonymizing...")
         for RR_rule in tqdm(self.RR_rules):
             gamma = RR_rule[0].confidence
@@ -276,8 +538,8 @@ class Anti_discrimination(Anonymization_scheme):
                 delta1 = support_XA
                 B = ABC_rule.B
                 BC = B + C
-                num_rule = self.count_items_no_hash(records, BC)
-                support_BC = num_rule / total_records
+                num_BC = self.count_items_no_hash(records, BC)
+                support_BC = num_BC / total_records
                 num_rule = self.count_items_no_hash(records, B)
                 support_B = num_rule / total_records
                 confidence_BC = support_BC / support_B
@@ -301,12 +563,10 @@ class Anti_discrimination(Anonymization_scheme):
                     ) and delta <= (confidence_ABC / self.alfa):
                         if len(DBc_impact) > 0:
                             first_dbc = DBc_impact.pop(0)
-                            records[first_dbc[0]][self.index_class] = C[0].item
-                            self.anonymized_dataset.records[first_dbc[0]].values[
-                                self.index_class
-                            ] = C[0].item
-                            num_rule = self.count_items_no_hash(records, BC)
-                            support_BC = num_rule / total_records
+                            self.set_class_value(records, first_dbc[0], C[0].item)
+                            # the record contained B and not C, so now it is one more record containing BC
+                            num_BC += 1
+                            support_BC = num_BC / total_records
                             confidence_BC = support_BC / support_B
                             delta = confidence_BC
                         else:
@@ -315,12 +575,10 @@ class Anti_discrimination(Anonymization_scheme):
                     while delta <= (beta1 * (beta2 + gamma - 1)) / (beta2 * self.alfa):
                         if len(DBc_impact) > 0:
                             first_dbc = DBc_impact.pop(0)
-                            records[first_dbc[0]][self.index_class] = C[0].item
-                            self.anonymized_dataset.records[first_dbc[0]].values[
-                                self.index_class
-                            ] = C[0].item
-                            num_rule = self.count_items_no_hash(records, BC)
-                            support_BC = num_rule / total_records
+                            self.set_class_value(records, first_dbc[0], C[0].item)
+                            # the record contained B and not C, so now it is one more record containing BC
+                            num_BC += 1
+                            support_BC = num_BC / total_records
                             confidence_BC = support_BC / support_B
                             delta = confidence_BC
                         else:
@@ -346,8 +604,8 @@ class Anti_discrimination(Anonymization_scheme):
             support_AB = num_rule / total_records
             confidence_ABC = support_ABC / support_AB
             BC = B + C
-            num_rule = self.count_items_no_hash(records, BC)
-            support_BC = num_rule / total_records
+            num_BC = self.count_items_no_hash(records, BC)
+            support_BC = num_BC / total_records
             num_rule = self.count_items_hash(records, B)
             support_B = num_rule / total_records
             confidence_BC = support_BC / support_B
@@ -362,12 +620,10 @@ class Anti_discrimination(Anonymization_scheme):
                 # print(f"delta: {delta} <= {confidence_ABC/self.alfa} quedan: {len(DBc_impact)}")
                 if len(DBc_impact) > 0:
                     first_dbc = DBc_impact.pop(0)
-                    records[first_dbc[0]][self.index_class] = C[0].item
-                    self.anonymized_dataset.records[first_dbc[0]].values[
-                        self.index_class
-                    ] = C[0].item
-                    num_rule = self.count_items_no_hash(records, BC)
-                    support_BC = num_rule / total_records
+                    self.set_class_value(records, first_dbc[0], C[0].item)
+                    # the record contained B and not C, so now it is one more record containing BC
+                    num_BC += 1
+                    support_BC = num_BC / total_records
                     confidence_BC = support_BC / support_B
                     delta = confidence_BC
                 else:
@@ -389,6 +645,8 @@ class Anti_discrimination(Anonymization_scheme):
         return False
 
     def get_noA_B_noD_noC(self, records, A, B, D, C):
+        if isinstance(records, Indexed_records):
+            return list(records.cover(B) - records.any_cover(A + D + C))
         noA_B_noD_noC_records = []
         for ind, record in enumerate(records):
             if self.is_any_item_set_in_record(record, A):
@@ -404,6 +662,8 @@ class Anti_discrimination(Anonymization_scheme):
         return noA_B_noD_noC_records
 
     def get_noA_B_noC(self, records, A, B, C):
+        if isinstance(records, Indexed_records):
+            return list(records.cover(B) - records.any_cover(A + C))
         noA_B_noC_records = []
         for ind, record in enumerate(records):
             if self.is_any_item_set_in_record(record, A):
@@ -420,16 +680,14 @@ class Anti_discrimination(Anonymization_scheme):
         print("Calculating metrics on anonymized dataset...")
         # todo: now, last attribute is the class, change to read the class from settings (it has to be the last one)
         index_class = self.anonymized_dataset.num_attr - 1
-        FR_rules_a, PD_rules_a, PND_rules_a = self.create_rules(
-            self.anonymized_dataset, index_class
-        )
-        RR_rules_a, non_RR_rules_a = self.calculate_RR_rules(
-            self.anonymized_dataset, PND_rules_a
-        )
+        (
+            FR_rules_a,
+            RR_rules_a,
+            non_RR_rules_a,
+            MR_rules_a,
+            PR_rules_a,
+        ) = self.calculate_rules(self.anonymized_dataset, index_class)
         RR_rules_a = [rule for rule in RR_rules_a if rule in self.RR_rules]
-        MR_rules_a, PR_rules_a = self.calculate_MR_rules(
-            self.anonymized_dataset, PD_rules_a
-        )
         MR_rules_a = [rule for rule in MR_rules_a if rule in self.MR_rules]
 
         if len(self.RR_rules) > 0:
@@ -453,14 +711,7 @@ class Anti_discrimination(Anonymization_scheme):
 
     def calculate_MR_rules(self, dataset, PD_rules):
         print("Calculating MR and PR rules...")
-        records = []
-        for record in dataset.records:
-            records.append(
-                [
-                    str(record.values[i])
-                    for i in range(0, self.original_dataset.num_attr)
-                ]
-            )
+        records = self.get_records(dataset)
         total_records = len(records)
         MR_rules = []
         PR_rules = []
@@ -493,78 +744,46 @@ class Anti_discrimination(Anonymization_scheme):
 
     def calculate_RR_rules(self, dataset, PND_rules):
         print("Calculating RR and non_RR rules...")
-        records = []
-        for record in dataset.records:
-            records.append(
-                [
-                    str(record.values[i])
-                    for i in range(0, self.original_dataset.num_attr)
-                ]
-            )
-        total_records = len(records)
+        records = self.get_records(dataset)
         RR_rules = []
         non_RR_rules = []
-        for PND_rule in tqdm(PND_rules):
-            ABC_rules = []
-            is_PND_rule_RR = False
-            for num_items_premise in range(1, len(PND_rule.premise) + 1):
-                for permutation_premise in itertools.permutations(
-                    PND_rule.premise, num_items_premise
-                ):
-                    D = []
-                    B = PND_rule.premise[:]
-                    C = PND_rule.consequence
-                    for item in permutation_premise:
-                        D.append(item)
-                        B.remove(item)
-                    confidence_DBC = PND_rule.confidence
-                    BC = B + C
-                    num_rule = self.count_items_hash(records, BC)
-                    support_BC = num_rule / total_records
-                    num_rule = self.count_items_hash(records, B)
-                    support_B = num_rule / total_records
-                    confidence_BC = support_BC / support_B
-                    # Search all A combinations with the premise DB to form DBA
-                    for num_items_DI in range(1, len(self.DI) + 1):
-                        for comb_DI in itertools.combinations(self.DI, num_items_DI):
-                            A = []
-                            for item in comb_DI:
-                                A.append(item)
-                            DBA = PND_rule.premise + A
-                            num_rule = self.count_items_hash(records, DBA)
-                            support_DBA = num_rule / total_records
-                            DB = PND_rule.premise
-                            num_rule = self.count_items_hash(records, DB)
-                            support_DB = num_rule / total_records
-                            confidence_DBA = support_DBA / support_DB
-                            BA = B + A
-                            num_rule = self.count_items_hash(records, BA)
-                            support_BA = num_rule / total_records
-                            if support_BA == 0:
-                                continue
-                            confidence_ABD = support_DBA / support_BA
-                            gamma = confidence_DBC
-                            delta = confidence_BC
-                            beta1 = confidence_ABD
-                            beta2 = confidence_DBA
-                            if beta2 == 0:
-                                continue
-                            elb = self.elb(gamma, delta, beta1, beta2)
-                            if elb >= self.alfa:
-                                # if elb >= 1.0:
-                                is_PND_rule_RR = True
-                                ABC_rule = Rule(A + B, C, None, None)
-                                ABC_rule.A = A[:]
-                                ABC_rule.B = B[:]
-                                ABC_rule.D = D[:]
-                                ABC_rules.append(ABC_rule)
-            if is_PND_rule_RR:
-                RR = [PND_rule, ABC_rules]
-                RR_rules.append(copy.deepcopy(RR))
-                # print(len(RR_rules))
-                # print(RR_rules)
-            else:
-                non_RR_rules.append(PND_rule)
+        if self.n_jobs == 1:
+            results = (
+                self.search_ABC_rules(records, self.DI, self.alfa, PND_rule)
+                for PND_rule in PND_rules
+            )
+            executor = None
+        else:
+            # the records are sent once to each worker (inherited if the processes are forked)
+            executor = ProcessPoolExecutor(
+                max_workers=self.n_jobs,
+                initializer=Anti_discrimination.init_search_ABC_rules,
+                initargs=(
+                    records,
+                    self.DI,
+                    self.alfa,
+                    Anti_discrimination.hash_num_rec,
+                ),
+            )
+            chunksize = max(1, len(PND_rules) // (4 * self.n_jobs))
+            results = executor.map(
+                Anti_discrimination.search_ABC_rules_task,
+                PND_rules,
+                chunksize=chunksize,
+            )
+        try:
+            for PND_rule, ABC_rules in tqdm(
+                zip(PND_rules, results), total=len(PND_rules)
+            ):
+                if len(ABC_rules) > 0:
+                    RR = [PND_rule, ABC_rules]
+                    RR_rules.append(copy.deepcopy(RR))
+                else:
+                    non_RR_rules.append(PND_rule)
+        finally:
+            # the workers are stopped even if the search is interrupted
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
 
         count_IR = 0
         for RR_rule in RR_rules:
@@ -575,22 +794,135 @@ class Anti_discrimination(Anonymization_scheme):
 
         return RR_rules, non_RR_rules
 
-    def elb(self, x, y, b1, b2):
-        f = self.f(x, b1, b2)
+    @staticmethod
+    def init_search_ABC_rules(records, DI, alfa, hash_num_rec):
+        # each worker counts the item sets in its own copy, the counts of the scheme are not modified
+        Anti_discrimination.search_state = (records, DI, alfa, dict(hash_num_rec))
+
+    @staticmethod
+    def search_ABC_rules_task(PND_rule):
+        records, DI, alfa, counts = Anti_discrimination.search_state
+
+        return Anti_discrimination.search_ABC_rules(records, DI, alfa, PND_rule, counts)
+
+    @staticmethod
+    def search_ABC_rules(records, DI, alfa, PND_rule, counts=None):
+        """search_ABC_rules
+
+        Searches the indirect alfa-discriminatory rules ABC of a PND rule DBC: for each split of the premise
+        in D and B (D taken as every permutation of items of the premise), the rules ABC with A a combination
+        of discriminatory items whose elb is at least alfa.
+        The permutations with the same items in D give the same B, so each split is evaluated only once.
+
+        Parameters
+        ----------
+        records : list
+            The list of records (:class:`Indexed_records` if the scheme is indexed).
+        DI : list
+            The list of discriminatory items.
+        alfa : float
+            The discriminatory threshold.
+        PND_rule : :class:`Rule`
+            The PND rule.
+        counts : dict
+            Optional, the number of records containing each item set already counted, the new counts are
+            added to it. If it is omitted, it is taken hash_num_rec
+
+        Returns
+        -------
+        list
+            The list of ABC rules, empty if the PND rule is not a RR rule.
+        """
+        total_records = len(records)
+        ABC_rules = []
+        splits = {}
+        DB = PND_rule.premise
+        C = PND_rule.consequence
+        confidence_DBC = PND_rule.confidence
+        for num_items_premise in range(1, len(DB) + 1):
+            for permutation_premise in itertools.permutations(
+                range(len(DB)), num_items_premise
+            ):
+                D = [DB[i] for i in permutation_premise]
+                B = [DB[i] for i in range(len(DB)) if i not in permutation_premise]
+                key = frozenset(permutation_premise)
+                if key not in splits:
+                    splits[key] = Anti_discrimination.search_A_items(
+                        records,
+                        DI,
+                        alfa,
+                        DB,
+                        B,
+                        C,
+                        confidence_DBC,
+                        total_records,
+                        counts,
+                    )
+                for A in splits[key]:
+                    ABC_rule = Rule(A + B, C, None, None)
+                    ABC_rule.A = A[:]
+                    ABC_rule.B = B[:]
+                    ABC_rule.D = D[:]
+                    ABC_rules.append(ABC_rule)
+
+        return ABC_rules
+
+    @staticmethod
+    def search_A_items(
+        records, DI, alfa, DB, B, C, confidence_DBC, total_records, counts=None
+    ):
+        num_rule = Anti_discrimination.count_items_hash(records, B + C, counts)
+        support_BC = num_rule / total_records
+        num_rule = Anti_discrimination.count_items_hash(records, B, counts)
+        support_B = num_rule / total_records
+        confidence_BC = support_BC / support_B
+        As = []
+        # Search all A combinations with the premise DB to form DBA
+        for num_items_DI in range(1, len(DI) + 1):
+            for comb_DI in itertools.combinations(DI, num_items_DI):
+                A = list(comb_DI)
+                DBA = DB + A
+                num_rule = Anti_discrimination.count_items_hash(records, DBA, counts)
+                support_DBA = num_rule / total_records
+                num_rule = Anti_discrimination.count_items_hash(records, DB, counts)
+                support_DB = num_rule / total_records
+                confidence_DBA = support_DBA / support_DB
+                BA = B + A
+                num_rule = Anti_discrimination.count_items_hash(records, BA, counts)
+                support_BA = num_rule / total_records
+                if support_BA == 0:
+                    continue
+                confidence_ABD = support_DBA / support_BA
+                gamma = confidence_DBC
+                delta = confidence_BC
+                beta1 = confidence_ABD
+                beta2 = confidence_DBA
+                if beta2 == 0:
+                    continue
+                elb = Anti_discrimination.elb(gamma, delta, beta1, beta2)
+                if elb >= alfa:
+                    As.append(A)
+
+        return As
+
+    @staticmethod
+    def elb(x, y, b1, b2):
+        f = Anti_discrimination.f(x, b1, b2)
         if f <= 0:
             return 0
         return f / y
 
-    def f(self, x, b1, b2):
+    @staticmethod
+    def f(x, b1, b2):
         return (b1 / b2) * (b2 + x - 1)
 
     def create_rules(self, dataset, index_class):
+        if self.fpgrowth:
+            return self.create_rules_fpgrowth(dataset, index_class)
         print("Calculating FR rules...")
         Anti_discrimination.hash_num_rec = {}
         len_item_set = dataset.num_attr
-        records = []
-        for record in dataset.records:
-            records.append([str(record.values[i]) for i in range(0, len_item_set)])
+        records = self.get_records(dataset)
         total_records = len(records)
         items_temp = []
         for i in range(0, len_item_set - 1):
@@ -681,6 +1013,97 @@ class Anti_discrimination(Anonymization_scheme):
 
         return FR_rules, PD_rules, PND_rules
 
+    def create_rules_fpgrowth(self, dataset, index_class):
+        """create_rules_fpgrowth
+
+        Calculates the frequent rules X -> C as create_rules, mining the frequent item sets with FP-growth.
+        The rules are listed in the same order as in create_rules.
+
+        Parameters
+        ----------
+        dataset : :class:`Dataset`
+            The data set.
+        index_class : int
+            The index of the class attribute.
+
+        Returns
+        -------
+        list, list, list
+            The frequent rules (FR), the potentially discriminatory ones (PD) and the rest (PND).
+        """
+        print("Calculating FR rules (FP-growth)...")
+        Anti_discrimination.hash_num_rec = {}
+        len_item_set = dataset.num_attr
+        records = self.get_records(dataset)
+        total_records = len(records)
+        # the items and classes are ordered as in create_rules, so the rules are listed in the same order
+        items = {}
+        for i in range(0, len_item_set):
+            set_values = set()
+            for record in records:
+                set_values.add(Item(record[i], i))
+            for position, item in enumerate(set_values):
+                key = (i, item.item.lower())
+                if key not in items:
+                    items[key] = (position, item)
+        clas = sorted(
+            [key for key in items if key[0] == index_class], key=lambda x: items[x][0]
+        )
+
+        min_count = math.ceil(self.min_support * total_records)
+        while min_count > 1 and (min_count - 1) / total_records >= self.min_support:
+            min_count -= 1
+        while min_count / total_records < self.min_support:
+            min_count += 1
+        transactions = [
+            [(i, record[i].lower()) for i in range(0, len_item_set)]
+            for record in records
+        ]
+        item_sets = fim.fpgrowth(
+            transactions, target="s", supp=-max(min_count, 1), zmin=1, report="a"
+        )
+        counts = {}
+        premises = []
+        for item_set, count in item_sets:
+            counts[frozenset(item_set)] = count
+            if all(key[0] != index_class for key in item_set):
+                premises.append(sorted(item_set, key=lambda x: (x[0], items[x][0])))
+        premises.sort(
+            key=lambda X: (len(X), [key[0] for key in X], [items[key][0] for key in X])
+        )
+
+        FR_rules = []
+        PD_rules = []
+        PND_rules = []
+        for keys_X in tqdm(premises):
+            X = [items[key][1] for key in keys_X]
+            num_X = counts[frozenset(keys_X)]
+            Anti_discrimination.hash_num_rec[str(X)] = num_X
+            for key_c in clas:
+                key_rule = frozenset(keys_X + [key_c])
+                if key_rule not in counts:
+                    continue
+                c = items[key_c][1]
+                num_rule = counts[key_rule]
+                Anti_discrimination.hash_num_rec[str(X + [c])] = num_rule
+                support = num_rule / total_records
+                if support >= self.min_support:
+                    confidence = num_rule / num_X
+                    if confidence >= self.min_confidence:
+                        rule = Rule(X, [c], support, confidence)
+                        FR_rules.append(rule)
+                        if self.is_PD_rule(X):
+                            PD_rules.append(rule)
+                        else:
+                            PND_rules.append(rule)
+
+        print("FR Rules: " + str(len(FR_rules)))
+        print("PD Rules: " + str(len(PD_rules)))
+        print("PND Rules: " + str(len(PND_rules)))
+        print("Total FR = PD + PND: " + str(len(PD_rules) + len(PND_rules)))
+
+        return FR_rules, PD_rules, PND_rules
+
     def is_PD_rule(self, X):
         for item in X:
             if item in self.DI:
@@ -811,10 +1234,16 @@ class Anti_discrimination(Anonymization_scheme):
         return num_X
 
     @staticmethod
-    def count_items_hash(records, items):
+    def count_items_hash(records, items, counts=None):
+        if counts is None:
+            counts = Anti_discrimination.hash_num_rec
         key = str(items)
-        if key in Anti_discrimination.hash_num_rec:
-            return Anti_discrimination.hash_num_rec[key]
+        if key in counts:
+            return counts[key]
+        if isinstance(records, Indexed_records):
+            count = records.count(items)
+            counts[key] = count
+            return count
         count = 0
         for record in records:
             ok = True
@@ -824,12 +1253,14 @@ class Anti_discrimination(Anonymization_scheme):
                     break
             if ok:
                 count += 1
-        Anti_discrimination.hash_num_rec[key] = count
+        counts[key] = count
 
         return count
 
     @staticmethod
     def count_items_no_hash(records, items):
+        if isinstance(records, Indexed_records):
+            return records.count(items)
         count = 0
         for record in records:
             ok = True
@@ -856,6 +1287,44 @@ class Anti_discrimination(Anonymization_scheme):
 
         return count
 
+    @staticmethod
+    def calculate_impacts(FR_rules, records):
+        """calculate_impacts
+
+        Calculates the impact of all the records at once, as calculate_impact does for each record.
+        The records covered by the premise of each rule are taken from the index of the records,
+        the cover of a premise is calculated from the cover of its premise without the last item.
+
+        Parameters
+        ----------
+        FR_rules : list
+            The list of frequent rules.
+        records : :class:`Indexed_records`
+            The indexed list of records.
+
+        Returns
+        -------
+        list
+            The impact of each record (the number of rules whose premise is in the record).
+        """
+        num_rules = {}
+        for rule in FR_rules:
+            key = tuple((item.index, item.item.lower()) for item in rule.premise)
+            num_rules[key] = num_rules.get(key, 0) + 1
+        covers = {(): records.all_rows}
+        impacts = np.zeros(len(records), dtype=np.int64)
+        for key in tqdm(sorted(num_rules, key=len)):
+            if key[:-1] in covers:
+                index, value = key[-1]
+                cover = covers[key[:-1]] & records.item_cover(Item(value, index))
+            else:
+                cover = records.cover([Item(value, index) for index, value in key])
+            covers[key] = cover
+            rows = np.frombuffer(cover.to_array(), dtype=np.uint32)
+            impacts[rows] += num_rules[key]
+
+        return impacts.tolist()
+
     @staticmethod
     def is_all_item_set_in_record(record, item_set):
         ok = True
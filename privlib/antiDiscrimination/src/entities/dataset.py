@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 import pandas as pd
 from IPython.display import display
 from privlib.antiDiscrimination.src.entities.record import Record
+import copy
 import random
 
 
@@ -33,6 +34,8 @@ class Dataset(ABC):
         self.records = []
         self.header = []
         self.num_attr = 0
+        # rows of the records shared with another dataset (see copy_on_write)
+        self.shared_rows = set()
         self.load_header()
         self.load_dataset()
         if sample is not None:
@@ -94,6 +97,45 @@ class Dataset(ABC):
         record = Record(len(self.records), values_in)
         self.records.append(record)
 
+    def copy_on_write(self):
+        """copy_on_write
+
+        Creates a copy of the dataset that shares the records with this one.
+        A shared record is only copied the first time one of its values is replaced through set_value,
+        so the records that are not modified are never copied
+
+        Returns
+        -------
+        Dataset
+            The copy of the dataset.
+        """
+        dataset = copy.copy(self)
+        dataset.records = list(self.records)
+        dataset.shared_rows = set(range(len(self.records)))
+
+        return dataset
+
+    def set_value(self, row, index, value):
+        """set_value
+
+        Replaces a value of the record stored in the given row.
+        If the record is shared with another dataset (see copy_on_write), it is copied before
+
+        Parameters
+        ----------
+        row : int
+            The row of the record
+        index : int
+            The index of the attribute
+        value :
+            The new value
+        """
+        if row in self.shared_rows:
+            record = self.records[row]
+            self.records[row] = Record(record.id, list(record.values))
+            self.shared_rows.discard(row)
+        self.records[row].values[index] = value
+
     def dataset_description(self):
         """dataset_description
 
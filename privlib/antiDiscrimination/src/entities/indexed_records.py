@@ -0,0 +1,127 @@
+import pyroaring
+
+
+class Indexed_records(list):
+    """Indexed_records
+
+    Class that represents the list of records used to mine the rules, each record as a list of strings,
+    indexed by item. For each item (attribute index and value, case insensitive as in :class:`Item`)
+    the index stores the bitmap of the records containing it, its cover. The number of records containing a set of
+    items is the cardinality of the intersection of their covers (as tDBIndex in discriminationDiscovery).
+    The values must be replaced through set_value, so the covers are kept up to date.
+    """
+
+    def __init__(self, records):
+        """Constructor, creates the index of the list of records
+
+        Parameters
+        ----------
+        records : list
+            The list of records, each one a list of strings (a value for attribute)
+        """
+        super().__init__(records)
+        self.covers = {}
+        num_attr = len(self[0]) if len(self) > 0 else 0
+        for index in range(num_attr):
+            rows = {}
+            for row, record in enumerate(self):
+                rows.setdefault(record[index].lower(), []).append(row)
+            for value, rows_value in rows.items():
+                self.covers[(index, value)] = pyroaring.BitMap(rows_value)
+        self.all_rows = pyroaring.FrozenBitMap(range(len(self)))
+
+    def item_cover(self, item):
+        """item_cover
+
+        Parameters
+        ----------
+        item : :class:`Item`
+            The item
+
+        Returns
+        -------
+        pyroaring.BitMap
+            The bitmap of the records containing the item (it must not be modified).
+        """
+        key = (item.index, item.item.lower())
+        if key not in self.covers:
+            self.covers[key] = pyroaring.BitMap()
+
+        return self.covers[key]
+
+    def cover(self, items):
+        """cover
+
+        Parameters
+        ----------
+        items : list
+            The list of items
+
+        Returns
+        -------
+        pyroaring.BitMap
+            The bitmap of the records containing all the items.
+        """
+        if len(items) == 0:
+            return pyroaring.BitMap(self.all_rows)
+
+        return pyroaring.BitMap.intersection(*[self.item_cover(item) for item in items])
+
+    def any_cover(self, items):
+        """any_cover
+
+        Parameters
+        ----------
+        items : list
+            The list of items
+
+        Returns
+        -------
+        pyroaring.BitMap
+            The bitmap of the records containing any of the items.
+        """
+        return pyroaring.BitMap.union(
+            pyroaring.BitMap(), *[self.item_cover(item) for item in items]
+        )
+
+    def count(self, items):
+        """count
+
+        Parameters
+        ----------
+        items : list
+            The list of items
+
+        Returns
+        -------
+        int
+            The number of records containing all the items.
+        """
+        if len(items) == 0:
+            return len(self)
+        if len(items) == 1:
+            return len(self.item_cover(items[0]))
+
+        return self.item_cover(items[0]).intersection_cardinality(self.cover(items[1:]))
+
+    def set_value(self, row, index, value):
+        """set_value
+
+        Replaces a value of the record stored in the given row, updating the covers of the old and the new item
+
+        Parameters
+        ----------
+        row : int
+            The row of the record
+        index : int
+            The index of the attribute
+        value : str
+            The new value
+        """
+        record = self[row]
+        self.covers[(index, record[index].lower())].discard(row)
+        key = (index, value.lower())
+        if key not in self.covers:
+            self.covers[key] = pyroaring.BitMap()
+        self.covers[key].add(row)
+        record[index] = value
@@ -0,0 +1,166 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+import numpy as np
+import pandas as pd
+from privlib.antiDiscrimination.src.algorithms.anti_discrimination import (
+    Anti_discrimination,
+)
+from privlib.antiDiscrimination.src.entities.dataset_DataFrame import Dataset_DataFrame
+from privlib.antiDiscrimination.src.entities.indexed_records import Indexed_records
+from privlib.antiDiscrimination.src.utils.rule_cache import Rule_cache
+
+PATH_CSV = os.path.join(
+    os.path.dirname(__file__),
+    "..",
+    "..",
+    "..",
+    "discriminationDiscovery",
+    "tests",
+    "data",
+    "credit.csv",
+)
+ATTRIBUTES = [
+    "personal_status",
+    "age",
+    "foreign_worker",
+    "housing",
+    "job",
+    "savings_status",
+    "class",
+]
+DI = [("personal_status", "female_div_or_dep_or_mar"), ("age", "le_30d2")]
+
+
+def rules(anonymization_scheme):
+    # the order of the rules depends on the hash of the items, so they are compared sorted
+    return [
+        sorted(str(rule) for rule in anonymization_scheme.FR_rules),
+        sorted(str(rule) for rule in anonymization_scheme.MR_rules),
+        sorted(str(rule) for rule in anonymization_scheme.PR_rules),
+        sorted(str(rule[0]) + str(rule[1]) for rule in anonymization_scheme.RR_rules),
+        sorted(str(rule) for rule in anonymization_scheme.non_RR_rules),
+    ]
+
+
+class TestAntiDiscrimination(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        df = pd.read_csv(PATH_CSV)[ATTRIBUTES].iloc[:300]
+        df.name = "credit"
+        cls.dataset = Dataset_DataFrame(df)
+
+    def anonymize(self, **kwargs):
+        anonymization_scheme = Anti_discrimination(
+            self.dataset, 0.05, 0.1, 1.0, DI, **kwargs
+        )
+        anonymization_scheme.calculate_anonymization()
+        records = [
+            str(record) for record in anonymization_scheme.anonymized_dataset.records
+        ]
+
+        return rules(anonymization_scheme), records
+
+    def test_indexed(self):
+        rules_default, records_default = self.anonymize()
+        self.assertGreater(len(rules_default[1]), 0)
+        self.assertGreater(len(rules_default[3]), 0)
+        rules_indexed, records_indexed = self.anonymize(indexed=True)
+        self.assertEqual(rules_indexed, rules_default)
+        self.assertEqual(records_indexed, records_default)
+
+    def test_fpgrowth(self):
+        anonymization_scheme = Anti_discrimination(self.dataset, 0.05, 0.1, 1.0, DI)
+        FR_rules, PD_rules, PND_rules = anonymization_scheme.create_rules(
+            self.dataset, anonymization_scheme.index_class
+        )
+        anonymization_scheme.fpgrowth = True
+        FR_fpgrowth, PD_fpgrowth, PND_fpgrowth = anonymization_scheme.create_rules(
+            self.dataset, anonymization_scheme.index_class
+        )
+        for rule_set, rule_set_fpgrowth in [
+            (FR_rules, FR_fpgrowth),
+            (PD_rules, PD_fpgrowth),
+            (PND_rules, PND_fpgrowth),
+        ]:
+            self.assertGreater(len(rule_set), 0)
+            self.assertEqual(
+                [str(rule) for rule in rule_set_fpgrowth],
+                [str(rule) for rule in rule_set],
+            )
+            self.assertEqual(
+                [(rule.support, rule.confidence) for rule in rule_set_fpgrowth],
+                [(rule.support, rule.confidence) for rule in rule_set],
+            )
+        self.assertEqual(self.anonymize(fpgrowth=True), self.anonymize())
+
+    def test_impacts(self):
+        anonymization_scheme = Anti_discrimination(self.dataset, 0.05, 0.1, 1.0, DI)
+        FR_rules, _, _ = anonymization_scheme.create_rules(
+            self.dataset, anonymization_scheme.index_class
+        )
+        records = anonymization_scheme.get_records(self.dataset)
+        impacts = [
+            Anti_discrimination.calculate_impact(FR_rules, record) for record in records
+        ]
+        self.assertGreater(max(impacts), 0)
+        impacts_batch = Anti_discrimination.calculate_impacts(
+            FR_rules, Indexed_records(records)
+        )
+        self.assertEqual(impacts_batch, impacts)
+
+    def test_n_jobs(self):
+        expected = self.anonymize()
+        for indexed in [False, True]:
+            self.assertEqual(self.anonymize(indexed=indexed, n_jobs=2), expected)
+
+    def test_relabeling(self):
+        # records relabeled by the implementation recounting the support of BC after each change of class
+        expected = [0, 3, 5, 6, 8, 9, 13, 16, 21, 24, 27, 30, 33, 41, 43, 54, 62, 67]
+        expected += [71, 81, 83, 94, 96, 99, 100, 104, 109, 110, 114, 119, 133, 139]
+        expected += [140, 147, 149, 150, 151, 154, 156, 173, 176, 180, 181, 183, 198]
+        expected += [209, 211, 213, 219, 231, 247, 250, 257, 259, 263, 268, 270, 271]
+        expected += [272, 277, 279, 282, 284, 287, 291, 293, 294, 297]
+        original = [str(record) for record in self.dataset.records]
+        for indexed in [False, True]:
+            _, records = self.anonymize(indexed=indexed)
+            relabeled = [
+                row for row, record in enumerate(records) if record != original[row]
+            ]
+            self.assertEqual(relabeled, expected)
+        self.assertEqual([str(record) for record in self.dataset.records], original)
+
+    def test_rule_cache(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            expected = self.anonymize()
+            self.assertEqual(self.anonymize(rule_cache_dir=cache_dir), expected)
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+            key = os.listdir(cache_dir)[0]
+            arrays = Rule_cache(cache_dir).load(key)
+            self.assertTrue(
+                all(isinstance(array, np.memmap) for array in arrays.values())
+            )
+            # a hit loads the rules instead of mining them
+            with mock.patch.object(
+                Anti_discrimination, "create_rules", side_effect=AssertionError
+            ):
+                self.assertEqual(self.anonymize(rule_cache_dir=cache_dir), expected)
+            self.assertEqual(os.listdir(cache_dir), [key])
+            # other parameters or other data miss the cache
+            anonymization_scheme = Anti_discrimination(
+                self.dataset, 0.06, 0.1, 1.0, DI, rule_cache_dir=cache_dir
+            )
+            anonymization_scheme.calculate_anonymization()
+            self.assertEqual(len(os.listdir(cache_dir)), 2)
+            df = pd.read_csv(PATH_CSV)[ATTRIBUTES].iloc[:299]
+            df.name = "credit"
+            anonymization_scheme = Anti_discrimination(
+                Dataset_DataFrame(df), 0.05, 0.1, 1.0, DI, rule_cache_dir=cache_dir
+            )
+            anonymization_scheme.calculate_anonymization()
+            self.assertEqual(len(os.listdir(cache_dir)), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -12,3 +12,6 @@ WINDOW_SIZE = 1
 # border margin is used in differential privacy anonymization
 # it indicates the margin to be applied to the attribute domain
 BORDER_MARGIN = 1.5
+# version of the format of the rules stored by Rule_cache
+# it has to be increased when the format changes, so the old entries are not read
+RULE_CACHE_VERSION = 1
@@ -0,0 +1,114 @@
+import hashlib
+import os
+import shutil
+import numpy as np
+from privlib.antiDiscrimination.src.utils import constants
+
+
+class Rule_cache:
+    """Rule_cache
+
+    Class that stores on disk the rules mined by :class:`Anti_discrimination`, so they are not mined again
+    for the same data set and parameters.
+    Each entry is a directory named by the hash of the data set content and the parameters, that holds one numpy
+    .npy file per array (the rules encoded as item codes), loaded memory-mapped.
+    The format version (RULE_CACHE_VERSION in constants) is part of the key, so entries of other versions are
+    not read.
+
+    See Also
+    --------
+    :class:`Anti_discrimination`
+    """
+
+    def __init__(self, cache_dir):
+        """Constructor
+
+        Parameters
+        ----------
+        cache_dir : str
+            The directory of the cache.
+        """
+        self.cache_dir = os.path.expanduser(cache_dir)
+
+    @staticmethod
+    def calculate_key(header, records, parameters):
+        """calculate_key
+
+        Calculates the key of an entry from the content of the data set and the parameters
+
+        Parameters
+        ----------
+        header : list
+            The names of the attributes.
+        records : list
+            The list of records, each one a list of strings.
+        parameters : list
+            The parameters the rules depend on (min_support, min_confidence, alfa, DI...).
+
+        Returns
+        -------
+        str
+            The key of the entry.
+        """
+        digest = hashlib.sha1()
+        digest.update(f"v{constants.RULE_CACHE_VERSION}\n".encode("utf-8"))
+        digest.update(repr(parameters).encode("utf-8"))
+        digest.update(("\n" + "\x1f".join(header) + "\n").encode("utf-8"))
+        for record in records:
+            digest.update(("\x1f".join(record) + "\n").encode("utf-8"))
+
+        return digest.hexdigest()
+
+    def entry_path(self, key):
+        return os.path.join(self.cache_dir, key)
+
+    def load(self, key):
+        """load
+
+        Loads the arrays of an entry, memory-mapped
+
+        Parameters
+        ----------
+        key : str
+            The key of the entry.
+
+        Returns
+        -------
+        dict
+            The arrays by name, or None if the entry is not in the cache.
+        """
+        path = self.entry_path(key)
+        if not os.path.isdir(path):
+            return None
+        arrays = {}
+        for file_name in os.listdir(path):
+            name, extension = os.path.splitext(file_name)
+            if extension == ".npy":
+                arrays[name] = np.load(os.path.join(path, file_name), mmap_mode="r")
+
+        return arrays
+
+    def save(self, key, arrays):
+        """save
+
+        Stores the arrays of an entry. They are written in a temporary directory that is renamed at the end,
+        so an entry is never read partially written.
+
+        Parameters
+        ----------
+        key : str
+            The key of the entry.
+        arrays : dict
+            The arrays by name.
+        """
+        path = self.entry_path(key)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path_tmp = f"{path}.{os.getpid()}.tmp"
+        os.makedirs(path_tmp, exist_ok=True)
+        for name, array in arrays.items():
+            np.save(os.path.join(path_tmp, name + ".npy"), array, allow_pickle=False)
+        try:
+            os.rename(path_tmp, path)
+        except OSError:
+            # stored meanwhile by another process
+            shutil.rmtree(path_tmp, ignore_errors=True)
@@ -8,6 +8,7 @@ version 1.0
 
 import numpy as np
 import pandas as pd
+from pandas.core.dtypes.cast import find_common_type
 import pyroaring
 import csv
 import fim
@@ -15,7 +16,10 @@ import sys
 import urllib
 import gzip
 import codecs
+import heapq
+import multiprocessing
 import queue as Q
+from concurrent.futures import ThreadPoolExecutor
 
 """
  Return a reader from a file, url, or gzipped file/url
@@ -147,6 +151,64 @@ def PD2tranDB(df, na_values="NaN", one_hot_set=None):
     return (tDB, codes, decodes)
 
 
+"""
+ Code attribute=value as an item in a DataFrame as PD2tranDB, factorizing each column once.
+ Items are coded in the same order as PD2tranDB (the order of first occurrence, by row and column).
+ Returns the transactions in CSR format (the items of all transactions and the offset of each transaction),
+ plus coding and decoding dictionaries
+"""
+
+
+def PD2tranCSR(df, na_values="NaN", one_hot_set=None):
+    if one_hot_set is None:
+        one_hot_set = set(a for a in df.columns.to_list() if get_att(a) != "")
+    # values of the columns with the common type of a row (as in df.iterrows)
+    dtype = find_common_type(df.dtypes.to_list())
+    if not isinstance(dtype, np.dtype):
+        dtype = object
+    nrows, ncolumns = df.shape
+    columns_codes = []
+    candidates = []
+    for j, att in enumerate(df.columns.to_list()):
+        column = df.iloc[:, j].to_numpy(dtype=dtype)
+        column_codes, uniques = pd.factorize(column)
+        uniques = list(uniques)
+        nulls = np.flatnonzero(column_codes < 0)
+        if len(nulls) > 0:
+            # missing values (None, nan...) are kept apart, as they are written differently
+            nulls_codes = {}
+            for row in nulls:
+                item = column[row]
+                code = nulls_codes.get(str(item))
+                if code is None:
+                    nulls_codes[str(item)] = code = len(uniques)
+                    uniques.append(item)
+                column_codes[row] = code
+        _, first_rows = np.unique(column_codes, return_index=True)
+        for u, item in enumerate(uniques):
+            if item == na_values:
+                continue
+            if item == 0 and att in one_hot_set:
+                continue
+            candidates.append((first_rows[u], j, u, att + "=" + str(item)))
+        columns_codes.append((column_codes, len(uniques)))
+    candidates.sort(key=lambda x: (x[0], x[1]))
+    maps = [np.full(nuniques, -1, dtype=np.int64) for _, nuniques in columns_codes]
+    codes = {}
+    for _, j, u, attitem in candidates:
+        maps[j][u] = codes.setdefault(attitem, len(codes))
+    matrix = np.empty((nrows, ncolumns), dtype=np.int64)
+    for j, (column_codes, _) in enumerate(columns_codes):
+        matrix[:, j] = maps[j][column_codes]
+    # skipped values are coded -1
+    keep = matrix >= 0
+    indices = matrix[keep]
+    offsets = np.zeros(nrows + 1, dtype=np.int64)
+    np.cumsum(keep.sum(axis=1), out=offsets[1:])
+    decodes = {code: attitem for attitem, code in codes.items()}
+    return (indices, offsets, codes, decodes)
+
+
 """ A transaction database index storing covers of item in bitmaps """
 
 
@@ -165,6 +227,24 @@ class tDBIndex:
         self.ncolumns = len(items)
         self.nrows = len(tDB)
 
+    """ build the index from transactions in CSR format (see PD2tranCSR) """
+
+    @staticmethod
+    def from_CSR(indices, offsets):
+        index = tDBIndex([])
+        nrows = len(offsets) - 1
+        tids = np.repeat(np.arange(nrows, dtype=np.uint32), np.diff(offsets))
+        order = np.argsort(indices, kind="stable")
+        items, starts = np.unique(indices[order], return_index=True)
+        ends = np.append(starts[1:], len(order))
+        index.covers = {
+            int(item): pyroaring.FrozenBitMap(tids[order[start:end]])
+            for item, start, end in zip(items, starts, ends)
+        }
+        index.ncolumns = len(items)
+        index.nrows = nrows
+        return index
+
     """ return cover of an itemset/list of items """
 
     def cover(self, itemset, base=None):
@@ -179,6 +259,30 @@ class tDBIndex:
             base, *[self.covers[item] for item in itemset]
         )
 
+    """
+     return (itemset, cover) of the frequent itemsets (itemset, support) as output by fim: depth first,
+     each itemset extending a previous one with the last item (all of them for target="s").
+     The covers of the itemsets in the current path are kept in a stack, so the cover of an itemset is the cover
+     of its longest common prefix with the previous one intersected with the covers of the rest of items
+    """
+
+    def prefix_covers(self, fisets):
+        path = []
+        stack = []
+        for fi in fisets:
+            itemset = fi[0]
+            k = 0
+            n = min(len(path), len(itemset))
+            while k < n and path[k] == itemset[k]:
+                k += 1
+            del path[k:]
+            del stack[k:]
+            for item in itemset[k:]:
+                cover = self.covers[item]
+                stack.append(cover if len(stack) == 0 else stack[-1] & cover)
+                path.append(item)
+            yield fi, stack[-1] if len(stack) > 0 else self.cover([])
+
     """ return support of an itemset/list of items """
 
     def supp(self, itemset, base=None):
@@ -218,11 +322,12 @@ class ContingencyTable:
     def m2(self):
         return self.b + self.d
 
+    # tables of the same context are ordered by protected group, so the top tables are well defined
     def __lt__(self, other):
-        return self.ctx < other.ctx
+        return (self.ctx, self.protected) < (other.ctx, other.protected)
 
     def __eq__(self, other):
-        return self.ctx == other.ctx
+        return self.ctx == other.ctx and self.protected == other.protected
 
     def __hash__(self):
         return hash(self.ctx)
@@ -300,9 +405,23 @@ def check_rd(ctg, minSupp=20, threshold=0.1):
 
 class DD:
     def __init__(
-        self, df, unprotectedDesc, negdecDesc, na_values=None, one_hot_set=None
+        self,
+        df,
+        unprotectedDesc,
+        negdecDesc,
+        na_values=None,
+        one_hot_set=None,
+        vectorized=False,
     ):
-        if isinstance(df, pd.DataFrame):
+        self.tIndices = None
+        self.tDB = None
+        if isinstance(df, pd.DataFrame) and vectorized:
+            # transactions coded column by column (see PD2tranCSR), only kept as CSR arrays
+            na_values = "NaN" if na_values is None else na_values
+            self.tIndices, self.tOffsets, self.codes, self.decodes = PD2tranCSR(
+                df, na_values=na_values, one_hot_set=one_hot_set
+            )
+        elif isinstance(df, pd.DataFrame):
             na_values = "NaN" if na_values is None else na_values
             self.tDB, self.codes, self.decodes = PD2tranDB(
                 df, na_values=na_values, one_hot_set=one_hot_set
@@ -332,22 +451,40 @@ class DD:
             raise ("binary decisions only!")
         self.pos_dec = pos_decs[0]
         self.posdecDesc = self.decodes[self.pos_dec]
-        self.itDB = tDBIndex(self.tDB)
+        if self.tIndices is not None:
+            self.itDB = tDBIndex.from_CSR(self.tIndices, self.tOffsets)
+        else:
+            self.itDB = tDBIndex(self.tDB)
         self.unprCover = self.itDB.covers[self.unprotected]
         self.negCover = self.itDB.covers[self.neg_dec]
         self.avg_neg = len(self.negCover) / self.itDB.nrows
 
-    def extract(self, testCond=lambda x: True, minSupp=20, target="c", maxn=0):
+    """
+     Extract the top maxn contingency tables of the contexts (frequent itemsets) that pass testCond.
+     With reuse_covers, the cover of each itemset is derived from the cover of its parent (see tDBIndex.prefix_covers).
+     With n_jobs > 1, the contexts are evaluated in parallel (see extract_parallel).
+    """
+
+    def extract(
+        self,
+        testCond=lambda x: True,
+        minSupp=20,
+        target="c",
+        maxn=0,
+        n_jobs=1,
+        reuse_covers=False,
+    ):
         exclude = {
             self.codes[v]
             for v in self.codes
             if get_att(v) in {self.sensitiveAtt, self.decisionAtt}
         }
-        tDBprojected = [list(set(t) - exclude) for t in self.tDB]
+        tDBprojected = self.projected_tDB(exclude)
         fisets = fim.fpgrowth(tDBprojected, supp=minSupp, zmin=0, target=target)
+        if n_jobs != 1:
+            return self.extract_parallel(fisets, testCond, maxn, n_jobs, reuse_covers)
         q = Q.PriorityQueue()
-        for fi in fisets:
-            base = self.itDB.cover(fi[0])
+        for fi, base in self.covers(fisets, reuse_covers):
             n2 = base.intersection_cardinality(self.unprCover)
             base_neg = base & self.negCover
             c = base_neg.intersection_cardinality(self.unprCover)
@@ -364,6 +501,74 @@ class DD:
                         q.get()
         return sorted([x for x in q.queue], reverse=True)
 
+    """
+     Evaluate the contexts of the frequent itemsets in parallel, each worker evaluates a range of itemsets
+     keeping its top maxn contingency tables (and those tied with the last one).
+     The tables of the workers are merged in the order of the itemsets, as extract does, so the result is the same.
+     Workers are forked processes (they inherit the index and testCond), or threads where fork is not available.
+    """
+
+    def projected_tDB(self, exclude):
+        # the transactions without the items in exclude, as the lists given to fim.fpgrowth
+        if self.tIndices is None:
+            return [list(set(t) - exclude) for t in self.tDB]
+        keep = ~np.isin(self.tIndices, list(exclude))
+        offsets = np.concatenate(([0], np.cumsum(keep)))[self.tOffsets].tolist()
+        items = self.tIndices[keep].tolist()
+        return [items[offsets[i] : offsets[i + 1]] for i in range(len(offsets) - 1)]
+
+    def extract_parallel(self, fisets, testCond, maxn, n_jobs, reuse_covers=False):
+        global _extract_state
+        nchunks = 4 * n_jobs
+        size = (len(fisets) + nchunks - 1) // nchunks
+        ranges = [(i, min(i + size, len(fisets))) for i in range(0, len(fisets), size)]
+        _extract_state = (self, fisets, testCond, maxn, reuse_covers)
+        try:
+            if "fork" in multiprocessing.get_all_start_methods():
+                context = multiprocessing.get_context("fork")
+                with context.Pool(n_jobs) as pool:
+                    results = pool.map(_extract_range, ranges)
+            else:
+                with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+                    results = list(executor.map(_extract_range, ranges))
+        finally:
+            _extract_state = None
+        q = Q.PriorityQueue()
+        for result in results:
+            for v, ctg in result:
+                q.put((v, ctg))
+                if q.qsize() > maxn:
+                    q.get()
+        return sorted([x for x in q.queue], reverse=True)
+
+    """ return (itemset, cover) of the frequent itemsets """
+
+    def covers(self, fisets, reuse_covers=False):
+        if reuse_covers:
+            return self.itDB.prefix_covers(fisets)
+        return ((fi, self.itDB.cover(fi[0])) for fi in fisets)
+
+    """ Evaluate the contexts of the frequent itemsets in a range, as extract does """
+
+    def extract_range(self, fisets, start, end, testCond, maxn, reuse_covers=False):
+        result = []
+        for fi, base in self.covers(fisets[start:end], reuse_covers):
+            n2 = base.intersection_cardinality(self.unprCover)
+            base_neg = base & self.negCover
+            c = base_neg.intersection_cardinality(self.unprCover)
+            for protected in self.protected:
+                prCover = self.itDB.covers[protected]
+                n1 = base.intersection_cardinality(prCover)
+                a = base_neg.intersection_cardinality(prCover)
+                ctg = ContingencyTable(a, n1, c, n2, self.avg_neg)
+                v = testCond(ctg)
+                if v is not None:
+                    ctg.ctx, ctg.protected = fi[0], protected
+                    result.append((v, ctg))
+                    if len(result) > 2 * maxn + 1000:
+                        result = _top_tables(result, maxn)
+        return _top_tables(result, maxn)
+
     def print(self, ctg):
         protectedDesc = self.decodes[ctg.protected]
         n = ctg.n()
@@ -386,6 +591,31 @@ class DD:
         print(spec.format("", ctg.m1(), ctg.m2(), n))
 
 
+_extract_state = None
+
+
+""" Evaluate a range of frequent itemsets in a worker of DD.extract_parallel """
+
+
+def _extract_range(bounds):
+    disc, fisets, testCond, maxn, reuse_covers = _extract_state
+    return disc.extract_range(
+        fisets, bounds[0], bounds[1], testCond, maxn, reuse_covers
+    )
+
+
+""" Keep the top maxn (value, table) pairs, and those tied with the last one, in their order """
+
+
+def _top_tables(result, maxn):
+    if maxn <= 0:
+        return []
+    if len(result) <= maxn:
+        return result
+    threshold = min(heapq.nlargest(maxn, result))
+    return [x for x in result if not x < threshold]
+
+
 """
 Sample usage 
 if __name__ == '__main__':
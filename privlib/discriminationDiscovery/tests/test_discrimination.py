@@ -16,5 +16,59 @@ class TestDD(unittest.TestCase):
             v, ctg = ctgs[i]
             self.assertEqual(v, r[i])
 
+    def test_vectorized_dd(self):
+        disc = DD(self.df, "foreign_worker=no", "class=bad")
+        disc_vectorized = DD(self.df, "foreign_worker=no", "class=bad", vectorized=True)
+        self.assertEqual(disc_vectorized.codes, disc.codes)
+        self.assertIsNone(disc_vectorized.tDB)
+        tDB_vectorized = np.split(
+            disc_vectorized.tIndices, disc_vectorized.tOffsets[1:-1]
+        )
+        self.assertEqual(len(tDB_vectorized), len(disc.tDB))
+        for t_vectorized, t in zip(tDB_vectorized, disc.tDB):
+            np.testing.assert_array_equal(t_vectorized, t)
+        exclude = {disc.unprotected, disc.neg_dec}
+        self.assertEqual(
+            [sorted(t) for t in disc_vectorized.projected_tDB(exclude)],
+            [sorted(t) for t in disc.projected_tDB(exclude)],
+        )
+        self.assertEqual(disc_vectorized.itDB.covers, disc.itDB.covers)
+        ctgs = disc.extract(testCond=check_rd, minSupp=-20, maxn=100)
+        ctgs_vectorized = disc_vectorized.extract(
+            testCond=check_rd, minSupp=-20, maxn=100
+        )
+        self.assertEqual(
+            [(v, ctg.ctx, ctg.protected) for v, ctg in ctgs_vectorized],
+            [(v, ctg.ctx, ctg.protected) for v, ctg in ctgs],
+        )
+
+    def test_parallel_extract(self):
+        disc = DD(self.df, "foreign_worker=no", "class=bad", vectorized=True)
+        for testCond, maxn in [(check_rd, 100), (lambda ctg: round(ctg.rd(), 1), 30)]:
+            ctgs = disc.extract(testCond=testCond, minSupp=-20, maxn=maxn)
+            ctgs_parallel = disc.extract(
+                testCond=testCond, minSupp=-20, maxn=maxn, n_jobs=2
+            )
+            self.assertEqual(
+                [(v, ctg.ctx, ctg.protected, ctg.a, ctg.c) for v, ctg in ctgs_parallel],
+                [(v, ctg.ctx, ctg.protected, ctg.a, ctg.c) for v, ctg in ctgs],
+            )
+
+    def test_reuse_covers(self):
+        disc = DD(self.df, "foreign_worker=no", "class=bad", vectorized=True)
+        for target in ["c", "s"]:
+            ctgs = disc.extract(testCond=check_rd, minSupp=-20, maxn=100, target=target)
+            ctgs_reuse = disc.extract(
+                testCond=check_rd,
+                minSupp=-20,
+                maxn=100,
+                target=target,
+                reuse_covers=True,
+            )
+            self.assertEqual(
+                [(v, ctg.ctx, ctg.protected, ctg.a, ctg.c) for v, ctg in ctgs_reuse],
+                [(v, ctg.ctx, ctg.protected, ctg.a, ctg.c) for v, ctg in ctgs],
+            )
+
     if __name__ == "__main__":
         unittest.main()
@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from .utils import date_time_precision
+from .utils import date_time_precision, encode, code_counts, contains_counts
 from . import constants
 from pandas.errors import AbstractMethodError
+import numpy as np
 import pandas as pd
 
 __all__ = [
@@ -20,8 +21,18 @@ class BackgroundKnowledgeAttack(ABC):
     Abstract class for a generic background knowledge based attack. Defines a series of functions common to all attacks.
     Provides basic functions to match a background knowledge instance to individual's data and a preprocessing function.
 
+    The attributes index_keys and exact_index describe the attack to an InvertedIndex: index_keys are the attributes
+    whose values identify an element of the background knowledge, and exact_index is True when an instance matches
+    exactly the data containing each of its elements at least as many times as the instance does.
+    The attribute ordered_index is True when the compiled data of the attack must be matched keeping the order of the
+    elements, through a SequenceIndex instead of a CompiledIndex.
+
     """
 
+    index_keys = [constants.ELEMENTS]
+    exact_index = False
+    ordered_index = False
+
     @abstractmethod
     def preprocess(data, **kwargs):
         """preprocess
@@ -56,6 +67,58 @@ class BackgroundKnowledgeAttack(ABC):
         raise AbstractMethodError(single_priv_df)
 
 
+def compiled_matching(single_priv_df, case):
+    """compiled_matching
+    Matching function for the attacks whose data was encoded at preprocess (compiled), using the codes of the elements.
+    The instance matches if the multiset of its codes is contained in the multiset of the codes of the individual.
+
+    Parameters
+    ----------
+    single_priv_df : SequentialPrivacyFrame
+        the data of a single individual.
+
+    case : list or numpy array
+        the background knowledge instance.
+    Returns
+    -------
+    int
+        1 if the instance matches the single_priv_df, 0 otherwise.
+    """
+    position = single_priv_df.columns.get_loc(constants.CODE)
+    case_codes = [row[position] for row in case]
+    return contains_counts(
+        code_counts(single_priv_df[constants.CODE].values), code_counts(case_codes)
+    )
+
+
+def compiled_sequence_matching(single_priv_df, case):
+    """compiled_sequence_matching
+    Matching function for the attacks whose data was encoded at preprocess (compiled), using the codes of the elements
+    and their order. The instance matches if its codes are a subsequence of the codes of the individual.
+
+    Parameters
+    ----------
+    single_priv_df : SequentialPrivacyFrame
+        the data of a single individual.
+
+    case : list or numpy array
+        the background knowledge instance.
+    Returns
+    -------
+    int
+        1 if the instance matches the single_priv_df, 0 otherwise.
+    """
+    position = single_priv_df.columns.get_loc(constants.CODE)
+    codes = single_priv_df[constants.CODE].values
+    start = 0
+    for row in case:
+        found = np.flatnonzero(codes[start:] == row[position])
+        if len(found) == 0:
+            return 0
+        start += found[0] + 1
+    return 1
+
+
 class TabularAttack:
     """TabularAttack
 
@@ -113,6 +176,9 @@ class ElementsAttack(BackgroundKnowledgeAttack):
 
     """
 
+    index_keys = [constants.ELEMENTS]
+    exact_index = True
+
     def preprocess(data, **kwargs):
         """preprocess
 
@@ -125,7 +191,10 @@ class ElementsAttack(BackgroundKnowledgeAttack):
 
         **kwargs : mapping, optional
             further arguments for preprocessing that can be passed from the RiskEvaluator, for example aggregation_levels
+            and compiled: if True, the elements are encoded as integer codes in a new attribute, used by matching.
         """
+        if kwargs.get(constants.COMPILED, False):
+            data[constants.CODE] = encode(data, [constants.ELEMENTS])
         data.sort_values(
             by=[constants.USER_ID, constants.DATETIME], ascending=True, inplace=True
         )
@@ -148,6 +217,8 @@ class ElementsAttack(BackgroundKnowledgeAttack):
         int
             1 if the instance matches the single_priv_df, 0 otherwise.
         """
+        if constants.CODE in single_priv_df:
+            return compiled_matching(single_priv_df, case)
         occ = pd.DataFrame(data=case, columns=single_priv_df.columns)
         occ = occ.astype(dtype=dict(single_priv_df.dtypes))
         occ = (
@@ -192,6 +263,8 @@ class SequenceAttack(BackgroundKnowledgeAttack):
 
     """
 
+    ordered_index = True
+
     def preprocess(data, **kwargs):
         """preprocess
 
@@ -204,7 +277,10 @@ class SequenceAttack(BackgroundKnowledgeAttack):
 
         **kwargs : mapping, optional
             further arguments for preprocessing that can be passed from the RiskEvaluator, for example aggregation_levels
+            and compiled: if True, the elements are encoded as integer codes in a new attribute, used by matching.
         """
+        if kwargs.get(constants.COMPILED, False):
+            data[constants.CODE] = encode(data, [constants.ELEMENTS])
         data.sort_values(
             by=[constants.USER_ID, constants.ORDER_ID], ascending=True, inplace=True
         )
@@ -227,6 +303,8 @@ class SequenceAttack(BackgroundKnowledgeAttack):
         int
             1 if the instance matches the single_priv_df, 0 otherwise.
         """
+        if constants.CODE in single_priv_df:
+            return compiled_sequence_matching(single_priv_df, case)
         occ = pd.DataFrame(data=case, columns=single_priv_df.columns)
         occ_iterator = occ.iterrows()
         occ_line = next(occ_iterator)[1]
@@ -261,6 +339,9 @@ class TimeAttack(BackgroundKnowledgeAttack):
 
     """
 
+    index_keys = [constants.ELEMENTS, constants.TEMP]
+    exact_index = True
+
     def preprocess(data, **kwargs):
         """preprocess
 
@@ -273,6 +354,7 @@ class TimeAttack(BackgroundKnowledgeAttack):
 
         **kwargs : mapping, optional
             further arguments for preprocessing that can be passed from the RiskEvaluator, for example aggregation_levels
+            and compiled: if True, the elements are encoded as integer codes in a new attribute, used by matching.
         """
         if constants.DATETIME not in data:
             raise AttributeError(
@@ -286,6 +368,8 @@ class TimeAttack(BackgroundKnowledgeAttack):
         data[constants.TEMP] = data[constants.DATETIME].apply(
             lambda x: date_time_precision(x, precision)
         )
+        if kwargs.get(constants.COMPILED, False):
+            data[constants.CODE] = encode(data, [constants.ELEMENTS, constants.TEMP])
         data.sort_values(
             by=[constants.USER_ID, constants.DATETIME], ascending=True, inplace=True
         )
@@ -308,6 +392,8 @@ class TimeAttack(BackgroundKnowledgeAttack):
         int
             1 if the instance matches the single_priv_df, 0 otherwise.
         """
+        if constants.CODE in single_priv_df:
+            return compiled_matching(single_priv_df, case)
         occ = pd.DataFrame(data=case, columns=single_priv_df.columns)
         occ = (
             occ.groupby([constants.ELEMENTS, constants.TEMP])
@@ -0,0 +1,145 @@
+from collections import OrderedDict
+from threading import Lock
+
+from . import constants
+
+__all__ = ["CaseCache"]
+
+
+class CaseCache:
+    """CaseCache
+
+    Bounded cache of the number of groups of data (the individuals, or the sequences of the individuals) matching a
+    background knowledge instance, shared by all the individuals assessed by a RiskEvaluator. Different individuals
+    often generate the same instances (e.g., frequently visited locations), whose matches are then counted only once.
+    The instances are canonicalized before being looked up: the elements (the values of the index_keys of the attack,
+    i.e., the element and its time bucket for TimeAttack) are encoded as integer codes, sorted unless the order matters
+    for the attack (its ordered_index is True). Only the attacks fully decided by their elements (exact_index or
+    ordered_index True) can be cached.
+    When the cache is full, the least recently used count is evicted.
+    The cache can be shared by threads (see parallel_apply), its operations hold a lock.
+
+    Parameters
+    ----------
+    data : SequentialPrivacyFrame
+        the data, already preprocessed by the attack.
+
+    attack : BackgroundKnowledgeAttack
+        the attack whose matches are counted.
+
+    max_size : int
+        the maximum number of counts in the cache.
+    """
+
+    def __init__(self, data, attack, max_size):
+        self._ordered = attack.ordered_index
+        self._max_size = max_size
+        self._counts = OrderedDict()
+        self._codes = {}
+        self._lock = Lock()
+        if constants.CODE in data:
+            self._key_positions = [data.columns.get_loc(constants.CODE)]
+        else:
+            self._key_positions = [
+                data.columns.get_loc(key) for key in attack.index_keys
+            ]
+
+    @staticmethod
+    def supports(attack):
+        """supports
+
+        Parameters
+        ----------
+        attack : BackgroundKnowledgeAttack
+            an attack.
+
+        Returns
+        -------
+        bool
+            True if the matches of the attack are determined by the canonical form of the instances.
+        """
+        return attack.exact_index or attack.ordered_index
+
+    def __len__(self):
+        return len(self._counts)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+    def key(self, case):
+        """key
+
+        Canonicalizes a background knowledge instance.
+
+        Parameters
+        ----------
+        case : list or numpy array
+            the background knowledge instance, its rows with the attributes of the data.
+
+        Returns
+        -------
+        tuple
+            the codes of the elements of the case, sorted if their order does not matter.
+        """
+        codes = []
+        with self._lock:
+            for row in case:
+                value = tuple(row[position] for position in self._key_positions)
+                code = self._codes.get(value)
+                if code is None:
+                    code = len(self._codes)
+                    self._codes[value] = code
+                codes.append(code)
+        if not self._ordered:
+            codes.sort()
+        return tuple(codes)
+
+    def get(self, key):
+        """get
+
+        Gets a count from the cache, marking it as the most recently used
+
+        Parameters
+        ----------
+        key : tuple
+            the canonical form of the case.
+
+        Returns
+        -------
+        int
+            the number of matching groups, or None if it is not in the cache.
+        """
+        with self._lock:
+            count = self._counts.get(key)
+            if count is not None:
+                self._counts.move_to_end(key)
+        return count
+
+    def set(self, key, count):
+        """set
+
+        Stores a count in the cache, evicting the least recently used one if it is full
+
+        Parameters
+        ----------
+        key : tuple
+            the canonical form of the case.
+
+        count : int
+            the number of matching groups.
+        """
+        with self._lock:
+            self._counts[key] = count
+            self._counts.move_to_end(key)
+            if len(self._counts) > self._max_size:
+                self._counts.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._counts.clear()
@@ -0,0 +1,369 @@
+import numpy as np
+
+from . import constants
+from .utils import code_counts
+
+__all__ = ["CompiledIndex", "SequenceIndex"]
+
+
+class CompiledIndex:
+    """CompiledIndex
+
+    Index of the preprocessed data of a RiskEvaluator whose elements were encoded as integer codes by a compiled attack
+    (see the compiled argument of ElementsAttack.preprocess). A background knowledge instance matches a group of data
+    (an individual, or a sequence of an individual) if the multiset of its codes is contained in the one of the group.
+    As in an InvertedIndex, the index stores the posting list of each code, i.e., the groups containing the code and
+    how many times they contain it, and a case is answered by intersecting the posting lists of its codes, so only the
+    groups containing its elements are visited. The codes decide the matching, so no candidate is checked again.
+
+    Parameters
+    ----------
+    data : SequentialPrivacyFrame
+        the data, already preprocessed by the attack with compiled=True.
+
+    group_keys : list
+        the attributes identifying the groups, for example [user id] or [user id, sequence id].
+    """
+
+    def __init__(self, data, group_keys):
+        self._data = data
+        group_codes = data.groupby(group_keys, sort=True).ngroup().values
+        self._n_groups = int(group_codes.max()) + 1 if len(group_codes) > 0 else 0
+        self._group_first_rows = np.unique(group_codes, return_index=True)[1]
+        codes = data[constants.CODE].values.astype(np.int64)
+        self._code_position = data.columns.get_loc(constants.CODE)
+        self._n_codes = int(codes.max()) + 1 if len(codes) > 0 else 0
+        # posting lists, sorted by code and group
+        pairs, counts = np.unique(
+            codes * self._n_groups + group_codes, return_counts=True
+        )
+        self._posting_groups = pairs % self._n_groups
+        self._posting_counts = counts
+        self._posting_offsets = np.concatenate(
+            (
+                [0],
+                np.cumsum(
+                    np.bincount(pairs // self._n_groups, minlength=self._n_codes)
+                ),
+            )
+        )
+
+    @property
+    def n_groups(self):
+        return self._n_groups
+
+    def group_values(self, key):
+        """group_values
+
+        Parameters
+        ----------
+        key : str
+            one of the group keys.
+
+        Returns
+        -------
+        numpy array
+            the value of the key for each group.
+        """
+        return self._data[key].values[self._group_first_rows]
+
+    def case_counts(self, case):
+        """case_counts
+
+        Parameters
+        ----------
+        case : list or numpy array
+            the background knowledge instance, its rows with the attributes of the data.
+
+        Returns
+        -------
+        tuple
+            the sorted distinct codes of the case and the number of times each one appears.
+        """
+        return code_counts([row[self._code_position] for row in case])
+
+    def matching_groups(self, case):
+        """matching_groups
+
+        Finds the groups matching a background knowledge instance.
+
+        Parameters
+        ----------
+        case : list or numpy array
+            the background knowledge instance.
+
+        Returns
+        -------
+        numpy array
+            the sorted positions of the groups that match the case.
+        """
+        case_codes, case_numbers = self.case_counts(case)
+        if len(case_codes) > 0 and (
+            case_codes[0] < 0 or case_codes[-1] >= self._n_codes
+        ):
+            return np.empty(0, dtype=np.int64)
+        # the shortest posting lists first, so the candidates shrink as soon as possible
+        lengths = (
+            self._posting_offsets[case_codes + 1] - self._posting_offsets[case_codes]
+        )
+        candidates = None
+        for i in np.argsort(lengths, kind="stable"):
+            start = self._posting_offsets[case_codes[i]]
+            end = self._posting_offsets[case_codes[i] + 1]
+            groups = self._posting_groups[start:end][
+                self._posting_counts[start:end] >= case_numbers[i]
+            ]
+            if candidates is None:
+                candidates = groups
+            else:
+                candidates = np.intersect1d(candidates, groups, assume_unique=True)
+            if len(candidates) == 0:
+                break
+        if candidates is None:
+            candidates = np.arange(self._n_groups)
+
+        return candidates
+
+    def batch_matching_groups(self, cases):
+        """batch_matching_groups
+
+        Parameters
+        ----------
+        cases : list
+            the background knowledge instances.
+
+        Returns
+        -------
+        list
+            the sorted positions of the groups that match each case.
+        """
+        return [self.matching_groups(case) for case in cases]
+
+    def count(self, case):
+        """count
+
+        Parameters
+        ----------
+        case : list or numpy array
+            the background knowledge instance.
+
+        Returns
+        -------
+        int
+            the number of groups that match the case.
+        """
+        return len(self.matching_groups(case))
+
+
+class SequenceIndex:
+    """SequenceIndex
+
+    Index of the preprocessed data of a RiskEvaluator whose elements were encoded as integer codes by a compiled attack
+    that keeps the order of the elements (see the compiled argument of SequenceAttack.preprocess). A background
+    knowledge instance matches a group of data (an individual, or a sequence of an individual) if its codes are a
+    subsequence of the codes of the group.
+    The codes of all the groups are stored in a contiguous array, each group after the other in the order of the data,
+    together with a next occurrence table: the positions of each code, sorted by code and position. The next occurrence
+    of a code from a position is found with a np.searchsorted on the table, so checking an instance is one jump per
+    element of the instance, done at once for many instances and groups.
+    Only the groups containing all the codes of an instance (found with a CompiledIndex of the same data) are checked,
+    in blocks of at most MAX_INDEX_PAIRS (instance, group) pairs.
+
+    Parameters
+    ----------
+    data : SequentialPrivacyFrame
+        the data, already preprocessed by the attack with compiled=True.
+
+    group_keys : list
+        the attributes identifying the groups, for example [user id] or [user id, sequence id].
+    """
+
+    def __init__(self, data, group_keys):
+        self._data = data
+        group_codes = data.groupby(group_keys, sort=True).ngroup().values
+        self._n_groups = int(group_codes.max()) + 1 if len(group_codes) > 0 else 0
+        # rows of each group, in the order of the data
+        rows = np.argsort(group_codes, kind="stable")
+        self._group_offsets = np.concatenate(
+            ([0], np.cumsum(np.bincount(group_codes, minlength=self._n_groups)))
+        )
+        self._group_first_rows = rows[self._group_offsets[:-1]]
+        self._code_position = data.columns.get_loc(constants.CODE)
+        self._codes = data[constants.CODE].values[rows].astype(np.int64)
+        n = len(self._codes)
+        self._next_occurrences = np.sort(self._codes * n + np.arange(n))
+        # the groups containing the codes of an instance, the candidates to be checked
+        self._candidates = CompiledIndex(data, group_keys)
+
+    @property
+    def n_groups(self):
+        return self._n_groups
+
+    def group_values(self, key):
+        """group_values
+
+        Parameters
+        ----------
+        key : str
+            one of the group keys.
+
+        Returns
+        -------
+        numpy array
+            the value of the key for each group.
+        """
+        return self._data[key].values[self._group_first_rows]
+
+    def matching_pairs(self, cases):
+        """matching_pairs
+
+        Matches a batch of background knowledge instances against the groups containing their codes.
+
+        Parameters
+        ----------
+        cases : list
+            the background knowledge instances, each one with its rows with the attributes of the data.
+
+        Returns
+        -------
+        tuple
+            the positions of the cases and of the groups of each pair (case, group) that matches, sorted by case and
+            group.
+        """
+        cases_codes = [[row[self._code_position] for row in case] for case in cases]
+        lengths = np.array([len(case_codes) for case_codes in cases_codes])
+        candidates = self._candidates.batch_matching_groups(cases)
+        matching_cases = []
+        matching_groups = []
+        for length in np.unique(lengths):
+            batch = np.flatnonzero(lengths == length)
+            batch_codes = np.array([cases_codes[i] for i in batch], dtype=np.int64)
+            batch_codes = batch_codes.reshape(len(batch), length)
+            # a pair (case, group) for each check
+            pair_cases = np.repeat(
+                np.arange(len(batch)), [len(candidates[i]) for i in batch]
+            )
+            pair_groups = np.concatenate(
+                [candidates[i] for i in batch] + [np.empty(0, dtype=np.int64)]
+            ).astype(np.int64)
+            for start in range(0, len(pair_cases), constants.MAX_INDEX_PAIRS):
+                stop = start + constants.MAX_INDEX_PAIRS
+                matches = self.check_pairs(
+                    batch_codes, pair_cases[start:stop], pair_groups[start:stop]
+                )
+                matching_cases.append(batch[pair_cases[start:stop][matches]])
+                matching_groups.append(pair_groups[start:stop][matches])
+        pair_cases = np.concatenate(matching_cases + [np.empty(0, dtype=np.int64)])
+        pair_groups = np.concatenate(matching_groups + [np.empty(0, dtype=np.int64)])
+        order = np.lexsort((pair_groups, pair_cases))
+
+        return pair_cases[order], pair_groups[order]
+
+    def check_pairs(self, batch_codes, pair_cases, pair_groups):
+        """check_pairs
+
+        Parameters
+        ----------
+        batch_codes : numpy array
+            the codes of a batch of background knowledge instances of the same length, one row for each instance.
+
+        pair_cases : numpy array
+            the position in the batch of the instance of each pair to be checked.
+
+        pair_groups : numpy array
+            the position of the group of each pair to be checked.
+
+        Returns
+        -------
+        numpy array
+            True for the pairs whose group contains the codes of the instance as a subsequence.
+        """
+        n = len(self._codes)
+        pairs = np.arange(len(pair_cases))
+        positions = self._group_offsets[pair_groups]
+        # the pairs are dropped as soon as they fail
+        for step in range(batch_codes.shape[1]):
+            codes = batch_codes[pair_cases[pairs], step]
+            found = np.searchsorted(self._next_occurrences, codes * n + positions)
+            valid = found < n
+            occurrences = self._next_occurrences[np.where(valid, found, 0)]
+            positions = occurrences % n
+            # the next occurrence of the code must be in the group
+            valid &= occurrences // n == codes
+            valid &= positions < self._group_offsets[pair_groups[pairs] + 1]
+            pairs = pairs[valid]
+            positions = positions[valid] + 1
+        matches = np.zeros(len(pair_cases), dtype=bool)
+        matches[pairs] = True
+
+        return matches
+
+    def matching_matrix(self, cases):
+        """matching_matrix
+
+        Matches a batch of background knowledge instances against all the groups.
+
+        Parameters
+        ----------
+        cases : list
+            the background knowledge instances, each one with its rows with the attributes of the data.
+
+        Returns
+        -------
+        numpy array
+            a boolean matrix with a row for each case and a column for each group, True if the group matches the case.
+        """
+        matches = np.zeros((len(cases), self._n_groups), dtype=bool)
+        pair_cases, pair_groups = self.matching_pairs(cases)
+        matches[pair_cases, pair_groups] = True
+
+        return matches
+
+    def batch_matching_groups(self, cases):
+        """batch_matching_groups
+
+        Parameters
+        ----------
+        cases : list
+            the background knowledge instances.
+
+        Returns
+        -------
+        list
+            the sorted positions of the groups that match each case.
+        """
+        pair_cases, pair_groups = self.matching_pairs(cases)
+        bounds = np.searchsorted(pair_cases, np.arange(len(cases) + 1))
+        return [pair_groups[bounds[i] : bounds[i + 1]] for i in range(len(cases))]
+
+    def matching_groups(self, case):
+        """matching_groups
+
+        Finds the groups matching a background knowledge instance.
+
+        Parameters
+        ----------
+        case : list or numpy array
+            the background knowledge instance.
+
+        Returns
+        -------
+        numpy array
+            the sorted positions of the groups that match the case.
+        """
+        return self.batch_matching_groups([case])[0]
+
+    def count(self, case):
+        """count
+
+        Parameters
+        ----------
+        case : list or numpy array
+            the background knowledge instance.
+
+        Returns
+        -------
+        int
+            the number of groups that match the case.
+        """
+        return len(self.matching_groups(case))
@@ -16,6 +16,8 @@ FREQUENCY = "freq"
 PROPORTION = "prop"
 MAX_FREQUENCY = "max_freq"
 TOTAL_FREQUENCY = "tot_freq"
+CODE = "code"
+COMPILED = "compiled"
 PRECISION_LEVELS = [
     "Year",
     "Month",
@@ -49,3 +51,8 @@ HOUR = "hour"
 DAY = "day"
 MONTH = "month"
 YEAR = "year"
+
+# Batches of background knowledge instances matched at once through an index
+CASE_BATCH_SIZE = 64
+# the most (instance, group) pairs a SequenceIndex checks at once
+MAX_INDEX_PAIRS = 1 << 22
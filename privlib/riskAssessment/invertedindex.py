@@ -0,0 +1,202 @@
+from collections import Counter
+import numpy as np
+
+from .utils import encode
+
+__all__ = ["InvertedIndex"]
+
+
+class InvertedIndex:
+    """InvertedIndex
+
+    Inverted index of the preprocessed data of a RiskEvaluator, used to find the groups of data (the individuals, or the
+    sequences of the individuals) that match a background knowledge instance without scanning the whole data.
+    For each element (the values of the index_keys of the attack) the index stores its posting list, i.e., the groups
+    containing the element and how many times they contain it.
+    A case is answered by intersecting the posting lists of its elements, keeping only the groups that contain each
+    element at least as many times as the case. If the attack is not fully decided by these counts (i.e., its
+    exact_index is False), the remaining candidates are checked with the matching function of the attack.
+
+    Parameters
+    ----------
+    data : SequentialPrivacyFrame
+        the data, already preprocessed by the attack.
+
+    group_keys : list
+        the attributes identifying the groups, for example [user id] or [user id, sequence id].
+
+    attack : BackgroundKnowledgeAttack
+        the attack whose matching is answered by the index.
+    """
+
+    def __init__(self, data, group_keys, attack):
+        self._data = data
+        self._attack = attack
+        group_codes = data.groupby(group_keys, sort=True).ngroup().values
+        self._n_groups = int(group_codes.max()) + 1 if len(group_codes) > 0 else 0
+        # rows of each group, in the order of the data
+        self._group_rows = np.argsort(group_codes, kind="stable")
+        self._group_offsets = np.concatenate(
+            ([0], np.cumsum(np.bincount(group_codes, minlength=self._n_groups)))
+        )
+        self._group_first_rows = self._group_rows[self._group_offsets[:-1]]
+
+        keys = attack.index_keys
+        self._key_positions = [data.columns.get_loc(key) for key in keys]
+        codes = encode(data, keys)
+        n_codes = int(codes.max()) + 1 if len(codes) > 0 else 0
+        _, first_rows = np.unique(codes, return_index=True)
+        values = [data[key].values[first_rows] for key in keys]
+        if len(keys) == 1:
+            self._codes = {value: code for code, value in enumerate(values[0])}
+        else:
+            self._codes = {value: code for code, value in enumerate(zip(*values))}
+
+        # posting lists, sorted by element and group
+        pairs, counts = np.unique(
+            codes * self._n_groups + group_codes, return_counts=True
+        )
+        self._posting_groups = pairs % self._n_groups
+        self._posting_counts = counts
+        self._posting_offsets = np.concatenate(
+            (
+                [0],
+                np.cumsum(np.bincount(pairs // self._n_groups, minlength=n_codes)),
+            )
+        )
+
+    @property
+    def n_groups(self):
+        return self._n_groups
+
+    def group(self, group):
+        """group
+
+        Parameters
+        ----------
+        group : int
+            the position of the group.
+
+        Returns
+        -------
+        SequentialPrivacyFrame
+            the data of the group.
+        """
+        rows = self._group_rows[
+            self._group_offsets[group] : self._group_offsets[group + 1]
+        ]
+        return self._data.iloc[rows]
+
+    def group_values(self, key):
+        """group_values
+
+        Parameters
+        ----------
+        key : str
+            one of the group keys.
+
+        Returns
+        -------
+        numpy array
+            the value of the key for each group.
+        """
+        return self._data[key].values[self._group_first_rows]
+
+    def case_codes(self, case):
+        """case_codes
+
+        Parameters
+        ----------
+        case : list or numpy array
+            the background knowledge instance, its rows with the attributes of the data.
+
+        Returns
+        -------
+        Counter
+            the number of times each element code appears in the case, or None if some element is not in the data.
+        """
+        case_codes = Counter()
+        for row in case:
+            if len(self._key_positions) == 1:
+                value = row[self._key_positions[0]]
+            else:
+                value = tuple(row[position] for position in self._key_positions)
+            code = self._codes.get(value)
+            if code is None:
+                return None
+            case_codes[code] += 1
+
+        return case_codes
+
+    def matching_groups(self, case):
+        """matching_groups
+
+        Finds the groups matching a background knowledge instance.
+
+        Parameters
+        ----------
+        case : list or numpy array
+            the background knowledge instance.
+
+        Returns
+        -------
+        numpy array
+            the sorted positions of the groups that match the case.
+        """
+        case_codes = self.case_codes(case)
+        if case_codes is None:
+            return np.empty(0, dtype=np.int64)
+        # the shortest posting lists first, so the candidates shrink as soon as possible
+        postings = sorted(
+            case_codes.items(),
+            key=lambda x: self._posting_offsets[x[0] + 1] - self._posting_offsets[x[0]],
+        )
+        candidates = None
+        for code, count in postings:
+            start, end = self._posting_offsets[code], self._posting_offsets[code + 1]
+            groups = self._posting_groups[start:end][
+                self._posting_counts[start:end] >= count
+            ]
+            if candidates is None:
+                candidates = groups
+            else:
+                candidates = np.intersect1d(candidates, groups, assume_unique=True)
+            if len(candidates) == 0:
+                break
+        if candidates is None:
+            candidates = np.arange(self._n_groups)
+        if not self._attack.exact_index and len(candidates) > 0:
+            matches = [self._attack.matching(self.group(g), case) for g in candidates]
+            candidates = candidates[np.array(matches, dtype=bool)]
+
+        return candidates
+
+    def batch_matching_groups(self, cases):
+        """batch_matching_groups
+
+        Parameters
+        ----------
+        cases : list
+            the background knowledge instances.
+
+        Returns
+        -------
+        list
+            the sorted positions of the groups that match each case.
+        """
+        return [self.matching_groups(case) for case in cases]
+
+    def count(self, case):
+        """count
+
+        Parameters
+        ----------
+        case : list or numpy array
+            the background knowledge instance.
+
+        Returns
+        -------
+        int
+            the number of groups that match the case.
+        """
+        return len(self.matching_groups(case))
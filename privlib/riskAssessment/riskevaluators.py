@@ -1,14 +1,20 @@
 from abc import ABC, abstractmethod
-from itertools import combinations, chain
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import combinations, chain, islice
 from sys import maxsize
+import multiprocessing
 from tqdm.auto import tqdm
 from pandas.errors import AbstractMethodError
-from numpy import tile
+from numpy import tile, unique, array_split, isin
 import pandas as pd
 
 
 from . import constants
 from .attacks import BackgroundKnowledgeAttack, TabularAttack
+from .invertedindex import InvertedIndex
+from .compiledindex import CompiledIndex, SequenceIndex
+from .casecache import CaseCache
 from .sequentialprivacyframe import SequentialPrivacyFrame
 
 __all__ = ["IndividualElementEvaluator", "IndividualSequenceEvaluator"]
@@ -139,7 +145,9 @@ class TabularRiskEvaluator:
         else:
             return privacy_risk
 
-    def assess_risk(self, targets=None, verbose=False, complete=False, tolerance=0):
+    def assess_risk(
+        self, targets=None, verbose=False, complete=False, tolerance=0, n_jobs=1
+    ):
         """assess_risk
 
         Assesses privacy risk for the data fed to this evaluator, using the attack specified at evaluator construction.
@@ -150,6 +158,9 @@ class TabularRiskEvaluator:
             the indexes target of the attack.  They must be compatible with the data. If None is used,
             risk is computed on all users in the data. The default is `None`.
 
+        n_jobs : int, optional
+            the number of worker processes among which the targets are shared. The default is `1`.
+
         Returns
         -------
         risks : Dataframe
@@ -165,7 +176,17 @@ class TabularRiskEvaluator:
             raise AttributeError(
                 "Targets must be either a list of indexes or a dataframe. Leave empty for total dataset assessment"
             )
-        if verbose:
+        # with no targets, parallel_apply gives the empty result without starting workers
+        if n_jobs != 1 or len(targets) == 0:
+            risks = parallel_apply(
+                targets,
+                targets.index.values,
+                lambda x: x.groupby(x.index),
+                lambda x: self.risk(x, complete, tolerance),
+                n_jobs,
+                verbose,
+            ).reset_index(name=constants.PRIVACY_RISK)
+        elif verbose:
             tqdm.pandas(desc="Risk progress")
             risks = (
                 targets.groupby(targets.index)
@@ -180,11 +201,13 @@ class TabularRiskEvaluator:
             )
         if complete:
             risks[["risk", "cases"]] = pd.DataFrame(
-                risks["risk"].to_list(), index=risks.index
+                risks["risk"].to_list(), index=risks.index, columns=["risk", "cases"]
             )
             risks = risks.explode("cases")
             risks[["cases", "case_risk"]] = pd.DataFrame(
-                risks["cases"].to_list(), index=risks.index
+                risks["cases"].to_list(),
+                index=risks.index,
+                columns=["cases", "case_risk"],
             )
         return risks
 
@@ -297,7 +320,7 @@ class SequencesRiskEvaluator(ABC):
         """
         raise AbstractMethodError(self)
 
-    def assess_risk(self, targets=None, verbose=False, complete=False):
+    def assess_risk(self, targets=None, verbose=False, complete=False, n_jobs=1):
         """assess_risk
 
         Assesses privacy risk for the data fed to this evaluator, using the attack specified at evaluator construction.
@@ -308,6 +331,11 @@ class SequencesRiskEvaluator(ABC):
             the users_id target of the attack.  They must be compatible with the sequence data. If None is used,
             risk is computed on all users in the data. The default is `None`.
 
+        n_jobs : int, optional
+            the number of worker processes among which the target users are shared. The counts a worker process adds
+            to the case cache are discarded with it, so the cache only persists across calls with `1` (or where the
+            workers are threads, see parallel_apply). The default is `1`.
+
         Returns
         -------
         risks : Dataframe
@@ -327,7 +355,17 @@ class SequencesRiskEvaluator(ABC):
             raise AttributeError(
                 "Targets must be either a list of user_ids or a dataframe. Leave empty for total dataset assessment"
             )
-        if verbose:
+        # with no targets, parallel_apply gives the empty result without starting workers
+        if n_jobs != 1 or len(targets) == 0:
+            risks = parallel_apply(
+                targets,
+                targets[constants.USER_ID].values,
+                lambda x: x.groupby(constants.USER_ID),
+                lambda x: self.risk(x, complete),
+                n_jobs,
+                verbose,
+            ).reset_index(name=constants.PRIVACY_RISK)
+        elif verbose:
             tqdm.pandas(desc="Risk progress")
             risks = (
                 targets.groupby(constants.USER_ID)
@@ -342,11 +380,13 @@ class SequencesRiskEvaluator(ABC):
             )
         if complete:
             risks[["risk", "cases"]] = pd.DataFrame(
-                risks["risk"].to_list(), index=risks.index
+                risks["risk"].to_list(), index=risks.index, columns=["risk", "cases"]
             )
             risks = risks.explode("cases")
             risks[["cases", "case_risk"]] = pd.DataFrame(
-                risks["cases"].to_list(), index=risks.index
+                risks["cases"].to_list(),
+                index=risks.index,
+                columns=["cases", "case_risk"],
             )
         return risks
 
@@ -369,6 +409,23 @@ class IndividualElementEvaluator(SequencesRiskEvaluator):
         the length of the knowledge of the simultated attack, i.e., how many data points are assumed to be in the
         background knowledge of the adversary
 
+    indexed : bool, optional
+        if True, an InvertedIndex of the data is built after the preprocessing of the attack, and the data matching
+        each background knowledge instance is found through it instead of matching the instance against all the
+        data. The default is `False`.
+
+    compiled : bool, optional
+        if True, the attack encodes the elements as integer codes at preprocessing (if it supports it, as ElementsAttack,
+        TimeAttack and SequenceAttack do), and the data matching each background knowledge instance is found through a
+        CompiledIndex of the codes (a SequenceIndex for SequenceAttack). The CompiledIndex intersects the posting lists
+        of the codes as the InvertedIndex does, so with compiled the InvertedIndex of indexed is not built.
+        The default is `False`.
+
+    case_cache_size : int, optional
+        if greater than 0, the number of data matching each background knowledge instance is kept in a CaseCache of
+        this size, shared by all the individuals and the calls to assess_risk (within each worker process, with n_jobs > 1).
+        Only the attacks fully decided by their elements are cached (see CaseCache.supports). The default is `0`.
+
     **kwargs : mapping, optional
         a dictionary of keyword arguments passed into the preprocessing of attack.
 
@@ -378,8 +435,52 @@ class IndividualElementEvaluator(SequencesRiskEvaluator):
     .. [MOB2018] Roberto Pellungrini, Luca Pappalardo, Francesca Pratesi, Anna Monreale: Analyzing Privacy Risk in Human Mobility Data. STAF Workshops 2018: 114-129
     """
 
-    def __init__(self, data, attack, knowledge_length, **kwargs):
-        super().__init__(data, attack, knowledge_length, **kwargs)
+    def __init__(
+        self,
+        data,
+        attack,
+        knowledge_length,
+        indexed=False,
+        compiled=False,
+        case_cache_size=0,
+        **kwargs,
+    ):
+        super().__init__(data, attack, knowledge_length, compiled=compiled, **kwargs)
+        self._case_cache = None
+        if case_cache_size > 0 and CaseCache.supports(self.attack):
+            self._case_cache = CaseCache(self.data, self.attack, case_cache_size)
+        self._index_class = None
+        if compiled and constants.CODE in self.data:
+            if self.attack.ordered_index:
+                self._index_class = SequenceIndex
+            else:
+                self._index_class = CompiledIndex
+        elif indexed:
+            self._index_class = InvertedIndex
+        self._index = self.build_index(self.data)
+
+    def build_index(self, data):
+        """build_index
+
+        Parameters
+        ----------
+        data : SequentialPrivacyFrame
+            the preprocessed data, or part of it (for example the data of an individual).
+
+        Returns
+        -------
+        InvertedIndex, CompiledIndex or SequenceIndex
+            the index of the data used by the evaluator, or None if the evaluator has no index.
+        """
+        if self._index_class is None:
+            return None
+        if self._index_class is InvertedIndex:
+            return InvertedIndex(data, self.aggregation_levels()[:-1], self.attack)
+        return self._index_class(data, self.aggregation_levels()[:-1])
+
+    @property
+    def case_cache(self):
+        return self._case_cache
 
     def background_knowledge_gen(self, single_priv_df):
         """background_knowledge_gen
@@ -423,24 +524,102 @@ class IndividualElementEvaluator(SequencesRiskEvaluator):
         cases = self.background_knowledge_gen(single_privacy_frame)
         privacy_risk = 0
         complete_risk = []
-        for case in cases:
-            case_risk = (
-                1.0
-                / self.data.groupby(constants.USER_ID)
-                .apply(lambda x: self.attack.matching(x, case))
-                .sum()
-            )
-            if case_risk > privacy_risk:
-                privacy_risk = case_risk
+        for batch in self.case_batches(cases):
+            for case, count in zip(batch, self.matching_counts(batch)):
+                case_risk = 1.0 / count
+                if case_risk > privacy_risk:
+                    privacy_risk = case_risk
+                if privacy_risk == 1 and not complete:
+                    break
+                if complete:
+                    complete_risk.append((case, case_risk))
             if privacy_risk == 1 and not complete:
                 break
-            if complete:
-                complete_risk.append((case, case_risk))
         if complete:
             return [privacy_risk, complete_risk]
         else:
             return privacy_risk
 
+    @staticmethod
+    def case_batches(cases):
+        """case_batches
+
+        Splits the background knowledge instances in batches of at most CASE_BATCH_SIZE instances, matched at once
+        through the index of the evaluator.
+
+        Parameters
+        ----------
+        cases : iterator
+            the background knowledge instances.
+
+        Returns
+        -------
+        iterator
+            an iterator over the lists of instances of each batch.
+        """
+        while True:
+            batch = list(islice(cases, constants.CASE_BATCH_SIZE))
+            if len(batch) == 0:
+                return
+            yield batch
+
+    def matching_count(self, case):
+        """matching_count
+
+        Counts the groups of data (the individuals, or the sequences of the individuals for IndividualSequenceEvaluator)
+        that match a background knowledge instance, through the case cache and the index if the evaluator has them.
+
+        Parameters
+        ----------
+        case : list or numpy array
+            the background knowledge instance.
+
+        Returns
+        -------
+        int
+            the number of groups that match the case.
+        """
+        return self.matching_counts([case])[0]
+
+    def matching_counts(self, cases):
+        """matching_counts
+
+        Counts the groups of data that match each one of a batch of background knowledge instances (see
+        matching_count). The instances not in the case cache are matched at once through the index.
+
+        Parameters
+        ----------
+        cases : list
+            the background knowledge instances.
+
+        Returns
+        -------
+        list
+            the number of groups that match each case.
+        """
+        counts = [None] * len(cases)
+        keys = [None] * len(cases)
+        if self._case_cache is not None:
+            for i, case in enumerate(cases):
+                keys[i] = self._case_cache.key(case)
+                counts[i] = self._case_cache.get(keys[i])
+        misses = [i for i in range(len(cases)) if counts[i] is None]
+        if self._index is not None and len(misses) > 0:
+            groups = self._index.batch_matching_groups([cases[i] for i in misses])
+            for i, case_groups in zip(misses, groups):
+                counts[i] = len(case_groups)
+        else:
+            for i in misses:
+                counts[i] = (
+                    self.data.groupby(self.aggregation_levels()[:-1])
+                    .apply(lambda x: self.attack.matching(x, cases[i]))
+                    .sum()
+                )
+        for i in misses:
+            if keys[i] is not None:
+                self._case_cache.set(keys[i], counts[i])
+        return counts
+
     def aggregation_levels(self):
         """aggregation_levels
 
@@ -476,6 +655,23 @@ class IndividualSequenceEvaluator(IndividualElementEvaluator):
         the length of the knowledge of the simultated attack, i.e., how many data points are assumed to be in the
         background knowledge of the adversary
 
+    indexed : bool, optional
+        if True, an InvertedIndex of the data is built after the preprocessing of the attack, and the data matching
+        each background knowledge instance is found through it instead of matching the instance against all the
+        data. The default is `False`.
+
+    compiled : bool, optional
+        if True, the attack encodes the elements as integer codes at preprocessing (if it supports it, as ElementsAttack,
+        TimeAttack and SequenceAttack do), and the data matching each background knowledge instance is found through a
+        CompiledIndex of the codes (a SequenceIndex for SequenceAttack). The CompiledIndex intersects the posting lists
+        of the codes as the InvertedIndex does, so with compiled the InvertedIndex of indexed is not built.
+        The default is `False`.
+
+    case_cache_size : int, optional
+        if greater than 0, the number of data matching each background knowledge instance is kept in a CaseCache of
+        this size, shared by all the individuals and the calls to assess_risk (within each worker process, with n_jobs > 1).
+        Only the attacks fully decided by their elements are cached (see CaseCache.supports). The default is `0`.
+
     **kwargs : mapping, optional
         a dictionary of keyword arguments passed into the preprocessing of attack.
 
@@ -485,8 +681,19 @@ class IndividualSequenceEvaluator(IndividualElementEvaluator):
     .. [MOB2018] Roberto Pellungrini, Luca Pappalardo, Francesca Pratesi, Anna Monreale: Analyzing Privacy Risk in Human Mobility Data. STAF Workshops 2018: 114-129
     """
 
-    def __init__(self, data, attack, knowledge_length, **kwargs):
-        super().__init__(data, attack, knowledge_length, **kwargs)
+    def __init__(
+        self,
+        data,
+        attack,
+        knowledge_length,
+        indexed=False,
+        compiled=False,
+        case_cache_size=0,
+        **kwargs,
+    ):
+        super().__init__(
+            data, attack, knowledge_length, indexed, compiled, case_cache_size, **kwargs
+        )
 
     def background_knowledge_gen(self, single_priv_df):
         """background_knowledge_gen
@@ -532,23 +739,64 @@ class IndividualSequenceEvaluator(IndividualElementEvaluator):
         cases = self.background_knowledge_gen(single_privacy_frame)
         privacy_risk = 0
         complete_risk = []
-        for case in cases:
-            num = (
-                single_privacy_frame.groupby([constants.SEQUENCE_ID])
-                .apply(lambda x: self.attack.matching(x, case))
-                .sum()
-            )
-            den = (
-                self.data.groupby([constants.USER_ID, constants.SEQUENCE_ID])
-                .apply(lambda x: self.attack.matching(x, case))
-                .sum()
-            )
-            case_risk = num / den
-
-            if case_risk > privacy_risk:
-                privacy_risk = case_risk
-            if complete:
-                complete_risk.append((case, case_risk))
+        if self._index is not None:
+            group_users = self._index.group_values(constants.USER_ID)
+            user = single_privacy_frame[constants.USER_ID].iloc[0]
+            # index of the sequences of the individual, built at the first cache hit
+            single_index = None
+        for batch in self.case_batches(cases):
+            keys = [None] * len(batch)
+            dens = [None] * len(batch)
+            if self._case_cache is not None:
+                for i, case in enumerate(batch):
+                    keys[i] = self._case_cache.key(case)
+                    dens[i] = self._case_cache.get(keys[i])
+            if self._index is not None:
+                nums = [None] * len(batch)
+                misses = [i for i in range(len(batch)) if dens[i] is None]
+                groups = self._index.batch_matching_groups([batch[i] for i in misses])
+                for i, case_groups in zip(misses, groups):
+                    nums[i] = (group_users[case_groups] == user).sum()
+                    dens[i] = len(case_groups)
+                # on a cache hit only the sequences of the individual are matched
+                hits = [i for i in range(len(batch)) if nums[i] is None]
+                if len(hits) > 0:
+                    if single_index is None:
+                        single_index = self.build_index(single_privacy_frame)
+                    groups = single_index.batch_matching_groups(
+                        [batch[i] for i in hits]
+                    )
+                    for i, case_groups in zip(hits, groups):
+                        nums[i] = len(case_groups)
+            for i, case in enumerate(batch):
+                key = keys[i]
+                den = dens[i]
+                if self._index is not None:
+                    num = nums[i]
+                else:
+                    num = (
+                        single_privacy_frame.groupby([constants.SEQUENCE_ID])
+                        .apply(lambda x: self.attack.matching(x, case))
+                        .sum()
+                    )
+                    if den is None:
+                        den = (
+                            self.data.groupby(
+                                [constants.USER_ID, constants.SEQUENCE_ID]
+                            )
+                            .apply(lambda x: self.attack.matching(x, case))
+                            .sum()
+                        )
+                if key is not None:
+                    self._case_cache.set(key, den)
+                case_risk = num / den
+
+                if case_risk > privacy_risk:
+                    privacy_risk = case_risk
+                if complete:
+                    complete_risk.append((case, case_risk))
+                if privacy_risk == 1 and not complete:
+                    break
             if privacy_risk == 1 and not complete:
                 break
         if complete:
@@ -570,3 +818,82 @@ class IndividualSequenceEvaluator(IndividualElementEvaluator):
             are user id, sequence id and the elements of the sequence.
         """
         return [constants.USER_ID, constants.SEQUENCE_ID, constants.ELEMENTS]
+
+
+# the arguments of parallel_apply, set in each worker process by its initializer
+_parallel_state = None
+
+
+def parallel_apply(targets, labels, group, func, n_jobs, verbose=False):
+    """parallel_apply
+
+    Applies func to the groups of targets as group(targets).apply(func) does, sharing the groups among n_jobs workers.
+    The workers are forked processes, so they inherit the targets and the evaluator (its preprocessed data and indexes)
+    without copying them, or threads where fork is not available (the threads share the evaluator, its CaseCache is
+    thread safe). The groups are sent to the workers in shards, whose results are streamed back in order.
+
+    Parameters
+    ----------
+    targets : DataFrame
+        the data to be grouped.
+
+    labels : numpy array
+        the group label of each row of targets.
+
+    group : callable
+        the function grouping a part of targets, for example lambda x: x.groupby(constants.USER_ID).
+
+    func : callable
+        the function applied to each group.
+
+    n_jobs : int
+        the number of workers.
+
+    verbose : bool, optional
+        if True, the progress is shown. The default is `False`.
+
+    Returns
+    -------
+    Series
+        the result of func for each group, indexed by the group labels.
+    """
+    shards = [
+        shard for shard in array_split(unique(labels), 4 * n_jobs) if len(shard) > 0
+    ]
+    if len(shards) == 0:
+        # no groups, an empty result indexed as the groups
+        return group(targets).size().astype(object)
+    state = (targets, labels, group, func)
+    if "fork" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("fork")
+        with context.Pool(n_jobs, initializer=_init_shards, initargs=state) as pool:
+            results = _collect(pool.imap(_apply_shard, shards), shards, verbose)
+    else:
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            results = _collect(
+                executor.map(partial(_apply_shard, state=state), shards),
+                shards,
+                verbose,
+            )
+    return pd.concat(results)
+
+
+def _collect(results, shards, verbose):
+    if not verbose:
+        return list(results)
+    collected = []
+    with tqdm(total=sum(len(shard) for shard in shards), desc="Risk progress") as bar:
+        for shard, result in zip(shards, results):
+            collected.append(result)
+            bar.update(len(shard))
+    return collected
+
+
+def _init_shards(targets, labels, group, func):
+    global _parallel_state
+    _parallel_state = (targets, labels, group, func)
+
+
+def _apply_shard(shard, state=None):
+    targets, labels, group, func = _parallel_state if state is None else state
+    return group(targets[isin(labels, shard)]).apply(func)
@@ -3,11 +3,15 @@ from privlib.riskAssessment.sequentialprivacyframe import SequentialPrivacyFrame
 from privlib.riskAssessment.riskevaluators import (
     IndividualSequenceEvaluator,
     IndividualElementEvaluator,
+    TabularRiskEvaluator,
 )
+from privlib.riskAssessment.compiledindex import SequenceIndex
+from privlib.riskAssessment.casecache import CaseCache
 import privlib.riskAssessment.attacks as att
 import numpy as np
 import pandas as pd
 import unittest
+from unittest import mock
 
 
 class TestSPF(unittest.TestCase):
@@ -260,5 +264,178 @@ class TestSPF(unittest.TestCase):
         self.assertEqual(a["risk"].to_list(), ra)
         self.assertEqual(b["risk"].to_list(), rb)
 
+    def second_spf(self):
+        # the preprocessing of the attacks modifies the data, each evaluator gets its own copy
+        return SPF(
+            self.second_df.copy(),
+            user_id="uid",
+            datetime="datetime",
+            elements=["lat", "lng"],
+            sequence_id="seq",
+        )
+
+    def test_indexed_risk(self):
+        for attack in [att.ElementsAttack, att.SequenceAttack, att.TimeAttack]:
+            for evaluator in [IndividualElementEvaluator, IndividualSequenceEvaluator]:
+                a = evaluator(self.second_spf(), attack, 2).assess_risk(complete=True)
+                b = evaluator(self.second_spf(), attack, 2, indexed=True).assess_risk(
+                    complete=True
+                )
+                self.assertEqual(b["risk"].to_list(), a["risk"].to_list())
+                self.assertEqual(b["case_risk"].to_list(), a["case_risk"].to_list())
+
+    def test_compiled_matching(self):
+        for attack in [att.ElementsAttack, att.TimeAttack]:
+            data = attack.preprocess(
+                SPF(
+                    self.first_df,
+                    user_id="uid",
+                    datetime="datetime",
+                    elements=["lat", "lon"],
+                )
+            )
+            compiled_data = attack.preprocess(
+                SPF(
+                    self.first_df,
+                    user_id="uid",
+                    datetime="datetime",
+                    elements=["lat", "lon"],
+                ),
+                compiled=True,
+            )
+            users = [x for _, x in data.groupby(constants.USER_ID)]
+            compiled_users = [x for _, x in compiled_data.groupby(constants.USER_ID)]
+            for compiled_case in (
+                compiled_users[0].values[[0, 1, 1, 3]].reshape(2, 2, -1)
+            ):
+                case = [row[:-1] for row in compiled_case]
+                self.assertEqual(
+                    [attack.matching(x, compiled_case) for x in compiled_users],
+                    [attack.matching(x, case) for x in users],
+                )
+            for evaluator in [IndividualElementEvaluator, IndividualSequenceEvaluator]:
+                a = evaluator(self.second_spf(), attack, 2).assess_risk(complete=True)
+                b = evaluator(self.second_spf(), attack, 2, compiled=True).assess_risk(
+                    complete=True
+                )
+                self.assertEqual(b["risk"].to_list(), a["risk"].to_list())
+                self.assertEqual(b["case_risk"].to_list(), a["case_risk"].to_list())
+
+    def test_sequence_index(self):
+        data = att.SequenceAttack.preprocess(self.second_spf())
+        compiled_data = att.SequenceAttack.preprocess(self.second_spf(), compiled=True)
+        index = SequenceIndex(compiled_data, [constants.USER_ID])
+        users = [x for _, x in data.groupby(constants.USER_ID)]
+        rows = compiled_data.values
+        # cases of different lengths, in and out of order
+        compiled_cases = [rows[[0, 5]], rows[[5, 0]], rows[[9, 11, 12]], rows[[13]]]
+        matches = index.matching_matrix(compiled_cases)
+        for compiled_case, case_matches in zip(compiled_cases, matches):
+            case = [row[:-1] for row in compiled_case]
+            self.assertEqual(
+                list(case_matches),
+                [att.SequenceAttack.matching(x, case) == 1 for x in users],
+            )
+        # the pairs checked in blocks give the same matches
+        with mock.patch.object(constants, "MAX_INDEX_PAIRS", 2):
+            groups = index.batch_matching_groups(compiled_cases)
+        for case_groups, case_matches in zip(groups, matches):
+            self.assertEqual(
+                case_groups.tolist(), np.flatnonzero(case_matches).tolist()
+            )
+        for evaluator in [IndividualElementEvaluator, IndividualSequenceEvaluator]:
+            a = evaluator(self.second_spf(), att.SequenceAttack, 3).assess_risk(
+                complete=True
+            )
+            b = evaluator(
+                self.second_spf(), att.SequenceAttack, 3, compiled=True
+            ).assess_risk(complete=True)
+            self.assertEqual(b["risk"].to_list(), a["risk"].to_list())
+            self.assertEqual(b["case_risk"].to_list(), a["case_risk"].to_list())
+            # the early exit holds across batches of cases
+            with mock.patch.object(constants, "CASE_BATCH_SIZE", 2):
+                b = evaluator(
+                    self.second_spf(), att.SequenceAttack, 3, compiled=True
+                ).assess_risk()
+            pd.testing.assert_frame_equal(
+                b, evaluator(self.second_spf(), att.SequenceAttack, 3).assess_risk()
+            )
+
+    def test_parallel_risk(self):
+        for attack in [att.ElementsAttack, att.SequenceAttack]:
+            iee = IndividualElementEvaluator(self.second_spf(), attack, 2)
+            for complete in [False, True]:
+                pd.testing.assert_frame_equal(
+                    iee.assess_risk(complete=complete, n_jobs=2),
+                    iee.assess_risk(complete=complete),
+                )
+            pd.testing.assert_frame_equal(
+                iee.assess_risk(targets=[2, 4], n_jobs=3),
+                iee.assess_risk(targets=[2, 4]),
+            )
+
+    def test_parallel_tabular_risk(self):
+        df = pd.DataFrame(
+            {
+                "age": [30, 30, 41, 52, 41, 30],
+                "zip": ["a", "b", "a", "a", "c", "a"],
+                "sex": ["f", "m", "f", "f", "m", "m"],
+            }
+        )
+        tre = TabularRiskEvaluator(df, att.TabularAttack, 2)
+        for complete in [False, True]:
+            pd.testing.assert_frame_equal(
+                tre.assess_risk(complete=complete, n_jobs=2),
+                tre.assess_risk(complete=complete),
+            )
+            # no targets, no risks
+            for n_jobs in [1, 2]:
+                risks = tre.assess_risk(targets=[99], complete=complete, n_jobs=n_jobs)
+                self.assertEqual(len(risks), 0)
+                self.assertIn(constants.PRIVACY_RISK, risks.columns)
+        iee = IndividualElementEvaluator(self.second_spf(), att.ElementsAttack, 2)
+        for complete in [False, True]:
+            pd.testing.assert_frame_equal(
+                iee.assess_risk(targets=[99], complete=complete, n_jobs=2),
+                iee.assess_risk(targets=[99], complete=complete),
+            )
+
+    def test_thread_parallel_risk(self):
+        # without fork, the workers are threads sharing the evaluator and its case cache
+        iee = IndividualElementEvaluator(
+            self.second_spf(), att.ElementsAttack, 2, indexed=True, case_cache_size=2
+        )
+        risks = iee.assess_risk(complete=True)
+        with mock.patch(
+            "privlib.riskAssessment.riskevaluators.multiprocessing.get_all_start_methods",
+            return_value=["spawn"],
+        ):
+            pd.testing.assert_frame_equal(
+                iee.assess_risk(complete=True, n_jobs=3), risks
+            )
+        self.assertEqual(len(iee.case_cache), 2)
+
+    def test_case_cache(self):
+        for attack in [att.ElementsAttack, att.SequenceAttack, att.TimeAttack]:
+            data = attack.preprocess(self.second_spf())
+            rows = data.values
+            key = CaseCache(data, attack, 10).key
+            self.assertEqual(
+                key(rows[[0, 5]]) == key(rows[[5, 0]]), not attack.ordered_index
+            )
+            for evaluator in [IndividualElementEvaluator, IndividualSequenceEvaluator]:
+                a = evaluator(self.second_spf(), attack, 2).assess_risk(complete=True)
+                for index in ["indexed", "compiled"]:
+                    cached = evaluator(
+                        self.second_spf(), attack, 2, case_cache_size=5, **{index: True}
+                    )
+                    for _ in range(2):
+                        b = cached.assess_risk(complete=True)
+                        self.assertEqual(b["risk"].to_list(), a["risk"].to_list())
+                        self.assertEqual(
+                            b["case_risk"].to_list(), a["case_risk"].to_list()
+                        )
+                    self.assertEqual(len(cached.case_cache), 5)
+
     if __name__ == "__main__":
         unittest.main()
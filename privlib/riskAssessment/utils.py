@@ -1,3 +1,7 @@
+import numpy as np
+import pandas as pd
+
+
 def date_time_precision(dt, precision):
     result = ""
     if precision == "Year" or precision == "year":
@@ -22,3 +26,77 @@ def date_time_precision(dt, precision):
             + str(dt.second)
         )
     return result
+
+
+def encode(data, keys):
+    """encode
+
+    Encodes the values of the given attributes as integer codes, equal values (of all the attributes) have equal codes.
+
+    Parameters
+    ----------
+    data : DataFrame
+        the data.
+
+    keys : list
+        the attributes to be encoded together.
+
+    Returns
+    -------
+    numpy array
+        the code of each row, from 0 to the number of distinct values - 1.
+    """
+    codes = np.zeros(len(data), dtype=np.int64)
+    for key in keys:
+        key_codes, uniques = pd.factorize(data[key], sort=False)
+        codes = codes * len(uniques) + key_codes
+    codes, _ = pd.factorize(codes, sort=False)
+    return codes
+
+
+def code_counts(codes):
+    """code_counts
+
+    Parameters
+    ----------
+    codes : numpy array
+        the codes of the elements of a sequence (or of a background knowledge instance).
+
+    Returns
+    -------
+    tuple
+        the sorted distinct codes and the number of times each one appears, i.e., the multiset of the codes.
+    """
+    return np.unique(np.asarray(codes, dtype=np.int64), return_counts=True)
+
+
+def contains_counts(single_counts, case_counts):
+    """contains_counts
+
+    Checks the multiset containment of two code_counts: each code of the case must be in the single one, at least as
+    many times.
+
+    Parameters
+    ----------
+    single_counts : tuple
+        the code_counts of the data of an individual.
+
+    case_counts : tuple
+        the code_counts of the background knowledge instance.
+
+    Returns
+    -------
+    int
+        1 if the case is contained, 0 otherwise.
+    """
+    codes, counts = single_counts
+    case_codes, case_numbers = case_counts
+    if len(case_codes) == 0:
+        return 1
+    if len(case_codes) > len(codes):
+        return 0
+    positions = np.searchsorted(codes, case_codes)
+    positions[positions == len(codes)] = 0
+    if not np.array_equal(codes[positions], case_codes):
+        return 0
+    return int(np.all(counts[positions] >= case_numbers))